@@ -0,0 +1,86 @@
+"""
+Aggregate severity, status, risk level and risk score per account with a Python loop and with the Finding Aggregator.
+
+The encoded columns of the given number of synthetic findings, 5M by default, are generated directly with NumPy, since building that many models would dominate the run. The throughput of aggregating models is measured on a smaller stream.
+
+Usage: python -m benchmarks.aggregation [count] [model_count]
+"""
+
+import sys
+import time
+from collections import Counter, defaultdict
+
+import numpy as np
+
+from benchmarks.findings import synthetic_findings
+from py_ocsf_models.events.findings.severity_id import SeverityID
+from py_ocsf_models.events.findings.status_id import StatusID
+from py_ocsf_models.processing.aggregation import FindingAggregator, aggregate
+from py_ocsf_models.processing.finding_batch import MISSING
+
+ACCOUNTS = 1_000
+
+
+def python_aggregate(
+    accounts: list[str],
+    severity_ids: list[int],
+    status_ids: list[int],
+    risk_scores: list[int],
+) -> dict[str, Counter[str]]:
+    groups: dict[str, Counter[str]] = defaultdict(Counter)
+    for account, severity_id, status_id, risk_score in zip(
+        accounts, severity_ids, status_ids, risk_scores
+    ):
+        group = groups[account]
+        group["count"] += 1
+        group[f"severity_{severity_id}"] += 1
+        group[f"status_{status_id}"] += 1
+        if risk_score != MISSING:
+            group["risk_score_sum"] += risk_score
+    return groups
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    model_count = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+
+    generator = np.random.default_rng(0)
+    groups = [f"{account:012d}" for account in range(ACCOUNTS)]
+    group_codes = generator.integers(0, ACCOUNTS, count)
+    severity_ids = generator.choice(np.array(list(SeverityID)), count)
+    status_ids = generator.choice(np.array(list(StatusID)), count)
+    risk_scores = generator.integers(MISSING, 100, count)
+
+    accounts = [groups[code] for code in group_codes.tolist()]
+    start = time.perf_counter()
+    python_aggregate(
+        accounts, severity_ids.tolist(), status_ids.tolist(), risk_scores.tolist()
+    )
+    elapsed = time.perf_counter() - start
+    print(f"python loop: {count / elapsed:,.0f} findings/s ({count:,} findings)")
+
+    start = time.perf_counter()
+    aggregator = FindingAggregator("cloud.account.uid")
+    aggregator.add_columns(
+        group_codes,
+        groups,
+        severity_id=severity_ids,
+        status_id=status_ids,
+        risk_score=risk_scores,
+    )
+    aggregator.result()
+    elapsed = time.perf_counter() - start
+    print(f"aggregator columns: {count / elapsed:,.0f} findings/s")
+
+    findings = list(synthetic_findings(model_count))
+    start = time.perf_counter()
+    aggregate(findings, "cloud.account.uid")
+    elapsed = time.perf_counter() - start
+    print(
+        f"aggregator models: {model_count / elapsed:,.0f} findings/s "
+        f"({model_count:,} findings)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Compare writing findings from concurrent asyncio producers by serializing them on the event loop and with the Async File Writer, serializing in a worker thread or process.
+
+Besides the throughput, a heartbeat task that wakes up every millisecond measures how late the loop runs it, which is the latency every other task of the loop suffers.
+
+Usage: python -m benchmarks.async_writer [count]
+"""
+
+import asyncio
+import gc
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Awaitable, Callable
+
+from benchmarks.findings import synthetic_findings
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.io.async_writer import AsyncFileWriter
+
+PRODUCERS = 16
+HEARTBEAT = 0.001
+MODES = (
+    "serialize on the loop",
+    "async file writer, thread",
+    "async file writer, process",
+)
+
+
+async def heartbeat(lags: list[float], done: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not done.is_set():
+        start = loop.time()
+        await asyncio.sleep(HEARTBEAT)
+        lags.append(loop.time() - start - HEARTBEAT)
+
+
+async def produce(
+    findings: list[DetectionFinding],
+    write: Callable[[DetectionFinding], Awaitable[None]],
+) -> None:
+    for finding in findings:
+        await write(finding)
+        # Receiving the next finding from a cloud API yields to the loop.
+        await asyncio.sleep(0)
+
+
+async def run(findings: list[DetectionFinding], path: str, mode: str) -> None:
+    lags: list[float] = []
+    done = asyncio.Event()
+    ticker = asyncio.create_task(heartbeat(lags, done))
+    shares = [findings[index::PRODUCERS] for index in range(PRODUCERS)]
+    start = time.perf_counter()
+    if mode == "serialize on the loop":
+        with open(path, "wb") as stream:
+
+            async def write(finding: DetectionFinding) -> None:
+                stream.write(finding.model_dump_json(exclude_unset=True).encode())
+                stream.write(b"\n")
+
+            await asyncio.gather(*(produce(share, write) for share in shares))
+    else:
+        executor = (
+            ProcessPoolExecutor(1) if mode == "async file writer, process" else None
+        )
+        async with AsyncFileWriter(path, executor=executor) as writer:
+            await asyncio.gather(*(produce(share, writer.write) for share in shares))
+        if executor is not None:
+            executor.shutdown()
+    elapsed = time.perf_counter() - start
+    done.set()
+    await ticker
+    lags.sort()
+    print(
+        f"{mode}: {len(findings) / elapsed:,.0f} findings/s, loop lag "
+        f"median {statistics.median(lags) * 1000:,.2f} ms, "
+        f"p99 {lags[int(len(lags) * 0.99)] * 1000:,.2f} ms, "
+        f"max {lags[-1] * 1000:,.2f} ms"
+    )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    findings = list(synthetic_findings(count))
+    # Full collections of the prepared findings would otherwise stall the loop for hundreds of milliseconds.
+    gc.freeze()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "findings.ndjson")
+        for mode in MODES:
+            asyncio.run(run(findings, path, mode))
+
+
+if __name__ == "__main__":
+    main()
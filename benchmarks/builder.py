@@ -0,0 +1,62 @@
+"""
+Compare building synthetic findings from scratch with stamping them out of a Finding Builder that shares their templates.
+
+Usage: python -m benchmarks.builder [count]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from benchmarks.findings import REGIONS, synthetic_finding
+from py_ocsf_models.builder import FindingBuilder
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+
+TEMPLATE_FIELDS = ("metadata", "cloud", "category_uid", "class_uid", "activity_id")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    template = synthetic_finding(0)
+    builder = FindingBuilder(
+        DetectionFinding,
+        **{name: getattr(template, name) for name in TEMPLATE_FIELDS},
+    )
+    fields = []
+    for index in range(count):
+        finding_fields = synthetic_finding(index).model_dump(exclude_unset=True)
+        for name in TEMPLATE_FIELDS:
+            finding_fields.pop(name)
+        fields.append(finding_fields)
+
+    for label, build in (
+        ("from scratch", synthetic_finding),
+        (
+            "builder",
+            lambda index: builder.build(
+                overrides={
+                    "cloud.account.uid": f"{index % 50:012d}",
+                    "cloud.account.name": f"account-{index % 50}",
+                    "cloud.region": REGIONS[index % len(REGIONS)],
+                },
+                **fields[index],
+            ),
+        ),
+    ):
+        start = time.perf_counter()
+        findings = [build(index) for index in range(count)]
+        elapsed = time.perf_counter() - start
+        del findings
+        tracemalloc.start()
+        findings = [build(index) for index in range(count)]
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(
+            f"{label}: {count / elapsed:,.0f} findings/s, "
+            f"{memory / len(findings):,.0f} bytes/finding"
+        )
+        del findings
+
+
+if __name__ == "__main__":
+    main()
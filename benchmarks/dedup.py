@@ -0,0 +1,39 @@
+"""
+Measure fingerprinting and deduplication throughput on a stream of synthetic findings with repeated identities.
+
+Usage: python -m benchmarks.dedup [count] [distinct]
+"""
+
+import sys
+import time
+
+from benchmarks.findings import synthetic_finding
+from py_ocsf_models.processing.dedup import FindingDeduplicator
+from py_ocsf_models.processing.fingerprint import finding_fingerprint
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    pool = [synthetic_finding(index) for index in range(distinct)]
+    findings = [pool[index % distinct] for index in range(count)]
+
+    start = time.perf_counter()
+    for finding in findings:
+        finding_fingerprint(finding)
+    elapsed = time.perf_counter() - start
+    print(f"fingerprint: {count / elapsed:,.0f} findings/s")
+
+    for label, capacity in (("exact", None), ("bloom filter", distinct * 2)):
+        deduplicator = FindingDeduplicator(capacity)
+        start = time.perf_counter()
+        kept = sum(deduplicator.add(finding) for finding in findings)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label}: {count / elapsed:,.0f} findings/s, "
+            f"{kept} kept, {deduplicator.duplicates} duplicates"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Measure the throughput of the scan delta engine on two overlapping scans of synthetic findings.
+
+Usage: python -m benchmarks.delta [count] [chunk_size]
+"""
+
+import sys
+import time
+from collections import Counter
+
+from benchmarks.findings import synthetic_finding, synthetic_findings
+from py_ocsf_models.processing.delta import scan_delta
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 25_000
+    previous = list(synthetic_findings(count))
+    current = [
+        synthetic_finding(index) for index in range(count // 10, count + count // 10)
+    ]
+    for finding in current[::20]:
+        finding.risk_score = 100
+
+    start = time.perf_counter()
+    statuses = Counter(
+        (finding.status, finding.activity_name)
+        for finding in scan_delta(previous, current, chunk_size=chunk_size)
+    )
+    elapsed = time.perf_counter() - start
+    print(f"delta: {2 * count / elapsed:,.0f} findings/s, {dict(statuses)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Compare decoding a mixed NDJSON feed of Detection and Compliance Findings by trying each finding class in turn and with the discriminated union of the Event Decoder.
+
+Usage: python -m benchmarks.event_decoder [count]
+"""
+
+import sys
+import time
+from typing import Any, Callable
+
+from pydantic import ValidationError
+
+from benchmarks.findings import synthetic_findings
+from py_ocsf_models.events.base_event import BaseEvent
+from py_ocsf_models.events.findings.class_uid import ClassUID
+from py_ocsf_models.events.findings.compliance_finding import ComplianceFinding
+from py_ocsf_models.events.findings.compliance_finding_type_id import (
+    ComplianceFindingTypeID,
+)
+from py_ocsf_models.io.event_decoder import FINDING_CLASSES, decode_events
+
+
+def feed(count: int) -> list[bytes]:
+    lines = []
+    for index, finding in enumerate(synthetic_findings(count)):
+        if index % 2:
+            finding = ComplianceFinding.model_validate(
+                finding.model_dump(exclude={"cloud", "class_uid", "type_uid"})
+                | {
+                    "compliance": {"standards": ["CIS"]},
+                    "class_uid": ClassUID.ComplianceFinding,
+                    "type_uid": ComplianceFindingTypeID.Create,
+                }
+            )
+        lines.append(finding.model_dump_json(exclude_unset=True).encode() + b"\n")
+    return lines
+
+
+def trial(lines: list[bytes]) -> list[BaseEvent]:
+    events = []
+    for line in lines:
+        for cls in FINDING_CLASSES.values():
+            try:
+                events.append(cls.model_validate_json(line))
+                break
+            except ValidationError:
+                continue
+    return events
+
+
+def measure(label: str, count: int, run: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    run()
+    print(f"{label}: {count / (time.perf_counter() - start):,.0f} findings/s")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    lines = feed(count)
+    measure("trial validation", count, lambda: trial(lines))
+    measure("event decoder", count, lambda: list(decode_events(lines)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Compare filtering, counting and sorting findings with a Python loop over models and with a columnar Finding Batch.
+
+Usage: python -m benchmarks.finding_batch [count]
+"""
+
+import sys
+import time
+from collections import Counter
+from typing import Any, Callable
+
+from benchmarks.findings import synthetic_findings
+from py_ocsf_models.processing.finding_batch import FindingBatch
+
+
+def measure(label: str, run: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    run()
+    print(f"{label}: {(time.perf_counter() - start) * 1000:,.1f} ms")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    findings = list(synthetic_findings(count))
+
+    start = time.perf_counter()
+    batch = FindingBatch.from_findings(findings)
+    print(
+        f"build batch: {count / (time.perf_counter() - start):,.0f} findings/s "
+        f"({count:,} findings)"
+    )
+
+    measure(
+        "filter loop",
+        lambda: [
+            finding
+            for finding in findings
+            if finding.severity_id >= 4 and finding.cloud.region == "eu-west-1"
+        ],
+    )
+    measure(
+        "filter batch",
+        lambda: batch.filter(
+            (batch.column("severity_id") >= 4)
+            & batch.equals("cloud.region", "eu-west-1")
+        ),
+    )
+    measure(
+        "count loop",
+        lambda: Counter(finding.cloud.account.uid for finding in findings),
+    )
+    measure("count batch", lambda: batch.count_by("cloud.account.uid"))
+    measure(
+        "sort loop",
+        lambda: sorted(findings, key=lambda finding: finding.risk_score, reverse=True),
+    )
+    measure("sort batch", lambda: batch.sort_by("risk_score", descending=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Compare looking up findings by resource, account and technique with a linear scan and with a Finding Index.
+
+Usage: python -m benchmarks.finding_index [count] [lookups]
+"""
+
+import sys
+import time
+
+from benchmarks.findings import synthetic_findings
+from py_ocsf_models.objects.mitre_attack import MITREAttack, Technique
+from py_ocsf_models.processing.finding_index import FindingIndex
+
+TECHNIQUES = ("T1078", "T1190", "T1530", "T1562")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    findings = list(synthetic_findings(count))
+    for position, finding in enumerate(findings):
+        finding.finding_info.attacks = [
+            MITREAttack(
+                technique=Technique(
+                    name="Technique", uid=TECHNIQUES[position % len(TECHNIQUES)]
+                )
+            )
+        ]
+
+    start = time.perf_counter()
+    index = FindingIndex(findings)
+    elapsed = time.perf_counter() - start
+    print(f"build index: {count / elapsed:,.0f} findings/s ({count:,} findings)")
+
+    resource_uids = [
+        f"arn:aws:s3:::bucket-{position * count // lookups}"
+        for position in range(lookups)
+    ]
+    scanned = max(lookups // 100, 1)
+    start = time.perf_counter()
+    for uid in resource_uids[:scanned]:
+        [
+            finding
+            for finding in findings
+            if any(resource.uid == uid for resource in finding.resources or ())
+        ]
+    elapsed = time.perf_counter() - start
+    print(f"resource scan: {elapsed / scanned * 1e6:,.0f} µs/lookup")
+
+    start = time.perf_counter()
+    for uid in resource_uids:
+        index.find("resources.uid", uid)
+    elapsed = time.perf_counter() - start
+    print(f"resource index: {elapsed / lookups * 1e6:,.2f} µs/lookup")
+
+    start = time.perf_counter()
+    for position in range(lookups):
+        index.find_all(
+            {
+                "cloud.account.uid": f"{position % 50:012d}",
+                "finding_info.attacks.technique.uid": TECHNIQUES[position % 4],
+            }
+        )
+    elapsed = time.perf_counter() - start
+    print(f"account and technique index: {elapsed / lookups * 1e6:,.0f} µs/lookup")
+
+    start = time.perf_counter()
+    rows = list(range(0, count, 2))
+    for row in rows:
+        index.remove(row)
+    elapsed = time.perf_counter() - start
+    print(f"remove: {len(rows) / elapsed:,.0f} findings/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+from typing import Iterator
+
+from py_ocsf_models import OCSF_VERSION
+from py_ocsf_models.events.findings.category_uid import CategoryUID
+from py_ocsf_models.events.findings.class_uid import ClassUID
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.events.findings.detection_finding_type_id import (
+    DetectionFindingTypeID,
+)
+from py_ocsf_models.events.findings.severity_id import SeverityID
+from py_ocsf_models.events.findings.status_id import StatusID
+from py_ocsf_models.objects.account import Account, TypeID
+from py_ocsf_models.objects.cloud import Cloud
+from py_ocsf_models.objects.finding_info import FindingInformation
+from py_ocsf_models.objects.metadata import Metadata
+from py_ocsf_models.objects.product import Feature, Product
+from py_ocsf_models.objects.resource_details import ResourceDetails
+
+REGIONS = ("eu-west-1", "eu-central-1", "us-east-1", "us-west-2", "ap-south-1")
+
+
+def synthetic_finding(index: int) -> DetectionFinding:
+    """Build a Prowler-like Detection Finding whose identity depends on the index."""
+    severity_id = SeverityID(index % 6)
+    return DetectionFinding(
+        metadata=Metadata(
+            version=OCSF_VERSION,
+            product=Product(
+                feature=Feature(name="Prowler", uid="prowler", version="5.0.0"),
+                name="Prowler",
+                vendor_name="Prowler",
+                version="5.0.0",
+            ),
+            profiles=["cloud", "datetime"],
+        ),
+        finding_info=FindingInformation(
+            title="S3 bucket has public access enabled",
+            uid=f"prowler-aws-s3_bucket_public_access-{index}",
+            desc="Ensure that S3 buckets do not allow public access.",
+            types=["Software and Configuration Checks"],
+        ),
+        severity_id=severity_id,
+        severity=severity_id.name,
+        status_id=StatusID.New,
+        status=StatusID.New.name,
+        activity_id=1,
+        category_uid=CategoryUID.Findings.value,
+        class_uid=ClassUID.DetectionFinding.value,
+        type_uid=DetectionFindingTypeID.Create,
+        time=1700000000 + index,
+        cloud=Cloud(
+            account=Account(
+                name=f"account-{index % 50}",
+                type_id=TypeID.AWS_Account,
+                uid=f"{index % 50:012d}",
+            ),
+            provider="aws",
+            region=REGIONS[index % len(REGIONS)],
+        ),
+        resources=[
+            ResourceDetails(
+                name=f"bucket-{index}",
+                type="AwsS3Bucket",
+                uid=f"arn:aws:s3:::bucket-{index}",
+                region=REGIONS[index % len(REGIONS)],
+                labels=["env:prod", "team:security"],
+            )
+        ],
+        risk_score=index % 100,
+    )
+
+
+def synthetic_findings(count: int) -> Iterator[DetectionFinding]:
+    """Yield the given number of synthetic Detection Findings."""
+    for index in range(count):
+        yield synthetic_finding(index)
@@ -0,0 +1,57 @@
+"""
+Measure dumping Detection Findings, and validating and dumping their JSON lines with the Parallel Serializer, on 1, 4, 16 and 32 threads.
+
+Run it with a regular and a free-threaded build of the same Python version to compare them, e.g. `python3.14` and `python3.14t`. Threads only speed the work up on the free-threaded build, where the GIL is disabled.
+
+Usage: python -m benchmarks.free_threading [count]
+"""
+
+import sys
+import sysconfig
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.findings import synthetic_findings
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.processing.parallel import DEFAULT_CHUNK_SIZE, ParallelSerializer
+
+THREADS = (1, 4, 16, 32)
+
+
+def dump(chunk: list[DetectionFinding]) -> int:
+    return sum(len(finding.model_dump_json(exclude_unset=True)) for finding in chunk)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        f"Python {sys.version.split()[0]}, "
+        f"{'free-threaded' if free_threaded else 'GIL'} build, "
+        f"GIL {'enabled' if gil_enabled else 'disabled'}"
+    )
+    findings = list(synthetic_findings(count))
+    lines = [finding.model_dump_json(exclude_unset=True) for finding in findings]
+    chunks = []
+    for start in range(0, count, DEFAULT_CHUNK_SIZE):
+        end = start + DEFAULT_CHUNK_SIZE
+        chunks.append(findings[start:end])
+    for threads in THREADS:
+        with ThreadPoolExecutor(threads) as executor:
+            start = time.perf_counter()
+            sum(executor.map(dump, chunks))
+            dumped = count / (time.perf_counter() - start)
+        with ParallelSerializer(threads, threads=True) as serializer:
+            start = time.perf_counter()
+            for _ in serializer.dump(lines):
+                pass
+            validated = count / (time.perf_counter() - start)
+        print(
+            f"{threads} threads: dump {dumped:,.0f} findings/s, "
+            f"validate and dump {validated:,.0f} findings/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
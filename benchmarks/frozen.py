@@ -0,0 +1,38 @@
+"""
+Compare grouping findings by their Account using JSON keys with using frozen, hashable Account objects as keys, either shared between findings, as built by a Finding Builder or an Interning Pool, or copied for every finding.
+
+Usage: python -m benchmarks.frozen [count]
+"""
+
+import sys
+import time
+from collections import Counter
+
+from benchmarks.findings import synthetic_finding
+from py_ocsf_models.frozen import freeze
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    accounts = [synthetic_finding(index).cloud.account for index in range(50)]
+    mutable = [accounts[index % len(accounts)] for index in range(count)]
+    shared_accounts = [freeze(account) for account in accounts]
+    shared = [shared_accounts[index % len(accounts)] for index in range(count)]
+    copied = [freeze(accounts[index % len(accounts)]) for index in range(count)]
+
+    start = time.perf_counter()
+    json_counts = Counter(account.model_dump_json() for account in mutable)
+    elapsed = time.perf_counter() - start
+    print(f"json keys: {count / elapsed:,.0f} findings/s, {len(json_counts)} groups")
+
+    for label, keys in (("shared frozen keys", shared), ("copied frozen keys", copied)):
+        start = time.perf_counter()
+        frozen_counts = Counter(keys)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label}: {count / elapsed:,.0f} findings/s, {len(frozen_counts)} groups"
+        )
+
+
+if __name__ == "__main__":
+    main()
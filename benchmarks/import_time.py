@@ -0,0 +1,50 @@
+"""
+Measure how long importing an OCSF event module takes, using ``python -X importtime``.
+
+The import runs in fresh interpreters and the fastest cumulative time is compared against a budget, so the script exits with a non-zero status when a change makes the import noticeably slower.
+
+Usage: python -m benchmarks.import_time [module] [budget_ms]
+"""
+
+import re
+import subprocess
+import sys
+
+DEFAULT_MODULE = "py_ocsf_models.events.findings.detection_finding"
+DEFAULT_BUDGET_MS = 300.0
+RUNS = 5
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)$")
+
+
+def cumulative_import_time(module: str) -> float:
+    """Import the module in a fresh interpreter and return its cumulative import time in milliseconds."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in completed.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match and match.group(3) == module:
+            return int(match.group(2)) / 1000
+    raise RuntimeError(f"No import time reported for {module}")
+
+
+def main() -> None:
+    module = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_MODULE
+    budget = float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_BUDGET_MS
+
+    timings = [cumulative_import_time(module) for _ in range(RUNS)]
+    best = min(timings)
+    print(f"module: {module}")
+    print(f"import time: best {best:.1f}ms, worst {max(timings):.1f}ms")
+    print(f"budget: {budget:.1f}ms")
+    if best > budget:
+        print("import time exceeds the budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
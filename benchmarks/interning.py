@@ -0,0 +1,46 @@
+"""
+Compare the throughput and memory of reading NDJSON findings with and without interning their repeated nested objects.
+
+Usage: python -m benchmarks.interning [count]
+"""
+
+import contextlib
+import sys
+import time
+import tracemalloc
+
+from benchmarks.findings import synthetic_finding
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.interning import interning
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    lines = [
+        synthetic_finding(index).model_dump_json(exclude_unset=True)
+        for index in range(count)
+    ]
+
+    for label, context in (
+        ("plain", contextlib.nullcontext),
+        ("interned", interning),
+    ):
+        with context():
+            start = time.perf_counter()
+            findings = [DetectionFinding.model_validate_json(line) for line in lines]
+            elapsed = time.perf_counter() - start
+        del findings
+        with context():
+            tracemalloc.start()
+            findings = [DetectionFinding.model_validate_json(line) for line in lines]
+            memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+        print(
+            f"{label}: {count / elapsed:,.0f} findings/s, "
+            f"{memory / len(findings):,.0f} bytes/finding"
+        )
+        del findings
+
+
+if __name__ == "__main__":
+    main()
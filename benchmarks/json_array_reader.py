@@ -0,0 +1,68 @@
+"""
+Compare the throughput and peak memory of reading a large JSON array of findings all at once and with the JSON Array Reader.
+
+Usage: python -m benchmarks.json_array_reader [count]
+"""
+
+import collections
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from pydantic import TypeAdapter
+
+from benchmarks.findings import synthetic_findings
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.io.json_array_reader import read_json_array
+from py_ocsf_models.io.serializer import dump_many
+
+BATCH_SIZE = 10_000
+
+
+def load_all(path: str) -> None:
+    with open(path, "rb") as stream:
+        findings = TypeAdapter(list[DetectionFinding]).validate_json(stream.read())
+    collections.deque(findings, maxlen=0)
+
+
+def stream(path: str) -> None:
+    collections.deque(read_json_array(path), maxlen=0)
+
+
+def measure(label: str, count: int, run: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(
+        f"{label}: {count / elapsed:,.0f} findings/s, "
+        f"peak {peak / 1024 / 1024:,.1f} MiB"
+    )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "findings.json")
+        with open(path, "wb") as output:
+            output.write(b"[")
+            for start in range(0, count, BATCH_SIZE):
+                batch = list(synthetic_findings(min(BATCH_SIZE, count - start)))
+                if start:
+                    output.write(b",")
+                # The items of the batch array become items of the file array.
+                output.write(dump_many(batch, DetectionFinding)[1:-1])
+            output.write(b"]")
+        print(f"{count:,} findings, {os.path.getsize(path) / 1024 / 1024:,.1f} MiB")
+        measure("load all", count, lambda: load_all(path))
+        measure("json array reader", count, lambda: stream(path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Compare looking findings up by row and by finding_info.uid with the NDJSON Reader, when its indexes are built and when they are loaded, against scanning the file for them.
+
+Usage: python -m benchmarks.ndjson_reader [count]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.findings import synthetic_findings
+from py_ocsf_models.io.event_decoder import decode_events
+from py_ocsf_models.io.ndjson_reader import NDJSONReader
+
+LOOKUPS = 1_000
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    step = max(count // LOOKUPS, 1)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "findings.ndjson"
+        uids = []
+        with open(path, "wb") as stream:
+            for row, finding in enumerate(synthetic_findings(count)):
+                stream.write(finding.model_dump_json(exclude_unset=True).encode())
+                stream.write(b"\n")
+                if row % step == 0 and finding.finding_info is not None:
+                    uids.append(finding.finding_info.uid)
+
+        start = time.perf_counter()
+        with open(path, "rb") as stream:
+            for event in decode_events(stream):
+                if event.finding_info.uid == uids[-1]:  # type: ignore[attr-defined]
+                    break
+        print(f"scan: {time.perf_counter() - start:.3f}s to find one finding")
+
+        start = time.perf_counter()
+        with NDJSONReader(path) as reader:
+            print(f"offset index: built in {time.perf_counter() - start:.3f}s")
+            start = time.perf_counter()
+            reader.row_of(uids[0])
+            print(f"uid index: built in {time.perf_counter() - start:.3f}s")
+
+        start = time.perf_counter()
+        with NDJSONReader(path) as reader:
+            reader.row_of(uids[0])
+            print(f"both indexes: loaded in {time.perf_counter() - start:.3f}s")
+
+            rows = range(0, count, step)
+            start = time.perf_counter()
+            for row in rows:
+                reader[row]
+            elapsed = time.perf_counter() - start
+            print(f"by row: {elapsed / len(rows) * 1e6:,.1f}µs per finding")
+
+            start = time.perf_counter()
+            for uid in uids:
+                reader.find(uid)
+            elapsed = time.perf_counter() - start
+            print(f"by uid: {elapsed / len(uids) * 1e6:,.1f}µs per finding")
+
+
+if __name__ == "__main__":
+    main()
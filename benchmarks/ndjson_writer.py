@@ -0,0 +1,41 @@
+"""
+Compare the NDJSON writer against joining per-object `model_dump_json` calls.
+
+Usage: python -m benchmarks.ndjson_writer [count]
+"""
+
+import io
+import sys
+import time
+
+from benchmarks.findings import synthetic_finding
+from py_ocsf_models.io.ndjson_writer import NDJSONWriter
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    findings = [synthetic_finding(index) for index in range(count)]
+
+    start = time.perf_counter()
+    stream = io.BytesIO()
+    stream.write(
+        "\n".join(
+            finding.model_dump_json(exclude_unset=True) for finding in findings
+        ).encode()
+    )
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    writer = NDJSONWriter(io.BytesIO())
+    writer.write_many(findings)
+    writer.flush()
+    streamed = time.perf_counter() - start
+
+    print(f"findings: {count}")
+    print(f"model_dump_json loop: {loop:.3f}s ({count / loop:,.0f} events/s)")
+    print(f"NDJSONWriter:         {streamed:.3f}s ({count / streamed:,.0f} events/s)")
+    print(f"speedup:              {loop / streamed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Measure the throughput of the offline OCSF validator on serialized findings.
+
+Usage: python -m benchmarks.ocsf_validator [count]
+"""
+
+import sys
+import time
+
+from benchmarks.findings import synthetic_finding
+from py_ocsf_models.validation.ocsf_validator import OCSFValidator
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    events = [
+        synthetic_finding(index).model_dump_json(exclude_unset=True)
+        for index in range(count)
+    ]
+
+    start = time.perf_counter()
+    validator = OCSFValidator()
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = validator.validate_many(events)
+    elapsed = time.perf_counter() - start
+
+    errors = sum(result["error_count"] for result in results)
+    print(f"events: {count}, errors: {errors}")
+    print(f"schema compilation: {compile_time * 1000:.1f}ms")
+    print(f"validation: {elapsed:.3f}s ({count / elapsed:,.0f} events/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Compare validating and serializing JSON lines of findings in the current process and with the Parallel Serializer for a growing number of workers, up to the number of CPUs.
+
+Usage: python -m benchmarks.parallel [count]
+"""
+
+import os
+import sys
+import time
+
+from benchmarks.findings import synthetic_findings
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.processing.parallel import ParallelSerializer
+
+
+def serial(lines: list[bytes]) -> bytes:
+    output = bytearray()
+    for line in lines:
+        finding = DetectionFinding.model_validate_json(line)
+        output += finding.model_dump_json(exclude_unset=True).encode() + b"\n"
+    return bytes(output)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    lines = [
+        finding.model_dump_json(exclude_unset=True).encode()
+        for finding in synthetic_findings(count)
+    ]
+    start = time.perf_counter()
+    serial(lines)
+    print(f"serial: {count / (time.perf_counter() - start):,.0f} findings/s")
+
+    cpus = os.cpu_count() or 1
+    workers = 1
+    while True:
+        with ParallelSerializer(workers) as serializer:
+            # Start the workers before timing.
+            for _ in serializer.dump(lines[: workers * serializer.chunk_size]):
+                pass
+            start = time.perf_counter()
+            for _ in serializer.dump(lines):
+                pass
+            elapsed = time.perf_counter() - start
+        print(f"{workers} workers: {count / elapsed:,.0f} findings/s")
+        if workers >= cpus:
+            break
+        workers = min(2 * workers, cpus)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Compare a projected, filtered scan of a Parquet file of findings with reading every finding as a model.
+
+Usage: python -m benchmarks.parquet_reader [count]
+"""
+
+import io
+import sys
+import time
+
+from benchmarks.findings import synthetic_findings
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.io.parquet_reader import ParquetReader, read_parquet
+from py_ocsf_models.io.parquet_writer import write_parquet
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    parquet = io.BytesIO()
+    write_parquet(
+        synthetic_findings(count), parquet, DetectionFinding, row_group_size=10_000
+    )
+
+    parquet.seek(0)
+    start = time.perf_counter()
+    reader = ParquetReader(
+        parquet,
+        columns=["finding_info.uid", "severity_id", "status_id"],
+        filters=[("time", "<", 1700000000 + count // 10), ("severity_id", ">=", 4)],
+    )
+    matches = sum(len(batch) for batch in reader)
+    triage_elapsed = time.perf_counter() - start
+
+    parquet.seek(0)
+    start = time.perf_counter()
+    materialized = sum(1 for _ in read_parquet(parquet))
+    full_elapsed = time.perf_counter() - start
+
+    print(f"events: {count}")
+    print(
+        f"projected and filtered scan: {triage_elapsed:.3f}s, {matches} matches "
+        f"in {len(reader.row_groups)} row groups"
+    )
+    print(f"full materialization: {full_elapsed:.2f}s, {materialized} models")
+
+
+if __name__ == "__main__":
+    main()
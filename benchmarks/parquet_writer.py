@@ -0,0 +1,42 @@
+"""
+Measure the throughput of the Parquet writer on synthetic findings and compare the output size with NDJSON.
+
+Usage: python -m benchmarks.parquet_writer [count]
+"""
+
+import io
+import sys
+import time
+
+from benchmarks.findings import synthetic_findings
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.io.ndjson_writer import write_ndjson
+from py_ocsf_models.io.parquet_writer import write_parquet
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    parquet = io.BytesIO()
+    start = time.perf_counter()
+    write_parquet(synthetic_findings(count), parquet, DetectionFinding)
+    parquet_elapsed = time.perf_counter() - start
+
+    ndjson = io.BytesIO()
+    start = time.perf_counter()
+    write_ndjson(synthetic_findings(count), ndjson)
+    ndjson_elapsed = time.perf_counter() - start
+
+    print(f"events: {count}")
+    print(
+        f"parquet: {parquet_elapsed:.2f}s ({count / parquet_elapsed:,.0f} events/s), "
+        f"{len(parquet.getvalue()) / 1024 / 1024:.1f} MiB"
+    )
+    print(
+        f"ndjson: {ndjson_elapsed:.2f}s ({count / ndjson_elapsed:,.0f} events/s), "
+        f"{len(ndjson.getvalue()) / 1024 / 1024:.1f} MiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Compare dumping a few fields of findings with a full dump, a full dump discarding the other fields, a pydantic include spec and a Projection.
+
+Usage: python -m benchmarks.projection [count]
+"""
+
+import sys
+import time
+from typing import Any, Callable
+
+from benchmarks.findings import synthetic_findings
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.io.projection import ALL_ITEMS, Projection
+
+PATHS = [
+    "finding_info.title",
+    "finding_info.uid",
+    "severity_id",
+    "status_id",
+    "time",
+    "resources[].uid",
+    "resources[].region",
+    "cloud.account.uid",
+    "cloud.region",
+    "metadata.product.name",
+]
+
+
+def discard(data: dict[str, Any], include: dict[Any, Any]) -> dict[str, Any]:
+    kept = {}
+    for name, spec in include.items():
+        if name not in data:
+            continue
+        value = data[name]
+        if spec is True or value is None:
+            kept[name] = value
+        elif isinstance(value, list):
+            kept[name] = [discard(item, spec[ALL_ITEMS]) for item in value]
+        else:
+            kept[name] = discard(value, spec)
+    return kept
+
+
+def measure(label: str, count: int, run: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    run()
+    print(f"{label}: {count / (time.perf_counter() - start):,.0f} findings/s")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    findings = list(synthetic_findings(count))
+    projection = Projection(DetectionFinding, PATHS)
+    include = projection.include
+
+    measure(
+        "dict full",
+        count,
+        lambda: [finding.model_dump(exclude_unset=True) for finding in findings],
+    )
+    measure(
+        "dict full and discard",
+        count,
+        lambda: [
+            discard(finding.model_dump(exclude_unset=True), include)
+            for finding in findings
+        ],
+    )
+    measure(
+        "dict include",
+        count,
+        lambda: [
+            finding.model_dump(include=include, exclude_unset=True)
+            for finding in findings
+        ],
+    )
+    measure(
+        "dict projection",
+        count,
+        lambda: [projection.dump(finding) for finding in findings],
+    )
+    measure(
+        "json full",
+        count,
+        lambda: [finding.model_dump_json(exclude_unset=True) for finding in findings],
+    )
+    measure(
+        "json include",
+        count,
+        lambda: [
+            finding.model_dump_json(include=include, exclude_unset=True)
+            for finding in findings
+        ],
+    )
+    measure(
+        "json projection",
+        count,
+        lambda: [projection.dump_json(finding) for finding in findings],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Compare the throughput and compression ratio of the Rotating File Writer for plain NDJSON, gzip and zstd at a few levels, rolling files over every 8 MiB.
+
+Usage: python -m benchmarks.rotating_writer [count]
+"""
+
+import sys
+import tempfile
+import time
+from typing import Optional
+
+from benchmarks.findings import synthetic_findings
+from py_ocsf_models.io.rotating_writer import RotatingFileWriter
+
+MAX_BYTES = 8 * 1024 * 1024
+CODECS: list[tuple[Optional[str], Optional[int]]] = [
+    (None, None),
+    ("gzip", 1),
+    ("gzip", 6),
+    ("zstd", 1),
+    ("zstd", 3),
+    ("zstd", 9),
+]
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    findings = list(synthetic_findings(count))
+    for compression, level in CODECS:
+        with tempfile.TemporaryDirectory() as directory:
+            start = time.perf_counter()
+            with RotatingFileWriter(
+                directory, compression=compression, level=level, max_bytes=MAX_BYTES
+            ) as writer:
+                writer.write_many(findings)
+            elapsed = time.perf_counter() - start
+            size = sum(path.stat().st_size for path in writer.files)
+        label = f"{compression} {level}" if compression else "plain"
+        print(
+            f"{label}: {count / elapsed:,.0f} findings/s, "
+            f"{size / 1024 / 1024:,.1f} MiB in {len(writer.files)} files"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Compare the cold start of a worker validating one Detection Finding with and without the schema cache.
+
+Every measurement runs in a fresh interpreter and covers importing the model and validating and serializing the first finding.
+
+Usage: python -m benchmarks.schema_cache [runs]
+"""
+
+import subprocess
+import sys
+import tempfile
+
+COLD_START = """
+import sys
+import time
+
+start = time.perf_counter()
+from py_ocsf_models import schema_cache
+
+if sys.argv[1]:
+    schema_cache.enable_schema_cache(sys.argv[1])
+from benchmarks.findings import synthetic_finding
+
+synthetic_finding(1).model_dump_json(exclude_unset=True)
+print(time.perf_counter() - start)
+"""
+
+
+def cold_start(cache_directory: str) -> float:
+    """Run a fresh worker and return the seconds it took to emit its first finding."""
+    completed = subprocess.run(
+        [sys.executable, "-c", COLD_START, cache_directory],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return float(completed.stdout)
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    with tempfile.TemporaryDirectory() as cache_directory:
+        cold_start(cache_directory)
+        for label, directory in (
+            ("without cache", ""),
+            ("with cache", cache_directory),
+        ):
+            timings = [cold_start(directory) for _ in range(runs)]
+            print(
+                f"{label}: best {min(timings) * 1000:.1f}ms, "
+                f"mean {sum(timings) / runs * 1000:.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
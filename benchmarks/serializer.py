@@ -0,0 +1,54 @@
+"""
+Compare `dump_many` against a loop of per-object `model_dump_json` calls.
+
+Usage: python -m benchmarks.serializer [count ...]
+
+The batches reuse a pool of distinct findings so that building one million of them does not dominate the run.
+"""
+
+import sys
+import time
+from typing import Callable
+
+from benchmarks.findings import synthetic_finding
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.io.serializer import dump_many
+
+POOL_SIZE = 10_000
+
+
+def dump_loop(findings: list[DetectionFinding]) -> bytes:
+    return (
+        b"["
+        + ",".join(
+            finding.model_dump_json(exclude_unset=True) for finding in findings
+        ).encode()
+        + b"]"
+    )
+
+
+def timed(
+    dump: Callable[[list[DetectionFinding]], bytes], findings: list[DetectionFinding]
+) -> float:
+    start = time.perf_counter()
+    dump(findings)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    counts = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    pool = [synthetic_finding(index) for index in range(POOL_SIZE)]
+    dump_many(pool[:1], cls=DetectionFinding)
+
+    print(f"{'findings':>10} {'loop':>10} {'dump_many':>10} {'speedup':>8}")
+    for count in counts:
+        findings = [pool[index % POOL_SIZE] for index in range(count)]
+
+        loop = timed(dump_loop, findings)
+        batched = timed(lambda batch: dump_many(batch, cls=DetectionFinding), findings)
+
+        print(f"{count:>10} {loop:>9.3f}s {batched:>9.3f}s {loop / batched:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Compare the throughput and memory of loading NDJSON findings as full models and as read-only views.
+
+Usage: python -m benchmarks.views [count]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from benchmarks.findings import synthetic_finding
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.views import DetectionFindingView
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    lines = [
+        synthetic_finding(index).model_dump_json(exclude_unset=True)
+        for index in range(count)
+    ]
+
+    for label, load in (
+        ("model", DetectionFinding.model_validate_json),
+        ("view", DetectionFindingView.from_json),
+    ):
+        start = time.perf_counter()
+        loaded = [load(line) for line in lines]
+        elapsed = time.perf_counter() - start
+        del loaded
+        tracemalloc.start()
+        loaded = [load(line) for line in lines]
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(
+            f"{label}: {count / elapsed:,.0f} findings/s, "
+            f"{memory / len(loaded):,.0f} bytes/finding"
+        )
+        del loaded
+
+
+if __name__ == "__main__":
+    main()
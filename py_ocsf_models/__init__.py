@@ -1 +1,188 @@
+"""
+Python models for the Open Cybersecurity Schema Framework (OCSF).
+
+Every event and object model is importable from this package, for example ``from py_ocsf_models import DetectionFinding``. The submodule defining a model is only imported the first time the model is accessed, so importing the package itself stays cheap.
+"""
+
+import importlib
+from typing import Any
+
 OCSF_VERSION = "1.5.0"
+
+# Enums such as TypeID that several objects define differently are not exported here and have to be imported from their modules.
+_LAZY_EXPORTS = {
+    "Account": "py_ocsf_models.objects.account",
+    "ActivityID": "py_ocsf_models.events.findings.activity_id",
+    "AffectedSoftwarePackage": "py_ocsf_models.objects.affected_software_package",
+    "AlgorithmID": "py_ocsf_models.objects.fingerprint",
+    "Analytic": "py_ocsf_models.objects.analytic",
+    "API": "py_ocsf_models.objects.api",
+    "ApplicationSecurityPostureFinding": "py_ocsf_models.events.findings.application_security_posture_finding",
+    "ApplicationSecurityPostureFindingTypeID": "py_ocsf_models.events.findings.application_security_posture_finding_type_id",
+    "Assessment": "py_ocsf_models.objects.assessment",
+    "BaseEvent": "py_ocsf_models.events.base_event",
+    "CategoryUID": "py_ocsf_models.events.findings.category_uid",
+    "Check": "py_ocsf_models.objects.check",
+    "ClassUID": "py_ocsf_models.events.findings.class_uid",
+    "Cloud": "py_ocsf_models.objects.cloud",
+    "Compliance": "py_ocsf_models.objects.compliance",
+    "ComplianceFinding": "py_ocsf_models.events.findings.compliance_finding",
+    "ComplianceFindingTypeID": "py_ocsf_models.events.findings.compliance_finding_type_id",
+    "ConfidenceID": "py_ocsf_models.events.findings.confidence_id",
+    "Container": "py_ocsf_models.objects.container",
+    "CVE": "py_ocsf_models.objects.cve",
+    "CVSSScore": "py_ocsf_models.objects.cvss",
+    "CWE": "py_ocsf_models.objects.cwe",
+    "DetectionFinding": "py_ocsf_models.events.findings.detection_finding",
+    "DetectionFindingTypeID": "py_ocsf_models.events.findings.detection_finding_type_id",
+    "Device": "py_ocsf_models.objects.device",
+    "DeviceHardwareInfo": "py_ocsf_models.objects.device_hardware_info",
+    "DeviceType": "py_ocsf_models.objects.device",
+    "Display": "py_ocsf_models.objects.device_hardware_info",
+    "DispositionID": "py_ocsf_models.events.findings.disposition_id",
+    "DNSOpcodeID": "py_ocsf_models.objects.dns_query",
+    "DNSQuery": "py_ocsf_models.objects.dns_query",
+    "Enrichment": "py_ocsf_models.objects.enrichment",
+    "EPSS": "py_ocsf_models.objects.epss",
+    "EvidenceArtifacts": "py_ocsf_models.objects.evidence_artifacts",
+    "Feature": "py_ocsf_models.objects.product",
+    "Finding": "py_ocsf_models.events.findings.finding",
+    "FindingInformation": "py_ocsf_models.objects.finding_info",
+    "FingerPrint": "py_ocsf_models.objects.fingerprint",
+    "GeoLocation": "py_ocsf_models.objects.geolocation",
+    "Group": "py_ocsf_models.objects.group",
+    "Image": "py_ocsf_models.objects.image",
+    "ImpactID": "py_ocsf_models.events.findings.impact_id",
+    "KBArticle": "py_ocsf_models.objects.kb_article",
+    "KeyboardInformation": "py_ocsf_models.objects.device_hardware_info",
+    "KillChainPhase": "py_ocsf_models.objects.kill_chain_phase",
+    "LDAPPerson": "py_ocsf_models.objects.ldap_person",
+    "Logger": "py_ocsf_models.objects.metadata",
+    "Metadata": "py_ocsf_models.objects.metadata",
+    "Metric": "py_ocsf_models.objects.metric",
+    "MITREAttack": "py_ocsf_models.objects.mitre_attack",
+    "NetworkInterface": "py_ocsf_models.objects.network_interface",
+    "NetworkType": "py_ocsf_models.objects.network_interface",
+    "Observable": "py_ocsf_models.objects.observable",
+    "OperatingSystem": "py_ocsf_models.objects.operating_system",
+    "Organization": "py_ocsf_models.objects.organization",
+    "PhaseID": "py_ocsf_models.objects.kill_chain_phase",
+    "Policy": "py_ocsf_models.objects.policy",
+    "Product": "py_ocsf_models.objects.product",
+    "RelatedEvent": "py_ocsf_models.objects.related_event",
+    "Remediation": "py_ocsf_models.objects.remediation",
+    "Reputation": "py_ocsf_models.objects.observable",
+    "ReputationScoreID": "py_ocsf_models.objects.observable",
+    "RequestElements": "py_ocsf_models.objects.request_elements",
+    "ResourceDetails": "py_ocsf_models.objects.resource_details",
+    "ResponseElements": "py_ocsf_models.objects.response_elements",
+    "RiskLevelID": "py_ocsf_models.events.findings.risk_level_id",
+    "SchemaExtension": "py_ocsf_models.objects.metadata",
+    "Service": "py_ocsf_models.objects.service",
+    "SeverityID": "py_ocsf_models.events.findings.severity_id",
+    "SoftwarePackageTypeID": "py_ocsf_models.objects.affected_software_package",
+    "StatusID": "py_ocsf_models.events.findings.status_id",
+    "SubTechnique": "py_ocsf_models.objects.mitre_attack",
+    "Tactic": "py_ocsf_models.objects.mitre_attack",
+    "Technique": "py_ocsf_models.objects.mitre_attack",
+    "URL": "py_ocsf_models.objects.url",
+    "User": "py_ocsf_models.objects.user",
+    "VerdictID": "py_ocsf_models.objects.verdict",
+    "VulnerabilityDetails": "py_ocsf_models.objects.vulnerability_details",
+}
+
+__all__ = [
+    "OCSF_VERSION",
+    "Account",
+    "ActivityID",
+    "AffectedSoftwarePackage",
+    "AlgorithmID",
+    "Analytic",
+    "API",
+    "ApplicationSecurityPostureFinding",
+    "ApplicationSecurityPostureFindingTypeID",
+    "Assessment",
+    "BaseEvent",
+    "CategoryUID",
+    "Check",
+    "ClassUID",
+    "Cloud",
+    "Compliance",
+    "ComplianceFinding",
+    "ComplianceFindingTypeID",
+    "ConfidenceID",
+    "Container",
+    "CVE",
+    "CVSSScore",
+    "CWE",
+    "DetectionFinding",
+    "DetectionFindingTypeID",
+    "Device",
+    "DeviceHardwareInfo",
+    "DeviceType",
+    "Display",
+    "DispositionID",
+    "DNSOpcodeID",
+    "DNSQuery",
+    "Enrichment",
+    "EPSS",
+    "EvidenceArtifacts",
+    "Feature",
+    "Finding",
+    "FindingInformation",
+    "FingerPrint",
+    "GeoLocation",
+    "Group",
+    "Image",
+    "ImpactID",
+    "KBArticle",
+    "KeyboardInformation",
+    "KillChainPhase",
+    "LDAPPerson",
+    "Logger",
+    "Metadata",
+    "Metric",
+    "MITREAttack",
+    "NetworkInterface",
+    "NetworkType",
+    "Observable",
+    "OperatingSystem",
+    "Organization",
+    "PhaseID",
+    "Policy",
+    "Product",
+    "RelatedEvent",
+    "Remediation",
+    "Reputation",
+    "ReputationScoreID",
+    "RequestElements",
+    "ResourceDetails",
+    "ResponseElements",
+    "RiskLevelID",
+    "SchemaExtension",
+    "Service",
+    "SeverityID",
+    "SoftwarePackageTypeID",
+    "StatusID",
+    "SubTechnique",
+    "Tactic",
+    "Technique",
+    "URL",
+    "User",
+    "VerdictID",
+    "VulnerabilityDetails",
+]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1,30 @@
+import threading
+from functools import update_wrapper
+from typing import Callable, Hashable, TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+def synchronized_cache(function: Callable[[KeyT], ValueT]) -> Callable[[KeyT], ValueT]:
+    """
+    Cache the results of a function of one argument, calling it once per argument even when threads race for the same argument.
+
+    `lru_cache` may call the function again for an argument that another thread is already computing, and each thread then keeps its own result. That is harmless for pure functions but not for factories of classes, whose results must be unique. Cached results are read without the lock, which is safe with and without the GIL.
+    """
+    results: dict[KeyT, ValueT] = {}
+    # Reentrant, so the function may call itself for other arguments.
+    lock = threading.RLock()
+
+    def cached(argument: KeyT) -> ValueT:
+        try:
+            return results[argument]
+        except KeyError:
+            pass
+        with lock:
+            if argument not in results:
+                results[argument] = function(argument)
+            return results[argument]
+
+    update_wrapper(cached, function)
+    return cached
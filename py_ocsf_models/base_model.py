@@ -0,0 +1,72 @@
+import sys
+import threading
+from typing import Any, Optional, Union
+
+from pydantic import BaseModel, ConfigDict
+from typing_extensions import Self
+
+from py_ocsf_models import interning, schema_cache
+
+# Threads validating a model for the first time at once build it one after the other, so it is built once.
+_build_lock = threading.RLock()
+
+
+class OCSFBaseModel(BaseModel):
+    """
+    The OCSF Base Model is the common parent of every OCSF event and object model.
+
+    Validators and serializers are built lazily, the first time a model is validated or serialized, instead of when its module is imported. Short-lived processes that only emit a few event classes therefore do not pay for building the schemas of every model they import. When the schema cache is enabled, they are loaded from disk instead of being built at all. Builds hold a lock, so threads racing to use a model first, e.g. on a free-threaded interpreter, wait for one build instead of each building it.
+
+    Within an `interning` block, `model_validate` and `model_validate_json` share the repeated nested objects of the models they return through the active Interning Pool.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+    @classmethod
+    def model_rebuild(
+        cls,
+        *,
+        force: bool = False,
+        raise_errors: bool = True,
+        _parent_namespace_depth: int = 2,
+        _types_namespace: Optional[Any] = None,
+    ) -> Optional[bool]:
+        with _build_lock:
+            # A rebuild requested while the cached validator is installed comes from code needing the full core schema.
+            if (
+                not force
+                and not cls.__pydantic_complete__
+                and not schema_cache.is_loaded_from_cache(cls)
+                and schema_cache.load_cached_schema(cls)
+            ):
+                return True
+            # The deferred build can be triggered from module level, where the stack is shallower than pydantic assumes.
+            if _parent_namespace_depth > 0:
+                try:
+                    sys._getframe(_parent_namespace_depth - 1)
+                    _parent_namespace_depth += 1
+                except ValueError:
+                    _parent_namespace_depth = 0
+            rebuilt = super().model_rebuild(
+                force=force,
+                raise_errors=raise_errors,
+                _parent_namespace_depth=_parent_namespace_depth,
+                _types_namespace=_types_namespace,
+            )
+            if rebuilt:
+                schema_cache.store_schema(cls)
+            return rebuilt
+
+    @classmethod
+    def model_validate(cls, obj: Any, *args: Any, **kwargs: Any) -> Self:
+        model = super().model_validate(obj, *args, **kwargs)
+        pool = interning.interning_pool()
+        return model if pool is None else pool.intern(model)
+
+    @classmethod
+    def model_validate_json(
+        cls, json_data: Union[str, bytes, bytearray], *args: Any, **kwargs: Any
+    ) -> Self:
+        model = super().model_validate_json(json_data, *args, **kwargs)
+        pool = interning.interning_pool()
+        return model if pool is None else pool.intern(model)
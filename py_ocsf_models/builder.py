@@ -0,0 +1,109 @@
+from collections import OrderedDict
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Annotated, Any, Generic, Optional, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+from py_ocsf_models.frozen import freeze, model_class
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+DEFAULT_VARIANT_CACHE_SIZE = 1024
+
+
+class FindingBuilder(Generic[ModelT]):
+    """
+    The Finding Builder stamps out events of one class that share the same validated template sub-objects.
+
+    Templates are the field values that are identical for every event of a scan, such as the `metadata`, `cloud`, `category_uid` or `class_uid` of a Detection Finding. They are validated once, when the builder is created, and frozen: every model in them is replaced by a frozen copy, so they can be referenced by every event built instead of being constructed and validated again for each of them. Assigning to a field of a shared template, e.g. `finding.metadata.product.name = "Other"`, raises a ValidationError instead of silently changing every other event.
+
+    Fields that differ between templates are changed with copy-on-write overrides: `build(overrides={"cloud.region": "us-east-1"})` copies the `cloud` template with its new region and keeps sharing its `account`. The most recently used variants are kept when every override value is hashable, so all the events of the same account and region share one Cloud object as well.
+
+    Attributes:
+    - Class (cls) [Required]: The event class to build.
+    - Templates (templates) [Required]: The validated and frozen template values, by field name.
+    - Variant Cache Size (variant_cache_size) [Optional]: The number of overridden templates kept for reuse.
+    """
+
+    def __init__(
+        self,
+        cls: type[ModelT],
+        variant_cache_size: int = DEFAULT_VARIANT_CACHE_SIZE,
+        **templates: Any,
+    ) -> None:
+        self.cls = cls
+        self.variant_cache_size = variant_cache_size
+        self.templates = {
+            name: freeze(_field_adapter(cls, name).validate_python(value))
+            for name, value in templates.items()
+        }
+        self._variants: OrderedDict[Any, Any] = OrderedDict()
+
+    def build(
+        self, overrides: Optional[Mapping[str, Any]] = None, **fields: Any
+    ) -> ModelT:
+        """
+        Validate the given fields and return a new event referencing the shared templates.
+
+        Fields passed by name replace whole templates. `overrides` maps dotted paths within templates, e.g. `cloud.region`, to new values, which are validated and applied to a copy of the template.
+        """
+        values = dict(self.templates)
+        if overrides:
+            values.update(self._override(overrides))
+        values.update(fields)
+        return self.cls.model_validate(values)
+
+    def _override(self, overrides: Mapping[str, Any]) -> dict[str, Any]:
+        paths: dict[str, list[tuple[list[str], Any]]] = {}
+        for path, value in overrides.items():
+            name, *rest = path.split(".")
+            if name not in self.templates:
+                raise ValueError(f"{path} does not point into a template")
+            if not rest:
+                raise ValueError(f"{path} replaces a whole template, pass it by name")
+            paths.setdefault(name, []).append((rest, value))
+        variants = {}
+        for name, changes in paths.items():
+            key: Any = (name, tuple((tuple(rest), value) for rest, value in changes))
+            try:
+                variant = self._variants.get(key)
+            except TypeError:
+                key = None
+                variant = None
+            if variant is None:
+                variant = self.templates[name]
+                for rest, value in changes:
+                    variant = _replace(variant, rest, value)
+                if key is not None and self.variant_cache_size > 0:
+                    self._variants[key] = variant
+                    if len(self._variants) > self.variant_cache_size:
+                        self._variants.popitem(last=False)
+            elif key is not None:
+                self._variants.move_to_end(key)
+            variants[name] = variant
+        return variants
+
+
+def _replace(model: BaseModel, path: list[str], value: Any) -> BaseModel:
+    name, *rest = path
+    cls = model_class(type(model))
+    if name not in cls.model_fields:
+        raise ValueError(f"{cls.__name__} has no field {name}")
+    if rest:
+        current = getattr(model, name)
+        if not isinstance(current, BaseModel):
+            raise ValueError(f"{cls.__name__}.{name} is not a model")
+        replaced = _replace(current, rest, value)
+    else:
+        replaced = freeze(_field_adapter(cls, name).validate_python(value))
+    return model.model_copy(update={name: replaced})
+
+
+@lru_cache(maxsize=None)
+def _field_adapter(cls: type[BaseModel], name: str) -> TypeAdapter[Any]:
+    field = cls.model_fields.get(name)
+    if field is None:
+        raise ValueError(f"{cls.__name__} has no field {name}")
+    annotation: Any = Annotated[field.annotation, field]
+    return TypeAdapter(annotation)
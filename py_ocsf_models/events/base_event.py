@@ -1,7 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.events.findings.severity_id import SeverityID
 from py_ocsf_models.events.findings.status_id import StatusID
 from py_ocsf_models.objects.enrichment import Enrichment
@@ -9,7 +8,7 @@ from py_ocsf_models.objects.metadata import Metadata
 from py_ocsf_models.objects.observable import Observable
 
 
-class BaseEvent(BaseModel):
+class BaseEvent(OCSFBaseModel):
     """
     The base event is a generic and concrete event. It also defines a set of attributes available in most event classes. As a generic event that does not belong to any event category, it could be used to log events that are not otherwise defined by the schema.
 
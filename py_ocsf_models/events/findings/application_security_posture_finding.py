@@ -1,8 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.events.findings.application_security_posture_finding_type_id import (
     ApplicationSecurityPostureFindingTypeID,
 )
@@ -17,7 +16,7 @@ from py_ocsf_models.objects.resource_details import ResourceDetails
 from py_ocsf_models.objects.vulnerability_details import VulnerabilityDetails
 
 
-class ApplicationSecurityPostureFinding(Finding, BaseModel):
+class ApplicationSecurityPostureFinding(Finding, OCSFBaseModel):
     """
     The Application Security Posture Finding event is a notification about any bug, defect, deficiency, exploit, vulnerability, weakness or any other issue with software and related systems. Application Security Posture Findings typically involve reporting on the greater context including compliance, impacted resources, remediation guidance, specific code defects, and/or vulnerability metadata. Application Security Posture Findings can be reported by Threat & Vulnerability Management (TVM) tools, Application Security Posture Management (ASPM) tools, or other similar tools. Note: if the event producer is a security control, the security_control profile should be applied and its attacks information, if present, should be duplicated into the finding_info object.
 
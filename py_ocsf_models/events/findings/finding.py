@@ -1,15 +1,14 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.events.base_event import BaseEvent
 from py_ocsf_models.events.findings.activity_id import ActivityID
 from py_ocsf_models.events.findings.confidence_id import ConfidenceID
 from py_ocsf_models.objects.finding_info import FindingInformation
 
 
-class Finding(BaseEvent, BaseModel):
+class Finding(BaseEvent, OCSFBaseModel):
     """
     The Finding event is a generic event that defines a set of attributes available in the Findings category.
 
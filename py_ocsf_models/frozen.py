@@ -0,0 +1,229 @@
+"""
+Frozen, hashable variants of the OCSF object models.
+
+The variant of every object model is generated from it on first use and can be imported as `Frozen<Name>`, e.g. `from py_ocsf_models.frozen import FrozenAccount`. `freeze` turns a validated model, and every model nested in it, into its frozen variant.
+"""
+
+import importlib
+from typing import Any, NoReturn, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from py_ocsf_models._synchronized import synchronized_cache
+
+FROZEN_PREFIX = "Frozen"
+
+_new_object = object.__new__
+_set_attribute = object.__setattr__
+
+_HASH_SLOT = "__ocsf_hash__"
+
+_OBJECTS_PACKAGE = "py_ocsf_models.objects."
+
+# Maps every frozen variant back to the model class it was derived from.
+_origins: dict[type[BaseModel], type[BaseModel]] = {}
+
+
+def freeze(value: Any) -> Any:
+    """
+    Return a frozen copy of a validated model and of every model nested in it.
+
+    Frozen copies are instances of a frozen subclass of their model class, so they validate, serialize and compare equal like the original model, but assigning to their fields raises a ValidationError. Their lists and dicts are copied into read-only subclasses that raise a TypeError when changed, which makes every frozen copy hashable. Values that are not models, lists or dicts are returned as they are.
+    """
+    if isinstance(value, BaseModel):
+        cls = type(value)
+        if cls in _origins:
+            return value
+        frozen = _new_object(frozen_class(cls))
+        _set_attribute(
+            frozen,
+            "__dict__",
+            {name: freeze(field) for name, field in value.__dict__.items()},
+        )
+        _set_attribute(
+            frozen, "__pydantic_fields_set__", set(value.__pydantic_fields_set__)
+        )
+        _set_attribute(frozen, "__pydantic_extra__", freeze(value.__pydantic_extra__))
+        _set_attribute(frozen, "__pydantic_private__", value.__pydantic_private__)
+        _set_attribute(frozen, _HASH_SLOT, None)
+        return frozen
+    if isinstance(value, list):
+        if type(value) is _FrozenList:
+            return value
+        return _FrozenList(freeze(item) for item in value)
+    if isinstance(value, dict):
+        if type(value) is _FrozenDict:
+            return value
+        return _FrozenDict((key, freeze(item)) for key, item in value.items())
+    return value
+
+
+@synchronized_cache
+def frozen_class(cls: type[BaseModel]) -> type[BaseModel]:
+    """
+    Return the frozen variant of a model class, generating it on first use.
+
+    The variant is a subclass of the model with the same fields and a frozen configuration. Its instances compare equal to the instances of the model holding the same values, and their hash is computed once and cached.
+    """
+    if cls in _origins:
+        return cls
+    name = f"{FROZEN_PREFIX}{cls.__name__}"
+    frozen_cls = type(
+        name,
+        (cls,),
+        {
+            "__module__": __name__,
+            "__qualname__": name,
+            "__doc__": cls.__doc__,
+            "__slots__": (_HASH_SLOT,),
+            "model_config": ConfigDict(frozen=True),
+            "__eq__": _frozen_eq,
+            "__hash__": _frozen_hash,
+            "__reduce__": _frozen_reduce,
+            "model_copy": _frozen_model_copy,
+            "model_post_init": _frozen_post_init,
+        },
+    )
+    _origins[frozen_cls] = cls
+    return frozen_cls
+
+
+def is_frozen(value: Any) -> bool:
+    """Return whether a value is a frozen copy returned by `freeze`."""
+    return type(value) in _origins
+
+
+def model_class(cls: type[BaseModel]) -> type[BaseModel]:
+    """Return the model class a frozen variant was derived from, or the class itself."""
+    return _origins.get(cls, cls)
+
+
+def __getattr__(name: str) -> type[BaseModel]:
+    model = (
+        _object_model(name.removeprefix(FROZEN_PREFIX))
+        if name.startswith(FROZEN_PREFIX)
+        else None
+    )
+    if model is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    frozen_cls = frozen_class(model)
+    globals()[name] = frozen_cls
+    return frozen_cls
+
+
+def __dir__() -> list[str]:
+    from py_ocsf_models import _LAZY_EXPORTS
+
+    frozen_names = [
+        f"{FROZEN_PREFIX}{name}"
+        for name, module in _LAZY_EXPORTS.items()
+        if module.startswith(_OBJECTS_PACKAGE) and _object_model(name) is not None
+    ]
+    return sorted([*globals(), *frozen_names])
+
+
+def _object_model(name: str) -> Optional[type[BaseModel]]:
+    from py_ocsf_models import _LAZY_EXPORTS
+
+    module = _LAZY_EXPORTS.get(name)
+    if module is None or not module.startswith(_OBJECTS_PACKAGE):
+        return None
+    # Object modules export their enums too, which have no frozen variant.
+    model = getattr(importlib.import_module(module), name)
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        return model
+    return None
+
+
+class _FrozenList(list[Any]):
+    """A list that raises a TypeError when changed and can therefore be hashed."""
+
+    __slots__ = ()
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(tuple(self))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _FrozenList, (list(self),)
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("frozen lists cannot be changed")
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _immutable
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+
+
+class _FrozenDict(dict[Any, Any]):
+    """A dict that raises a TypeError when changed and can therefore be hashed."""
+
+    __slots__ = ()
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _FrozenDict, (dict(self),)
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("frozen dicts cannot be changed")
+
+    update = setdefault = pop = popitem = clear = _immutable
+    __setitem__ = __delitem__ = __ior__ = _immutable
+
+
+def _thaw(frozen: BaseModel) -> BaseModel:
+    model = _new_object(_origins[type(frozen)])
+    _set_attribute(model, "__dict__", dict(frozen.__dict__))
+    _set_attribute(
+        model, "__pydantic_fields_set__", set(frozen.__pydantic_fields_set__)
+    )
+    _set_attribute(model, "__pydantic_extra__", frozen.__pydantic_extra__)
+    _set_attribute(model, "__pydantic_private__", frozen.__pydantic_private__)
+    return model
+
+
+def _frozen_eq(self: BaseModel, other: Any) -> Any:
+    if self is other:
+        return True
+    if type(other) not in _origins and not isinstance(other, BaseModel):
+        return NotImplemented
+    return (
+        self.__dict__ == other.__dict__
+        and _origins.get(type(self), type(self))
+        is _origins.get(type(other), type(other))
+        and self.__pydantic_extra__ == other.__pydantic_extra__
+        and self.__pydantic_private__ == other.__pydantic_private__
+    )
+
+
+def _frozen_hash(self: BaseModel) -> int:
+    # The slot is unset on copies made by pydantic, e.g. with copy.deepcopy.
+    cached: Optional[int] = getattr(self, _HASH_SLOT, None)
+    if cached is None:
+        cached = hash((_origins[type(self)], tuple(self.__dict__.values())))
+        _set_attribute(self, _HASH_SLOT, cached)
+    return cached
+
+
+def _frozen_post_init(self: BaseModel, context: Any) -> None:
+    # Validated values are plain models, lists and dicts, which are frozen in place.
+    values = self.__dict__
+    for name, value in values.items():
+        values[name] = freeze(value)
+    _set_attribute(self, _HASH_SLOT, None)
+
+
+def _frozen_model_copy(
+    self: BaseModel, *, update: Optional[dict[str, Any]] = None, deep: bool = False
+) -> BaseModel:
+    # Updated values are frozen too so the copy stays hashable.
+    if update:
+        update = {name: freeze(value) for name, value in update.items()}
+    copied = BaseModel.model_copy(self, update=update, deep=deep)
+    _set_attribute(copied, _HASH_SLOT, None)
+    return copied
+
+
+def _frozen_reduce(self: BaseModel) -> tuple[Any, ...]:
+    # Frozen variants are pickled as their origin model and frozen again, which works for variants that cannot be found by name too.
+    return freeze, (_thaw(self),)
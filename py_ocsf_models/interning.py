@@ -0,0 +1,224 @@
+import threading
+import types
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, Optional, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from py_ocsf_models.frozen import freeze, is_frozen, model_class
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+DEFAULT_MAX_SIZE = 65_536
+
+_SCALAR_TYPES = (str, int, float, Enum, type(None))
+
+_active_pool: ContextVar[Optional["InterningPool"]] = ContextVar(
+    "py_ocsf_models_interning_pool", default=None
+)
+
+
+class InterningPool:
+    """
+    The Interning Pool replaces equal nested objects of validated models with one shared frozen instance.
+
+    Findings read from large files repeat the same Product, Feature, Account, Organization and Group objects thousands of times. Interning a model keeps a single frozen copy of each distinct object and makes every model containing an equal object reference that copy instead, so the duplicates can be freed. Objects are equal when they have the same class, field values and set fields, so interning never changes how a model serializes. Shared objects are frozen, so assigning to one of their fields raises a ValidationError instead of changing every model referencing it.
+
+    The pool keeps the most recently used distinct objects only, so memory stays bounded on unbounded streams. A pool can be shared by threads, which inherit the active pool of the thread starting them on free-threaded interpreters.
+
+    Attributes:
+    - Classes (classes) [Optional]: The model classes whose instances are interned, Account, Feature, Group, Organization and Product by default.
+    - Max Size (max_size) [Optional]: The number of distinct objects kept in the pool.
+    - Hits (hits): The number of objects replaced by a shared instance so far.
+    - Misses (misses): The number of objects added to the pool so far.
+    """
+
+    def __init__(
+        self,
+        classes: Optional[Iterable[type[BaseModel]]] = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        if classes is None:
+            from py_ocsf_models.objects.account import Account
+            from py_ocsf_models.objects.group import Group
+            from py_ocsf_models.objects.organization import Organization
+            from py_ocsf_models.objects.product import Feature, Product
+
+            classes = (Account, Feature, Group, Organization, Product)
+        self.classes = frozenset(classes)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._objects: OrderedDict[Any, BaseModel] = OrderedDict()
+        self._interned_fields: dict[type[BaseModel], tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def intern(self, model: ModelT) -> ModelT:
+        """
+        Intern the objects nested in a model, in place, and return the model.
+
+        When the model is itself an instance of an interned class, its shared instance is returned instead.
+        """
+        interned: ModelT = self._visit(model)
+        return interned
+
+    def clear(self) -> None:
+        """Drop every object of the pool."""
+        with self._lock:
+            self._objects.clear()
+
+    def _visit(self, value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            cls = type(value)
+            if is_frozen(value):
+                # Frozen objects are already shared, e.g. interned or built from templates.
+                return value
+            values = value.__dict__
+            for name in self._fields_to_visit(cls):
+                field = values[name]
+                if field is not None:
+                    values[name] = self._visit(field)
+            if cls in self.classes:
+                return self._shared(value)
+            return value
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                value[index] = self._visit(item)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                value[key] = self._visit(item)
+        return value
+
+    def _shared(self, model: BaseModel) -> BaseModel:
+        key = _key(model)
+        with self._lock:
+            shared = self._objects.get(key)
+            if shared is not None:
+                self._objects.move_to_end(key)
+                self.hits += 1
+                return shared
+            frozen: BaseModel = freeze(model)
+            self._objects[key] = frozen
+            self.misses += 1
+            if len(self._objects) > self.max_size:
+                self._objects.popitem(last=False)
+            return frozen
+
+    def _fields_to_visit(self, cls: type[BaseModel]) -> tuple[str, ...]:
+        fields = self._interned_fields.get(cls)
+        if fields is None:
+            reachable = _reachable_classes(cls, self.classes)
+            for model_cls, model_fields in reachable.items():
+                self._interned_fields.setdefault(model_cls, model_fields)
+            fields = self._interned_fields[cls]
+        return fields
+
+
+def interning_pool() -> Optional[InterningPool]:
+    """Return the Interning Pool used by `model_validate` and `model_validate_json` in the current context, if any."""
+    return _active_pool.get()
+
+
+@contextmanager
+def interning(pool: Optional[InterningPool] = None) -> Iterator[InterningPool]:
+    """
+    Intern the nested objects of every event and object validated with `model_validate` or `model_validate_json` within the block.
+
+    A new Interning Pool is created unless one is given, so objects can also be shared across several blocks. Models built by calling their class directly are not interned.
+    """
+    if pool is None:
+        pool = InterningPool()
+    token = _active_pool.set(pool)
+    try:
+        yield pool
+    finally:
+        _active_pool.reset(token)
+
+
+class _Identity:
+    # Shared objects are keyed by identity, which is exact and keeps them alive while a key refers to them.
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _Identity) and other.value is self.value
+
+
+def _key(model: BaseModel) -> Any:
+    values = tuple(model.__dict__.values())
+    for value in values:
+        if not isinstance(value, _SCALAR_TYPES):
+            values = tuple(_value_key(value) for value in values)
+            break
+    return (
+        model_class(type(model)),
+        frozenset(model.__pydantic_fields_set__),
+        values,
+    )
+
+
+def _value_key(value: Any) -> Any:
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    if isinstance(value, BaseModel):
+        return _Identity(value) if is_frozen(value) else _key(value)
+    if isinstance(value, list):
+        return tuple(_value_key(item) for item in value)
+    if isinstance(value, dict):
+        return tuple((key, _value_key(item)) for key, item in value.items())
+    return value
+
+
+def _reachable_classes(
+    root: type[BaseModel], classes: frozenset[type[BaseModel]]
+) -> dict[type[BaseModel], tuple[str, ...]]:
+    # Collect the model graph below the root, then find the fields leading to an interned class with a fixpoint, which also settles recursive models.
+    graph: dict[type[BaseModel], dict[str, set[type[BaseModel]]]] = {}
+    pending = [root]
+    while pending:
+        cls = pending.pop()
+        if cls in graph:
+            continue
+        graph[cls] = {}
+        for name, field in cls.model_fields.items():
+            children = set(_model_classes(field.annotation))
+            if children:
+                graph[cls][name] = children
+                pending.extend(children)
+    reaching = set(classes)
+    changed = True
+    while changed:
+        changed = False
+        for cls, fields in graph.items():
+            if cls not in reaching and any(
+                children & reaching for children in fields.values()
+            ):
+                reaching.add(cls)
+                changed = True
+    return {
+        cls: tuple(name for name, children in fields.items() if children & reaching)
+        for cls, fields in graph.items()
+    }
+
+
+def _model_classes(annotation: Any) -> Iterator[type[BaseModel]]:
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType or origin in (list, dict):
+        for argument in get_args(annotation):
+            yield from _model_classes(argument)
+    elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        yield annotation
@@ -0,0 +1,139 @@
+import types
+from datetime import datetime
+from enum import IntEnum
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from py_ocsf_models import OCSF_VERSION
+
+try:
+    import pyarrow as pa
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        "The Arrow support of py-ocsf-models needs pyarrow, install it with `pip install py-ocsf-models[arrow]`"
+    ) from error
+
+Converter = Callable[[Any], Any]
+
+_Column = tuple[Any, bool, Optional[Converter], Optional[dict[bytes, bytes]]]
+
+ENCODING_METADATA_KEY = b"encoding"
+JSON_ENCODING = b"json"
+CLASS_METADATA_KEY = b"py_ocsf_models.class"
+VERSION_METADATA_KEY = b"ocsf.version"
+
+_JSON_METADATA = {ENCODING_METADATA_KEY: JSON_ENCODING}
+
+
+def arrow_schema(cls: type[BaseModel]) -> Any:
+    """
+    Return the Arrow schema of an OCSF model, derived from its fields.
+
+    Nested models become structs and lists become list columns, so the nesting of the JSON representation is kept. Enums are stored as 32-bit integers, datetimes as UTC timestamps and fields that hold arbitrary objects as JSON strings flagged with the `encoding: json` field metadata. Fields are only non-nullable when the model requires them.
+    """
+    return _model_plan(cls)[0]
+
+
+def to_record_batch(events: Iterable[BaseModel], cls: type[BaseModel]) -> Any:
+    """Convert models of the given class into an Arrow record batch with the schema returned by `arrow_schema`."""
+    schema, converter = _model_plan(cls)
+    serializer = cls.__pydantic_serializer__
+    rows = [serializer.to_python(event) for event in events]
+    if converter is not None:
+        for row in rows:
+            converter(row)
+    return pa.RecordBatch.from_pylist(rows, schema=schema)
+
+
+@lru_cache(maxsize=None)
+def _model_plan(cls: type[BaseModel]) -> tuple[Any, Optional[Converter]]:
+    fields, converter = _struct_fields(cls, frozenset())
+    schema = pa.schema(
+        fields,
+        metadata={
+            CLASS_METADATA_KEY: f"{cls.__module__}.{cls.__qualname__}".encode(),
+            VERSION_METADATA_KEY: OCSF_VERSION.encode(),
+        },
+    )
+    return schema, converter
+
+
+def _struct_fields(
+    cls: type[BaseModel], ancestors: frozenset[type[BaseModel]]
+) -> tuple[list[Any], Optional[Converter]]:
+    fields = []
+    converters = []
+    for name, field in cls.model_fields.items():
+        data_type, nullable, converter, metadata = _column(
+            field.annotation, ancestors | {cls}
+        )
+        fields.append(pa.field(name, data_type, nullable=nullable, metadata=metadata))
+        if converter is not None:
+            converters.append((name, converter))
+    if not converters:
+        return fields, None
+
+    def convert(values: dict[str, Any]) -> dict[str, Any]:
+        for name, converter in converters:
+            value = values.get(name)
+            if value is not None:
+                values[name] = converter(value)
+        return values
+
+    return fields, convert
+
+
+def _column(annotation: Any, ancestors: frozenset[type[BaseModel]]) -> _Column:
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(members) != 1:
+            return pa.string(), True, _encode_json, _JSON_METADATA
+        data_type, _, converter, metadata = _column(members[0], ancestors)
+        return data_type, True, converter, metadata
+    if origin is list:
+        (item_annotation,) = get_args(annotation) or (Any,)
+        item_type, _, item_converter, item_metadata = _column(
+            item_annotation, ancestors
+        )
+        data_type = pa.list_(pa.field("item", item_type, metadata=item_metadata))
+        if item_converter is None:
+            return data_type, False, None, None
+        return (
+            data_type,
+            False,
+            lambda values: [
+                None if value is None else item_converter(value) for value in values
+            ],
+            None,
+        )
+    if not isinstance(annotation, type) or annotation is object:
+        return pa.string(), False, _encode_json, _JSON_METADATA
+    if issubclass(annotation, BaseModel):
+        # Recursive models cannot be represented as Arrow structs.
+        if annotation in ancestors:
+            return pa.string(), False, _encode_json, _JSON_METADATA
+        fields, converter = _struct_fields(annotation, ancestors)
+        return pa.struct(fields), False, converter, None
+    if issubclass(annotation, dict):
+        return pa.string(), False, _encode_json, _JSON_METADATA
+    if issubclass(annotation, bool):
+        return pa.bool_(), False, None, None
+    if issubclass(annotation, IntEnum):
+        return pa.int32(), False, None, None
+    if issubclass(annotation, int):
+        return pa.int64(), False, None, None
+    if issubclass(annotation, float):
+        return pa.float64(), False, None, None
+    if issubclass(annotation, datetime):
+        return pa.timestamp("us", tz="UTC"), False, None, None
+    if issubclass(annotation, str):
+        return pa.string(), False, None, None
+    return pa.string(), False, str, None
+
+
+def _encode_json(value: Any) -> str:
+    return to_json(value).decode()
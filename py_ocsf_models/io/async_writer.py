@@ -0,0 +1,219 @@
+import asyncio
+import contextlib
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from types import TracebackType
+from typing import AsyncIterable, BinaryIO, Iterable, Optional, Union
+
+from py_ocsf_models.events.base_event import BaseEvent
+
+DEFAULT_MAX_QUEUE_SIZE = 4096
+DEFAULT_BATCH_SIZE = 64
+
+
+class AsyncFindingWriter(ABC):
+    """
+    The Async Finding Writer is the base of the sinks that write findings as newline-delimited JSON from an asyncio event loop.
+
+    Written findings are put in a bounded queue that a background task drains in batches. Every batch is serialized in an executor, a worker thread of the loop by default, so the loop never blocks on `model_dump_json`. Then it is handed to the sink. Once the queue is full, `write` waits until the sink catches up, which applies backpressure to the producers.
+
+    A failure to serialize or write a batch is raised by the next call to `write`, `flush` or `close`. The findings queued after it are dropped.
+
+    Attributes:
+    - Max Queue Size (max_queue_size) [Optional]: The number of findings queued before `write` waits.
+    - Batch Size (batch_size) [Optional]: The largest number of findings serialized at a time.
+    - Executor (executor) [Optional]: The executor serializing the batches, the default executor of the loop when missing. Findings are pickled when it is a process pool.
+    - Exclude Unset (exclude_unset) [Optional]: Whether fields that were not explicitly set are left out of the output.
+    - Count (count): The number of findings written to the sink so far.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        executor: Optional[Executor] = None,
+        exclude_unset: bool = True,
+    ) -> None:
+        if max_queue_size <= 0:
+            raise ValueError("max_queue_size must be a positive number of findings")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive number of findings")
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.executor = executor
+        self.exclude_unset = exclude_unset
+        self.count = 0
+        self._queue: Optional[asyncio.Queue[BaseEvent]] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+    async def write(self, finding: BaseEvent) -> None:
+        """Queue a finding, waiting while the queue is full."""
+        self._check()
+        if self._queue is None:
+            # The queue and the task belong to the loop of the first write.
+            self._queue = asyncio.Queue(self.max_queue_size)
+            self._task = asyncio.get_running_loop().create_task(
+                self._drain(self._queue)
+            )
+        await self._queue.put(finding)
+
+    async def write_many(
+        self, findings: Union[Iterable[BaseEvent], AsyncIterable[BaseEvent]]
+    ) -> int:
+        """Queue every finding of a synchronous or asynchronous iterable and return how many were queued."""
+        written = 0
+        if isinstance(findings, AsyncIterable):
+            async for finding in findings:
+                await self.write(finding)
+                written += 1
+        else:
+            for finding in findings:
+                await self.write(finding)
+                written += 1
+        return written
+
+    async def flush(self) -> None:
+        """Wait until every queued finding has been written to the sink."""
+        if self._queue is not None:
+            await self._queue.join()
+        self._check()
+
+    async def close(self) -> None:
+        """Write the queued findings and close the sink."""
+        await self._shutdown(check=True)
+
+    async def __aenter__(self) -> "AsyncFindingWriter":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        # A failure of the sink is not raised over the exception of the body.
+        await self._shutdown(check=exc_type is None)
+
+    async def _shutdown(self, check: bool) -> None:
+        if self._closed:
+            return
+        try:
+            if self._queue is not None:
+                await self._queue.join()
+            if check:
+                self._check()
+        finally:
+            self._closed = True
+            if self._task is not None:
+                self._task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._task
+            await self._close()
+
+    @abstractmethod
+    async def _write(self, data: bytes) -> None:
+        """Write a batch of newline-delimited JSON to the sink."""
+
+    async def _close(self) -> None:
+        """Release the resources of the sink."""
+
+    def _check(self) -> None:
+        if self._error is not None:
+            raise self._error
+        if self._closed:
+            raise ValueError("The writer is closed")
+
+    async def _drain(self, queue: "asyncio.Queue[BaseEvent]") -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                if self._error is None:
+                    data = await loop.run_in_executor(
+                        self.executor, _serialize, batch, self.exclude_unset
+                    )
+                    await self._write(data)
+                    self.count += len(batch)
+            except Exception as error:
+                self._error = error
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+
+class AsyncFileWriter(AsyncFindingWriter):
+    """
+    The Async File Writer writes findings as newline-delimited JSON to a file, from a worker thread so the loop never blocks on disk. A path is opened when entering the writer or writing the first batch.
+
+    Attributes:
+    - Destination (destination) [Required]: The path of the file, which is created or truncated, or an open binary stream, which is left open.
+    """
+
+    def __init__(
+        self,
+        destination: Union[str, "os.PathLike[str]", BinaryIO],
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        executor: Optional[Executor] = None,
+        exclude_unset: bool = True,
+    ) -> None:
+        super().__init__(max_queue_size, batch_size, executor, exclude_unset)
+        self.destination = destination
+        self._file: Optional[BinaryIO] = None
+
+    async def __aenter__(self) -> "AsyncFileWriter":
+        await self._open()
+        return self
+
+    async def _open(self) -> BinaryIO:
+        destination = self.destination
+        if not isinstance(destination, (str, os.PathLike)):
+            return destination
+        if self._file is None:
+            self._file = await asyncio.to_thread(open, destination, "wb")
+        return self._file
+
+    async def _write(self, data: bytes) -> None:
+        stream = await self._open()
+        await asyncio.to_thread(stream.write, data)
+
+    async def _close(self) -> None:
+        # The file is created even when no finding was written.
+        stream = await self._open()
+        await asyncio.to_thread(stream.close if stream is self._file else stream.flush)
+
+
+class AsyncMemoryWriter(AsyncFindingWriter):
+    """The Async Memory Writer keeps the newline-delimited JSON of the findings in memory, e.g. for tests or to upload small batches."""
+
+    def __init__(
+        self,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        executor: Optional[Executor] = None,
+        exclude_unset: bool = True,
+    ) -> None:
+        super().__init__(max_queue_size, batch_size, executor, exclude_unset)
+        self._buffer = bytearray()
+
+    def getvalue(self) -> bytes:
+        """Return the findings written so far."""
+        return bytes(self._buffer)
+
+    async def _write(self, data: bytes) -> None:
+        self._buffer += data
+
+
+def _serialize(batch: list[BaseEvent], exclude_unset: bool) -> bytes:
+    output = bytearray()
+    for finding in batch:
+        output += finding.__pydantic_serializer__.to_json(
+            finding, exclude_unset=exclude_unset
+        )
+        output += b"\n"
+    return bytes(output)
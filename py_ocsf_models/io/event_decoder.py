@@ -0,0 +1,110 @@
+from enum import IntEnum
+from functools import lru_cache
+from typing import Annotated, Any, Iterable, Iterator, Mapping, Union, cast
+
+from pydantic import ConfigDict, GetCoreSchemaHandler, TypeAdapter
+from pydantic_core import CoreSchema, core_schema
+
+from py_ocsf_models.events.base_event import BaseEvent
+from py_ocsf_models.events.findings.application_security_posture_finding import (
+    ApplicationSecurityPostureFinding,
+)
+from py_ocsf_models.events.findings.class_uid import ClassUID
+from py_ocsf_models.events.findings.compliance_finding import ComplianceFinding
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+
+FINDING_CLASSES: Mapping[int, type[BaseEvent]] = {
+    ClassUID.ComplianceFinding: ComplianceFinding,
+    ClassUID.DetectionFinding: DetectionFinding,
+    ClassUID.ApplicationSecurityPostureFinding: ApplicationSecurityPostureFinding,
+}
+
+# The tag of an event is its class_uid, or its type_uid when the class_uid is left out.
+_DISCRIMINATOR: list[list[Union[str, int]]] = [["class_uid"], ["type_uid"]]
+
+SerializedEvent = Union[str, bytes, bytearray, Mapping[str, Any]]
+
+
+@lru_cache(maxsize=None)
+def event_adapter(
+    classes: tuple[type[BaseEvent], ...] = tuple(FINDING_CLASSES.values()),
+) -> TypeAdapter[BaseEvent]:
+    """
+    Return the TypeAdapter validating events of any of the given classes, built once per tuple of classes.
+
+    The adapter validates a discriminated union: the class of every event is looked up from its `class_uid`, or from its `type_uid` when the `class_uid` is left out, before the event is validated, so each event is validated once as the right class instead of being tried against each class in turn. Every class must declare the default of its `class_uid`, and the members of its `type_uid` enum if it has one, and no two classes may share any of these values.
+    """
+    choices: dict[int, type[BaseEvent]] = {}
+    for cls in classes:
+        for tag in _tags(cls):
+            if choices.setdefault(tag, cls) is not cls:
+                raise ValueError(
+                    f"{cls.__name__} and {choices[tag].__name__} share the tag {tag}"
+                )
+    # A title replaces the name of the union, which lists every class once per tag, in validation errors.
+    adapter = TypeAdapter(
+        Annotated[Any, _EventUnion(classes, choices)], config=ConfigDict(title="Event")
+    )
+    return cast("TypeAdapter[BaseEvent]", adapter)
+
+
+def decode_event(
+    data: SerializedEvent,
+    classes: tuple[type[BaseEvent], ...] = tuple(FINDING_CLASSES.values()),
+) -> BaseEvent:
+    """Validate a single event given as JSON text or as a decoded dictionary, as the class matching its class_uid."""
+    adapter = event_adapter(classes)
+    if isinstance(data, (str, bytes, bytearray)):
+        return adapter.validate_json(data)
+    return adapter.validate_python(data)
+
+
+def decode_events(
+    lines: Iterable[Union[str, bytes]],
+    classes: tuple[type[BaseEvent], ...] = tuple(FINDING_CLASSES.values()),
+) -> Iterator[BaseEvent]:
+    """Validate the events of a newline-delimited JSON stream, such as an open binary file, skipping blank lines."""
+    validate_json = event_adapter(classes).validate_json
+    for line in lines:
+        if line.strip():
+            yield validate_json(line)
+
+
+class _EventUnion:
+    # Replaces the schema of BaseEvent with the union of the event classes, tagged by class_uid and type_uid.
+    def __init__(
+        self,
+        classes: tuple[type[BaseEvent], ...],
+        choices: Mapping[int, type[BaseEvent]],
+    ) -> None:
+        self.classes = classes
+        self.choices = choices
+
+    def __get_pydantic_core_schema__(
+        self, source: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        # Classes repeated under several tags are generated once and referenced.
+        schemas = {cls: handler.generate_schema(cls) for cls in self.classes}
+        class_uids = ", ".join(str(_class_uid(cls)) for cls in self.classes)
+        return core_schema.tagged_union_schema(
+            {tag: schemas[cls] for tag, cls in self.choices.items()},
+            _DISCRIMINATOR,
+            custom_error_type="event_class",
+            custom_error_message=f"Expected an event with the class_uid or type_uid of class {class_uids}",
+        )
+
+
+def _class_uid(cls: type[BaseEvent]) -> int:
+    field = cls.model_fields.get("class_uid")
+    if field is None or not isinstance(field.default, int):
+        raise ValueError(f"{cls.__name__} does not declare the default of class_uid")
+    return int(field.default)
+
+
+def _tags(cls: type[BaseEvent]) -> list[int]:
+    tags = [_class_uid(cls)]
+    field = cls.model_fields.get("type_uid")
+    type_ids = field.annotation if field is not None else None
+    if isinstance(type_ids, type) and issubclass(type_ids, IntEnum):
+        tags.extend(int(type_id) for type_id in type_ids)
+    return tags
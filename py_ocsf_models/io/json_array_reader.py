@@ -0,0 +1,238 @@
+import os
+import re
+from types import TracebackType
+from typing import Any, BinaryIO, Iterator, Mapping, Optional, Union
+
+from pydantic import ValidationError
+
+from py_ocsf_models.events.base_event import BaseEvent
+from py_ocsf_models.io.event_decoder import FINDING_CLASSES, event_adapter
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# A whole string, escaped quotes included.
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_TOKEN = re.compile(_STRING.pattern + rb"|[\[\]{}]", re.DOTALL)
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+# A closing brace followed by the end of an array or by a comma and anything but the key of an object field, which ends the event when its brackets are balanced.
+_CANDIDATE_END = re.compile(rb'\}[ \t\r\n]*(?:\]|,[ \t\r\n]*[^" \t\r\n])')
+_BYTE_ORDER_MARK = b"\xef\xbb\xbf"
+_NOT_BRACKETS = bytes(byte for byte in range(256) if byte not in b"[]{}")
+_NOT_STRUCTURE = bytes(byte for byte in range(256) if byte not in b'"\\[]{}')
+_OPENING = frozenset(b"[{")
+_QUOTE = ord('"')
+
+
+class JSONArrayReader:
+    """
+    The JSON Array Reader reads the OCSF events of a JSON array, such as a Security Lake export or a Prowler output, one event at a time.
+
+    The file is read in chunks and only the bytes of the event being read are kept besides the current chunk, so memory stays bounded however large the array is. The end of every event is found with a byte search for a closing brace followed by a separator where the brackets outside of strings balance. The event is then parsed once, straight from its bytes, by the discriminated-union adapter of `event_adapter`, which validates it as the class matching its `class_uid`.
+
+    Attributes:
+    - Source (source) [Required]: The path or readable binary stream of the JSON array.
+    - Classes (classes) [Optional]: The event classes by class_uid, the Detection, Compliance and Application Security Posture Findings by default. Each class is matched through the class_uid and type_uid it declares, as with `event_adapter`.
+    - Chunk Size (chunk_size) [Optional]: The number of bytes read from the source at a time.
+    - Count (count): The number of events read so far.
+    """
+
+    def __init__(
+        self,
+        source: Union[str, "os.PathLike[str]", BinaryIO],
+        classes: Mapping[int, type[BaseEvent]] = FINDING_CLASSES,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive number of bytes")
+        self.source = source
+        self.classes = classes
+        self.chunk_size = chunk_size
+        self.count = 0
+        if isinstance(source, (str, os.PathLike)):
+            self._stream: BinaryIO = open(source, "rb")
+            self._owns_stream = True
+        else:
+            self._stream = source
+            self._owns_stream = False
+        self._buffer = b""
+        self._position = 0
+        self._exhausted = False
+
+    def __iter__(self) -> Iterator[BaseEvent]:
+        validate_json = event_adapter(tuple(self.classes.values())).validate_json
+        for element in self._elements():
+            try:
+                event = validate_json(element)
+            except ValidationError as error:
+                raise self._invalid(error) from error
+            self.count += 1
+            yield event
+
+    def close(self) -> None:
+        """Close the source if the reader opened it."""
+        if self._owns_stream:
+            self._stream.close()
+
+    def __enter__(self) -> "JSONArrayReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _elements(self) -> Iterator[bytes]:
+        # Yield the bytes of every element of the array.
+        self._skip_whitespace()
+        if self._buffer.startswith(_BYTE_ORDER_MARK, self._position):
+            self._position += len(_BYTE_ORDER_MARK)
+            self._skip_whitespace()
+        if self._peek() != ord("["):
+            raise ValueError("The source is not a JSON array")
+        self._position += 1
+        self._skip_whitespace()
+        if self._peek() == ord("]"):
+            self._position += 1
+        else:
+            while True:
+                yield self._element()
+                self._skip_whitespace()
+                separator = self._peek()
+                self._position += 1
+                if separator == ord("]"):
+                    break
+                if separator != ord(","):
+                    raise self._error("Expected ',' or ']' after an event")
+                self._skip_whitespace()
+        self._skip_whitespace()
+        if self._peek() >= 0:
+            raise self._error("Unexpected data after the JSON array")
+
+    def _element(self) -> bytes:
+        if self._peek() != ord("{"):
+            raise self._error("Expected an event object")
+        # Every event starts at the beginning of the buffer once it is refilled, offsets are relative to its start.
+        searched = 0
+        while True:
+            buffer = self._buffer
+            start = self._position
+            for candidate in _CANDIDATE_END.finditer(buffer, start + searched):
+                end = candidate.start() + 1
+                length = _object_length(buffer[start:end])
+                if length is not None:
+                    end = start + length
+                    self._position = end
+                    return buffer[start:end]
+            closing = buffer.rfind(b"}", start)
+            searched = closing - start if closing >= 0 else len(buffer) - start
+            if not self._fill():
+                raise self._error("The JSON array is truncated")
+
+    def _peek(self) -> int:
+        # Return the next byte, or -1 at the end of the source.
+        if self._position >= len(self._buffer) and not self._fill():
+            return -1
+        return self._buffer[self._position]
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            match = _WHITESPACE.match(self._buffer, self._position)
+            self._position = match.end() if match else self._position
+            if self._position < len(self._buffer) or not self._fill():
+                return
+
+    def _fill(self) -> bool:
+        # Drop the consumed bytes and append the next chunk, returning whether there was any.
+        if self._exhausted:
+            return False
+        chunk = self._stream.read(self.chunk_size)
+        if not chunk:
+            self._exhausted = True
+            return False
+        position = self._position
+        self._buffer = self._buffer[position:] + chunk
+        self._position = 0
+        return True
+
+    def _error(self, message: str) -> ValueError:
+        return ValueError(f"{message}, after event {self.count}")
+
+    def _invalid(self, error: ValidationError) -> ValueError:
+        # Events that are not JSON or not of a supported class get the errors of the reader, other validation errors are raised as they are.
+        details = error.errors()
+        if details[0]["type"] == "json_invalid":
+            return self._error(f"Invalid event ({details[0]['msg']})")
+        if details[0]["type"] == "event_class":
+            class_uid = _class_uid(details[0]["input"])
+            return ValueError(
+                f"Unsupported class_uid {class_uid} of event {self.count}"
+            )
+        return error
+
+
+def read_json_array(
+    source: Union[str, "os.PathLike[str]", BinaryIO],
+    classes: Mapping[int, type[BaseEvent]] = FINDING_CLASSES,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[BaseEvent]:
+    """Yield the events of a JSON array one at a time, validated as the class mapped to their class_uid."""
+    with JSONArrayReader(source, classes, chunk_size) as reader:
+        yield from reader
+
+
+def _object_length(element: bytes) -> Optional[int]:
+    # Return the length of the object starting the element, or None when its brackets do not balance or it ends within a string.
+    # Only quotes, backslashes and brackets matter, so the strings are removed from those alone.
+    structure = element.translate(None, _NOT_STRUCTURE)
+    if b"\\" in structure:
+        if b'\\"' in structure:
+            return _escaped_object_length(element)
+        structure = structure.replace(b"\\", b"")
+    # Strings without brackets leave two adjacent quotes, and when no quote is left every pair was a string.
+    brackets = structure.replace(b'""', b"")
+    if b'"' in brackets:
+        parts = structure.split(b'"')
+        if len(parts) % 2 == 0:
+            return None
+        brackets = b"".join(parts[::2])
+    return _bracket_length(element, brackets)
+
+
+def _escaped_object_length(element: bytes) -> Optional[int]:
+    # Escaped quotes need the strings to be matched by a regular expression, which is several times slower.
+    bare = _STRING.sub(b"", element)
+    if b'"' in bare:
+        return None
+    return _bracket_length(element, bare.translate(None, _NOT_BRACKETS))
+
+
+def _bracket_length(element: bytes, brackets: bytes) -> Optional[int]:
+    braces = brackets.count(b"{") - brackets.count(b"}")
+    if braces or brackets.count(b"[") != brackets.count(b"]"):
+        return None
+    # The brackets within a single object cancel out pair by pair.
+    inner = brackets[1:-1]
+    while inner:
+        reduced = inner.replace(b"{}", b"").replace(b"[]", b"")
+        if len(reduced) == len(inner):
+            break
+        inner = reduced
+    if not inner:
+        return len(element)
+    # The object ends earlier, e.g. when a separator is missing, which is found by scanning its strings and brackets.
+    depth = 0
+    for match in _TOKEN.finditer(element):
+        token = element[match.start()]
+        if token != _QUOTE:
+            depth += 1 if token in _OPENING else -1
+            if depth == 0:
+                return match.end()
+    return None
+
+
+def _class_uid(data: Any) -> Optional[int]:
+    class_uid = data.get("class_uid") if isinstance(data, dict) else None
+    return class_uid if isinstance(class_uid, int) else None
@@ -0,0 +1,200 @@
+import contextlib
+import json
+import mmap
+import os
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Iterator, Optional, Union
+
+from pydantic_core import from_json
+
+from py_ocsf_models.events.base_event import BaseEvent
+from py_ocsf_models.io.event_decoder import FINDING_CLASSES, event_adapter
+
+INDEX_SUFFIX = ".index"
+INDEX_FORMAT = 1
+
+_WHITESPACE = b" \t\r"
+
+
+class NDJSONReader:
+    """
+    The NDJSON Reader gives random access to the events of a newline-delimited JSON file, such as a large export that is searched during an investigation.
+
+    The file is memory-mapped and the offset of every line is indexed once, so reading event N only validates that line, as the class matching its `class_uid`. Looking an event up by its `finding_info.uid` uses a second index, built the first time it is needed. Both indexes are persisted next to the file, or at `index_path`, and loaded by the next reader as long as the file keeps its size and modification time, so the file is never scanned again. Blank lines are not indexed.
+
+    Attributes:
+    - Path (path) [Required]: The path of the NDJSON file.
+    - Index Path (index_path) [Optional]: The path of the persisted index, the path of the file with the `.index` suffix by default.
+    - Classes (classes) [Optional]: The event classes to validate, the Detection, Compliance and Application Security Posture Findings by default.
+    - Persist (persist) [Optional]: Whether built indexes are written to the index path.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        index_path: Optional[Union[str, "os.PathLike[str]"]] = None,
+        classes: tuple[type[BaseEvent], ...] = tuple(FINDING_CLASSES.values()),
+        persist: bool = True,
+    ) -> None:
+        self.path = Path(path)
+        self.index_path = (
+            Path(index_path)
+            if index_path is not None
+            else self.path.with_name(self.path.name + INDEX_SUFFIX)
+        )
+        self.classes = classes
+        self.persist = persist
+        self._uids: Optional[dict[str, int]] = None
+        self._data: Union[mmap.mmap, bytes] = b""
+        self._file = open(self.path, "rb")
+        try:
+            stat = os.fstat(self._file.fileno())
+            self._signature = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            # Empty files cannot be mapped.
+            if stat.st_size:
+                self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            offsets = self._load_index()
+            if offsets is None:
+                offsets = self._scan()
+                self._store_index(offsets)
+        except BaseException:
+            self.close()
+            raise
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, row: int) -> BaseEvent:
+        """Validate the event of the given row, counted from the first non-blank line."""
+        return event_adapter(self.classes).validate_json(self.raw(row))
+
+    def __iter__(self) -> Iterator[BaseEvent]:
+        validate_json = event_adapter(self.classes).validate_json
+        for row in range(len(self)):
+            yield validate_json(self.raw(row))
+
+    def raw(self, row: int) -> bytes:
+        """Return the JSON line of the given row, without validating it."""
+        start = self._offsets[row]
+        end = self._data.find(b"\n", start)
+        if end < 0:
+            end = len(self._data)
+        return self._data[start:end]
+
+    def row_of(self, uid: str) -> Optional[int]:
+        """Return the row of the first event with the given finding_info.uid, or None."""
+        if self._uids is None:
+            self._uids = self._index_uids()
+            self._store_index(self._offsets)
+        return self._uids.get(uid)
+
+    def find(self, uid: str) -> Optional[BaseEvent]:
+        """Validate the first event with the given finding_info.uid, or return None."""
+        row = self.row_of(uid)
+        return None if row is None else self[row]
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self) -> "NDJSONReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _scan(self) -> "array[int]":
+        # Record where every non-blank line starts, only copying the lines starting with whitespace to check them.
+        data = self._data
+        find = data.find
+        offsets = array("Q")
+        append = offsets.append
+        size = len(data)
+        start = 0
+        while start < size:
+            end = find(b"\n", start)
+            if end < 0:
+                end = size
+            if end > start and (
+                data[start] not in _WHITESPACE or data[start:end].strip(_WHITESPACE)
+            ):
+                append(start)
+            start = end + 1
+        return offsets
+
+    def _index_uids(self) -> dict[str, int]:
+        uids: dict[str, int] = {}
+        for row in range(len(self)):
+            uid = _finding_uid(from_json(self.raw(row), cache_strings=False))
+            if uid is not None:
+                uids.setdefault(uid, row)
+        return uids
+
+    def _load_index(self) -> Optional["array[int]"]:
+        # The index is a JSON header line, the offsets as little-endian 64-bit integers, then the uids as JSON.
+        try:
+            with open(self.index_path, "rb") as index:
+                header = json.loads(index.readline())
+                if (
+                    header.get("format") != INDEX_FORMAT
+                    or header.get("source") != self._signature
+                ):
+                    return None
+                offsets = array("Q")
+                offsets.frombytes(index.read(8 * header["count"]))
+                if len(offsets) != header["count"]:
+                    return None
+                if sys.byteorder != "little":
+                    offsets.byteswap()
+                if header.get("uids"):
+                    self._uids = json.loads(index.read())
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return offsets
+
+    def _store_index(self, offsets: "array[int]") -> None:
+        if not self.persist:
+            return
+        header = {
+            "format": INDEX_FORMAT,
+            "source": self._signature,
+            "count": len(offsets),
+            "uids": self._uids is not None,
+        }
+        little_endian = array("Q", offsets)
+        if sys.byteorder != "little":
+            little_endian.byteswap()
+        temporary: Optional[str] = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=self.index_path.parent, prefix=self.index_path.name, delete=False
+            ) as index:
+                temporary = index.name
+                index.write(json.dumps(header).encode() + b"\n")
+                index.write(little_endian.tobytes())
+                if self._uids is not None:
+                    index.write(json.dumps(self._uids).encode())
+            os.replace(temporary, self.index_path)
+        except OSError:
+            # A read-only location or a full disk only costs a scan on the next open, without leaving the partial index behind.
+            if temporary is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(temporary)
+
+
+def _finding_uid(data: Any) -> Optional[str]:
+    finding_info = data.get("finding_info") if isinstance(data, dict) else None
+    uid = finding_info.get("uid") if isinstance(finding_info, dict) else None
+    return uid if isinstance(uid, str) else None
@@ -0,0 +1,99 @@
+import os
+from types import TracebackType
+from typing import BinaryIO, Iterable, Optional, Union
+
+from py_ocsf_models.events.base_event import BaseEvent
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+
+class NDJSONWriter:
+    """
+    The NDJSON Writer streams OCSF events to a binary stream as newline-delimited JSON, one event per line.
+
+    Events are serialized straight to bytes through the model serializer and accumulated in a fixed-size buffer that is flushed to the stream once it is full, so memory stays bounded regardless of how many events are written.
+
+    Attributes:
+    - Stream (stream) [Required]: The writable binary stream that receives the serialized events.
+    - Buffer Size (buffer_size) [Optional]: The number of bytes buffered before they are written to the stream.
+    - Exclude Unset (exclude_unset) [Optional]: Whether fields that were not explicitly set are left out of the output.
+    - Count (count): The number of events written so far.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        exclude_unset: bool = True,
+    ) -> None:
+        if buffer_size <= 0:
+            raise ValueError("buffer_size must be a positive number of bytes")
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.exclude_unset = exclude_unset
+        self.count = 0
+        self._buffer = bytearray()
+
+    def write(self, event: BaseEvent) -> None:
+        """Serialize a single event and append it to the output."""
+        self._buffer += event.__pydantic_serializer__.to_json(
+            event, exclude_unset=self.exclude_unset
+        )
+        self._buffer += b"\n"
+        self.count += 1
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def write_many(self, events: Iterable[BaseEvent]) -> int:
+        """Serialize every event of the iterable and return how many were written."""
+        written = 0
+        for event in events:
+            self.write(event)
+            written += 1
+        return written
+
+    def flush(self) -> None:
+        """Write the buffered events to the stream."""
+        if self._buffer:
+            self.stream.write(self._buffer)
+            self._buffer.clear()
+        self.stream.flush()
+
+    def close(self) -> None:
+        """Flush the pending events and close the stream."""
+        self.flush()
+        self.stream.close()
+
+    def __enter__(self) -> "NDJSONWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def write_ndjson(
+    events: Iterable[BaseEvent],
+    destination: Union[str, "os.PathLike[str]", BinaryIO],
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    exclude_unset: bool = True,
+) -> int:
+    """
+    Write the given events as newline-delimited JSON and return how many were written.
+
+    The destination can be a file path, which is created or truncated, or an already open binary stream, which is flushed but left open.
+    """
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, "wb") as stream:
+            writer = NDJSONWriter(stream, buffer_size, exclude_unset)
+            written = writer.write_many(events)
+            writer.flush()
+        return written
+    writer = NDJSONWriter(destination, buffer_size, exclude_unset)
+    written = writer.write_many(events)
+    writer.flush()
+    return written
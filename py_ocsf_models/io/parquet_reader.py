@@ -0,0 +1,294 @@
+import importlib
+import json
+import os
+from types import TracebackType
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Generic,
+    Iterator,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from py_ocsf_models.events.base_event import BaseEvent
+from py_ocsf_models.io.arrow_schema import (
+    CLASS_METADATA_KEY,
+    ENCODING_METADATA_KEY,
+    JSON_ENCODING,
+)
+from py_ocsf_models.trusted import construct_trusted
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.fs as fs
+    import pyarrow.parquet as pq
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        "The Parquet reader of py-ocsf-models needs pyarrow, install it with `pip install py-ocsf-models[arrow]`"
+    ) from error
+
+EventT = TypeVar("EventT", bound=BaseEvent)
+
+Predicate = tuple[str, str, Any]
+Filters = Union[Sequence[Predicate], Sequence[Sequence[Predicate]]]
+
+DEFAULT_BATCH_SIZE = 65_536
+ROW_CHUNK_SIZE = 256
+
+
+class LazyEventBatch(Generic[EventT]):
+    """
+    The Lazy Event Batch is a sequence of OCSF events backed by an Arrow record batch read from Parquet.
+
+    Rows stay in columnar form until they are accessed by index or iteration, and only the accessed rows are turned into models, so callers can scan columns of large batches and materialize the few rows they need.
+
+    Attributes:
+    - Record Batch (record_batch) [Required]: The Arrow record batch holding the projected columns of the rows.
+    - Event Class (cls) [Required]: The OCSF event class the rows are materialized as.
+    """
+
+    def __init__(
+        self,
+        record_batch: Any,
+        cls: type[EventT],
+        materialize: Callable[[dict[str, Any]], EventT],
+    ) -> None:
+        self.record_batch = record_batch
+        self.cls = cls
+        self._materialize = materialize
+        self._chunk_index = -1
+        self._chunk: list[dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return int(self.record_batch.num_rows)
+
+    def __getitem__(self, index: int) -> EventT:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("LazyEventBatch index out of range")
+        # Converting rows to Python one at a time is an order of magnitude slower than in chunks,
+        # only the chunk of the last accessed row is kept to bound memory.
+        chunk_index, position = divmod(index, ROW_CHUNK_SIZE)
+        if chunk_index != self._chunk_index:
+            self._chunk = self.record_batch.slice(
+                chunk_index * ROW_CHUNK_SIZE, ROW_CHUNK_SIZE
+            ).to_pylist()
+            self._chunk_index = chunk_index
+        return self._materialize(self._chunk[position])
+
+    def __iter__(self) -> Iterator[EventT]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def column(self, path: str) -> Any:
+        """Return the Arrow array of a column, addressing fields of nested objects with dotted paths such as `finding_info.uid`."""
+        name, *nested = path.split(".")
+        array = self.record_batch.column(name)
+        if nested:
+            array = pc.struct_field(array, nested)
+        return array
+
+
+class ParquetReader(Generic[EventT]):
+    """
+    The Parquet Reader reads OCSF events back from a Parquet file written by the Parquet Writer, one batch at a time.
+
+    Only the requested columns are read from the file. Filters skip the row groups whose statistics rule out any match before reading them, and then drop the rows that do not match. Batches are yielded as Lazy Event Batches, so models are only built for the rows the caller accesses. Unless `validate` is set they are built as trusted data without validation, which also allows projections that leave out required fields; the models then only hold the read fields.
+
+    Attributes:
+    - Source (source) [Required]: The path or readable binary stream of the Parquet file.
+    - Event Class (cls) [Optional]: The OCSF event class of the rows, read from the file metadata when omitted.
+    - Columns (columns) [Optional]: The dotted paths of the fields to read, e.g. `finding_info.uid`; every field by default.
+    - Filters (filters) [Optional]: `(path, operator, value)` predicates that must all match, or a list of such lists of which one must match, using the pyarrow filter operators.
+    - Batch Size (batch_size) [Optional]: The maximum number of rows per batch.
+    - Validate (validate) [Optional]: Whether materialized rows are validated instead of built from trusted data.
+    - Row Groups (row_groups): The indexes of the row groups that may hold matching rows.
+    """
+
+    def __init__(
+        self,
+        source: Union[str, "os.PathLike[str]", BinaryIO],
+        cls: Optional[type[EventT]] = None,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[Filters] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        validate: bool = False,
+    ) -> None:
+        self._file = pq.ParquetFile(source)
+        schema = self._file.schema_arrow
+        self.cls: type[EventT] = cls or _event_class(schema)
+        self.batch_size = batch_size
+        self.validate = validate
+        self._leaf_columns = {
+            _field_path(column.path): column.path for column in self._file.schema
+        }
+        self._json_paths = _json_paths(schema)
+        predicates = _disjunction(filters) if filters else []
+        self._filter = (
+            pq.filters_to_expression(
+                [
+                    [
+                        (tuple(path.split(".")), operator, value)
+                        for path, operator, value in conjunction
+                    ]
+                    for conjunction in predicates
+                ]
+            )
+            if predicates
+            else None
+        )
+        if columns is None:
+            self._columns = None
+        else:
+            filter_paths = [
+                path for conjunction in predicates for path, _, _ in conjunction
+            ]
+            self._columns = self._parquet_columns([*columns, *filter_paths])
+        self.row_groups = self._matching_row_groups(source)
+
+    def __iter__(self) -> Iterator[LazyEventBatch[EventT]]:
+        for batch in self._file.iter_batches(
+            batch_size=self.batch_size,
+            row_groups=self.row_groups,
+            columns=self._columns,
+        ):
+            if self._filter is not None:
+                batch = batch.filter(self._filter)
+            if batch.num_rows:
+                yield LazyEventBatch(batch, self.cls, self._materialize)
+
+    def events(self) -> Iterator[EventT]:
+        """Yield every matching row as a model."""
+        for batch in self:
+            yield from batch
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._file.close()
+
+    def _materialize(self, row: dict[str, Any]) -> EventT:
+        data = _clean(row, "", self._json_paths)
+        if self.validate:
+            return self.cls.model_validate(data)
+        return construct_trusted(self.cls, data)
+
+    def _parquet_columns(self, paths: Sequence[str]) -> list[str]:
+        columns: dict[str, None] = {}
+        for path in paths:
+            matches = [
+                column
+                for field_path, column in self._leaf_columns.items()
+                if field_path == path or field_path.startswith(f"{path}.")
+            ]
+            if not matches:
+                raise ValueError(f"Unknown column {path!r}")
+            columns.update(dict.fromkeys(matches))
+        return list(columns)
+
+    def _matching_row_groups(
+        self, source: Union[str, "os.PathLike[str]", BinaryIO]
+    ) -> list[int]:
+        if self._filter is None:
+            return list(range(self._file.num_row_groups))
+        if isinstance(source, (str, os.PathLike)):
+            fragment = ds.ParquetFileFormat().make_fragment(
+                os.fspath(source), filesystem=fs.LocalFileSystem()
+            )
+        else:
+            source.seek(0)
+            fragment = ds.ParquetFileFormat().make_fragment(
+                pa.PythonFile(source, mode="r")
+            )
+        return [
+            row_group.id
+            for row_group in fragment.subset(filter=self._filter).row_groups
+        ]
+
+    def __enter__(self) -> "ParquetReader[EventT]":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def read_parquet(
+    source: Union[str, "os.PathLike[str]", BinaryIO],
+    cls: Optional[type[EventT]] = None,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Filters] = None,
+    validate: bool = False,
+) -> Iterator[EventT]:
+    """Yield the matching rows of a Parquet file written by the Parquet Writer as models."""
+    with ParquetReader(
+        source, cls, columns=columns, filters=filters, validate=validate
+    ) as reader:
+        yield from reader.events()
+
+
+def _event_class(schema: Any) -> Any:
+    metadata = schema.metadata or {}
+    qualified_name = metadata.get(CLASS_METADATA_KEY, b"").decode()
+    module_name, _, class_name = qualified_name.rpartition(".")
+    # Only classes of this package are imported, never arbitrary modules named by the file.
+    if module_name.startswith("py_ocsf_models."):
+        event_class = getattr(importlib.import_module(module_name), class_name, None)
+        if isinstance(event_class, type) and issubclass(event_class, BaseEvent):
+            return event_class
+    raise ValueError(
+        "The Parquet file does not record an OCSF event class, pass it as `cls`"
+    )
+
+
+def _disjunction(filters: Filters) -> list[list[Predicate]]:
+    if isinstance(filters[0], tuple):
+        return [list(filters)]  # type: ignore[arg-type]
+    return [list(conjunction) for conjunction in filters]  # type: ignore[arg-type]
+
+
+def _field_path(column_path: str) -> str:
+    # Parquet stores list items under `<name>.list.element`.
+    return column_path.replace(".list.element", "").replace(".list.item", "")
+
+
+def _json_paths(schema: Any) -> frozenset[str]:
+    paths = set()
+
+    def collect(field: Any, path: str) -> None:
+        if (field.metadata or {}).get(ENCODING_METADATA_KEY) == JSON_ENCODING:
+            paths.add(path)
+        if pa.types.is_list(field.type):
+            collect(field.type.value_field, path)
+        elif pa.types.is_struct(field.type):
+            for child in field.type:
+                collect(child, f"{path}.{child.name}")
+
+    for field in schema:
+        collect(field, field.name)
+    return frozenset(paths)
+
+
+def _clean(value: Any, path: str, json_paths: frozenset[str]) -> Any:
+    # Unset fields are read back as nulls, leaving them out keeps them unset.
+    if isinstance(value, dict):
+        return {
+            key: _clean(item, f"{path}.{key}" if path else key, json_paths)
+            for key, item in value.items()
+            if item is not None
+        }
+    if isinstance(value, list):
+        return [_clean(item, path, json_paths) for item in value]
+    if isinstance(value, str) and path in json_paths:
+        return json.loads(value)
+    return value
@@ -0,0 +1,131 @@
+import os
+from types import TracebackType
+from typing import Any, BinaryIO, Iterable, Optional, Union
+
+from py_ocsf_models.events.base_event import BaseEvent
+from py_ocsf_models.io.arrow_schema import arrow_schema, to_record_batch
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        "The Parquet export of py-ocsf-models needs pyarrow, install it with `pip install py-ocsf-models[arrow]`"
+    ) from error
+
+DEFAULT_ROW_GROUP_SIZE = 100_000
+DEFAULT_BATCH_SIZE = 4096
+DEFAULT_COMPRESSION = "zstd"
+
+
+class ParquetWriter:
+    """
+    The Parquet Writer streams OCSF events of a single class to a Parquet file, writing one row group at a time.
+
+    Events are converted into Arrow record batches of `batch_size` rows as they arrive, and the batches are written out as a row group once they hold `row_group_size` rows, so memory stays bounded by one row group in columnar form regardless of how many events are written. The file schema is derived from the event class with `arrow_schema`.
+
+    Attributes:
+    - Destination (destination) [Required]: The path or writable binary stream that receives the Parquet file.
+    - Event Class (cls) [Required]: The OCSF event class of every written event, e.g. DetectionFinding.
+    - Row Group Size (row_group_size) [Optional]: The number of rows written per row group.
+    - Batch Size (batch_size) [Optional]: The number of events converted to Arrow at once.
+    - Compression (compression) [Optional]: The Parquet compression codec, zstd by default.
+    - Count (count): The number of events written so far.
+    """
+
+    def __init__(
+        self,
+        destination: Union[str, "os.PathLike[str]", BinaryIO],
+        cls: type[BaseEvent],
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        compression: str = DEFAULT_COMPRESSION,
+    ) -> None:
+        if row_group_size <= 0 or batch_size <= 0:
+            raise ValueError("row_group_size and batch_size must be positive")
+        self.cls = cls
+        self.row_group_size = row_group_size
+        self.batch_size = min(batch_size, row_group_size)
+        self.schema = arrow_schema(cls)
+        self.count = 0
+        self._events: list[BaseEvent] = []
+        self._batches: list[Any] = []
+        self._batched_rows = 0
+        self._writer = pq.ParquetWriter(
+            destination, self.schema, compression=compression
+        )
+
+    def write(self, event: BaseEvent) -> None:
+        """Append a single event to the current row group."""
+        if not isinstance(event, self.cls):
+            raise TypeError(
+                f"Expected a {self.cls.__name__} event, got {type(event).__name__}"
+            )
+        self._events.append(event)
+        self.count += 1
+        # Batches end exactly on row group boundaries, so every row group but the last one is full.
+        if len(self._events) >= min(
+            self.batch_size, self.row_group_size - self._batched_rows
+        ):
+            self._convert_events()
+            if self._batched_rows >= self.row_group_size:
+                self.flush()
+
+    def write_many(self, events: Iterable[BaseEvent]) -> int:
+        """Append every event of the iterable and return how many were written."""
+        written = 0
+        for event in events:
+            self.write(event)
+            written += 1
+        return written
+
+    def flush(self) -> None:
+        """Write the pending events to the file as a row group."""
+        self._convert_events()
+        if self._batches:
+            table = pa.Table.from_batches(self._batches, schema=self.schema)
+            self._writer.write_table(table, row_group_size=self.row_group_size)
+            self._batches.clear()
+            self._batched_rows = 0
+
+    def close(self) -> None:
+        """Write the pending events and the Parquet footer."""
+        self.flush()
+        self._writer.close()
+
+    def _convert_events(self) -> None:
+        if not self._events:
+            return
+        batch = to_record_batch(self._events, self.cls)
+        self._events.clear()
+        self._batches.append(batch)
+        self._batched_rows += batch.num_rows
+
+    def __enter__(self) -> "ParquetWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def write_parquet(
+    events: Iterable[BaseEvent],
+    destination: Union[str, "os.PathLike[str]", BinaryIO],
+    cls: type[BaseEvent],
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: str = DEFAULT_COMPRESSION,
+) -> int:
+    """
+    Write the given events of a single class to a Parquet file and return how many were written.
+
+    The destination can be a file path, which is created or truncated, or an already open binary stream.
+    """
+    with ParquetWriter(
+        destination, cls, row_group_size=row_group_size, compression=compression
+    ) as writer:
+        return writer.write_many(events)
@@ -0,0 +1,215 @@
+import types
+from typing import (
+    Any,
+    Generic,
+    Iterable,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+from pydantic_core import to_json, to_jsonable_python
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# pydantic include specs select every item of a list or dict with this key.
+ALL_ITEMS = "__all__"
+
+IncludeSpec = dict[Union[str, int], Any]
+
+_SCALAR_TYPES = (str, int, float, type(None))
+
+
+class _Step(NamedTuple):
+    # A selected field: the number of lists and dicts wrapping its models, the plan selecting their fields or None for the whole field, and whether the whole field holds models to dump.
+    name: str
+    levels: int
+    plan: Optional[tuple["_Step", ...]]
+    dumps_models: bool
+
+
+class Projection(Generic[ModelT]):
+    """
+    The Projection dumps only some fields of a model, given as dotted paths such as `finding_info.title`, `severity_id` or `resources[].uid`.
+
+    Paths are checked against the model class and compiled once into a pydantic include spec, available as `include` for `model_dump`, and into a plan walking the selected fields only. The plan is reused for every dump, so the fields left out are never visited instead of being dumped and discarded, and the include spec is not interpreted again for every model as the pydantic serializer does. Paths crossing a list or dict field select the field within every item, with or without a trailing `[]` on the list field.
+
+    The output matches `model_dump(include=projection.include)` and `model_dump_json(include=projection.include)` with the same `exclude_unset`, except that models held by fields of a more generic type are dumped as their own class.
+
+    Attributes:
+    - Class (cls) [Required]: The model class being projected.
+    - Paths (paths) [Required]: The dotted paths of the fields to dump.
+    - Exclude Unset (exclude_unset) [Optional]: Whether fields that were not explicitly set are left out of the output.
+    - Include (include): The compiled pydantic include spec.
+    """
+
+    def __init__(
+        self,
+        cls: type[ModelT],
+        paths: Sequence[str],
+        exclude_unset: bool = True,
+    ) -> None:
+        self.cls = cls
+        self.paths = tuple(paths)
+        self.exclude_unset = exclude_unset
+        self.include = compile_include(cls, self.paths)
+        self._plan = _compile_plan(cls, self.include)
+
+    def dump(
+        self, model: ModelT, mode: Literal["python", "json"] = "python"
+    ) -> dict[str, Any]:
+        """Dump the projected fields of a model to a dict, in the given pydantic mode."""
+        dumped = _project(model, self._plan, self.exclude_unset)
+        if mode == "json":
+            jsonable: dict[str, Any] = to_jsonable_python(dumped)
+            return jsonable
+        return dumped
+
+    def dump_json(self, model: ModelT) -> bytes:
+        """Dump the projected fields of a model to JSON."""
+        return to_json(_project(model, self._plan, self.exclude_unset))
+
+    def dump_many_json(self, models: Iterable[ModelT]) -> bytes:
+        """Dump the projected fields of a batch of models into a JSON array."""
+        plan = self._plan
+        exclude_unset = self.exclude_unset
+        return to_json([_project(model, plan, exclude_unset) for model in models])
+
+
+def compile_include(cls: type[BaseModel], paths: Iterable[str]) -> IncludeSpec:
+    """
+    Compile dotted field paths into a pydantic include spec, raising a ValueError for paths that are not fields of the model.
+
+    E.g. `["severity_id", "resources[].uid"]` compiles to `{"severity_id": True, "resources": {"__all__": {"uid": True}}}`. A path selecting a whole field takes precedence over the paths selecting parts of it.
+    """
+    include: IncludeSpec = {}
+    for path in paths:
+        names = [name.removesuffix("[]") for name in path.split(".")]
+        spec = include
+        model_cls = cls
+        for position, name in enumerate(names):
+            field = model_cls.model_fields.get(name)
+            if field is None:
+                raise ValueError(f"{model_cls.__name__} has no field {name} in {path}")
+            if spec.get(name) is True:
+                break
+            if position == len(names) - 1:
+                spec[name] = True
+                break
+            nested_cls, levels = _nested_model(field.annotation)
+            if nested_cls is None:
+                raise ValueError(
+                    f"{model_cls.__name__}.{name} is not a model in {path}"
+                )
+            spec = spec.setdefault(name, {})
+            for _ in range(levels):
+                spec = spec.setdefault(ALL_ITEMS, {})
+            model_cls = nested_cls
+    return include
+
+
+def _nested_model(annotation: Any) -> tuple[Any, int]:
+    # Return the model class within an annotation and the number of lists and dicts wrapping it.
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _nested_model(members[0]) if len(members) == 1 else (None, 0)
+    if origin is list or origin is dict:
+        arguments = get_args(annotation)
+        if not arguments:
+            return None, 0
+        nested_cls, levels = _nested_model(arguments[-1])
+        return nested_cls, levels + 1
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, 0
+    return None, 0
+
+
+def _compile_plan(cls: type[BaseModel], include: IncludeSpec) -> tuple[_Step, ...]:
+    # Steps follow the order of the fields, which is the order the serializer dumps them in.
+    steps = []
+    for name, field in cls.model_fields.items():
+        spec = include.get(name)
+        if spec is None:
+            continue
+        nested_cls, levels = _nested_model(field.annotation)
+        if spec is True:
+            steps.append(_Step(name, 0, None, _holds_models(field.annotation)))
+            continue
+        for _ in range(levels):
+            spec = spec[ALL_ITEMS]
+        steps.append(_Step(name, levels, _compile_plan(nested_cls, spec), False))
+    return tuple(steps)
+
+
+def _project(
+    model: BaseModel, plan: tuple[_Step, ...], exclude_unset: bool
+) -> dict[str, Any]:
+    values = model.__dict__
+    fields_set = model.__pydantic_fields_set__
+    projected = {}
+    for step in plan:
+        name = step.name
+        if exclude_unset and name not in fields_set:
+            continue
+        value = values[name]
+        if step.plan is not None:
+            projected[name] = _project_items(
+                value, step.plan, step.levels, exclude_unset
+            )
+        elif step.dumps_models:
+            projected[name] = _dump(value, exclude_unset)
+        else:
+            projected[name] = _copy(value)
+    return projected
+
+
+def _project_items(
+    value: Any, plan: tuple[_Step, ...], levels: int, exclude_unset: bool
+) -> Any:
+    if value is None:
+        return None
+    if levels:
+        if isinstance(value, dict):
+            return {
+                key: _project_items(item, plan, levels - 1, exclude_unset)
+                for key, item in value.items()
+            }
+        return [_project_items(item, plan, levels - 1, exclude_unset) for item in value]
+    return _project(value, plan, exclude_unset)
+
+
+def _dump(value: Any, exclude_unset: bool) -> Any:
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    if isinstance(value, BaseModel):
+        return value.__pydantic_serializer__.to_python(
+            value, exclude_unset=exclude_unset
+        )
+    if isinstance(value, list):
+        return [_dump(item, exclude_unset) for item in value]
+    if isinstance(value, dict):
+        return {key: _dump(item, exclude_unset) for key, item in value.items()}
+    return value
+
+
+def _copy(value: Any) -> Any:
+    # Lists and dicts are copied like the serializer does, so changing the output never changes the model.
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    return value
+
+
+def _holds_models(annotation: Any) -> bool:
+    origin = get_origin(annotation)
+    if origin is not None:
+        return any(_holds_models(argument) for argument in get_args(annotation))
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
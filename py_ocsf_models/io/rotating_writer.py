@@ -0,0 +1,242 @@
+import gzip
+import json
+import os
+import zlib
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO, Callable, Iterable, Optional, Union
+
+from py_ocsf_models.events.base_event import BaseEvent
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+DEFAULT_LEVELS = {"gzip": 6, "zstd": 3}
+EXTENSIONS = {None: ".ndjson", "gzip": ".ndjson.gz", "zstd": ".ndjson.zst"}
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+class RotatingFileWriter:
+    """
+    The Rotating File Writer streams OCSF events as compressed newline-delimited JSON to a sequence of files, starting a new file once the current one is large enough, e.g. to size them for S3 multipart uploads.
+
+    Events are serialized into a buffer that is compressed into the current file whenever it is full. A file is rolled over once it holds `max_events` events, or once its compressed size reaches `max_bytes`, which is checked every time the buffer is compressed. With `max_bytes`, the compressor is flushed before every check so its pending output is counted, which keeps every file within `max_bytes` plus the compressed size of one buffer at the cost of a slightly lower compression ratio. The old file is then finished, by flushing its compressor, closing it and writing its manifest, in a background thread while events are written to the new file.
+
+    The manifest of every file is a JSON sidecar named after it with the `.manifest.json` suffix, holding its name, compression, number of events, compressed and uncompressed sizes, and the number of events per `class_uid` and per `severity_id`. It is written once the file is complete, so its presence tells uploaders the file can be picked up.
+
+    Attributes:
+    - Directory (directory) [Required]: The directory receiving the files, which is created if missing.
+    - Prefix (prefix) [Optional]: The start of the file names, followed by the index of the file and the extension of the compression.
+    - Compression (compression) [Optional]: The compression of the files, `gzip`, `zstd` or None for plain NDJSON. Zstandard needs the `zstd` extra.
+    - Level (level) [Optional]: The compression level, 6 for gzip and 3 for zstd by default.
+    - Max Bytes (max_bytes) [Optional]: The compressed size at which a file is rolled over.
+    - Max Events (max_events) [Optional]: The number of events at which a file is rolled over.
+    - Buffer Size (buffer_size) [Optional]: The number of serialized bytes buffered before they are compressed.
+    - Exclude Unset (exclude_unset) [Optional]: Whether fields that were not explicitly set are left out of the output.
+    - Count (count): The number of events written so far.
+    - Files (files): The paths of the files started so far.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        prefix: str = "events",
+        compression: Optional[str] = "gzip",
+        level: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_events: Optional[int] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        exclude_unset: bool = True,
+    ) -> None:
+        if compression not in EXTENSIONS:
+            raise ValueError(f"Unsupported compression {compression}")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive number of bytes")
+        if max_events is not None and max_events <= 0:
+            raise ValueError("max_events must be a positive number of events")
+        if buffer_size <= 0:
+            raise ValueError("buffer_size must be a positive number of bytes")
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.compression = compression
+        self.level = (
+            level if level is not None else DEFAULT_LEVELS.get(compression or "")
+        )
+        self.max_bytes = max_bytes
+        self.max_events = max_events
+        self.buffer_size = buffer_size
+        self.exclude_unset = exclude_unset
+        self.count = 0
+        self.files: list[Path] = []
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._file: Optional[_File] = None
+        self._buffer = bytearray()
+        # A single thread finishes the old files one after the other.
+        self._finisher = ThreadPoolExecutor(1)
+        self._finishing: list[Future[None]] = []
+        self._closed = False
+
+    def write(self, event: BaseEvent) -> None:
+        """Serialize a single event and append it to the current file."""
+        if self._closed:
+            raise ValueError("The writer is closed")
+        file = self._file if self._file is not None else self._open()
+        self._buffer += event.__pydantic_serializer__.to_json(
+            event, exclude_unset=self.exclude_unset
+        )
+        self._buffer += b"\n"
+        file.count(event)
+        self.count += 1
+        if self.max_events is not None and file.events >= self.max_events:
+            self._rollover()
+        elif len(self._buffer) >= self.buffer_size:
+            self._compress()
+            if self.max_bytes is not None and file.size() >= self.max_bytes:
+                self._rollover()
+
+    def write_many(self, events: Iterable[BaseEvent]) -> int:
+        """Serialize every event of the iterable and return how many were written."""
+        written = 0
+        for event in events:
+            self.write(event)
+            written += 1
+        return written
+
+    def rollover(self) -> None:
+        """Finish the current file, so the next event starts a new one."""
+        if self._file is not None:
+            self._rollover()
+
+    def close(self) -> None:
+        """Finish the current file and wait until every file is finished."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.rollover()
+            self._wait(block=True)
+        finally:
+            self._finisher.shutdown()
+
+    def __enter__(self) -> "RotatingFileWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _open(self) -> "_File":
+        # Failures to finish earlier files surface as soon as possible.
+        self._wait(block=False)
+        path = self.directory / (
+            f"{self.prefix}-{len(self.files):05d}{EXTENSIONS[self.compression]}"
+        )
+        self._file = _File(path, self.compression, self.level)
+        self.files.append(path)
+        return self._file
+
+    def _compress(self) -> None:
+        if self._file is not None and self._buffer:
+            self._file.write(bytes(self._buffer))
+            self._buffer.clear()
+
+    def _rollover(self) -> None:
+        self._compress()
+        file, self._file = self._file, None
+        if file is not None:
+            self._finishing.append(self._finisher.submit(file.finish))
+
+    def _wait(self, block: bool) -> None:
+        pending = []
+        for future in self._finishing:
+            if block or future.done():
+                future.result()
+            else:
+                pending.append(future)
+        self._finishing = pending
+
+
+class _File:
+    # A file being written, with the counts of its manifest.
+    def __init__(
+        self, path: Path, compression: Optional[str], level: Optional[int]
+    ) -> None:
+        self.path = path
+        self.compression = compression
+        self.events = 0
+        self.uncompressed_bytes = 0
+        self.class_uids: Counter[Any] = Counter()
+        self.severity_ids: Counter[Any] = Counter()
+        self._raw: BinaryIO = open(path, "wb")
+        self._stream: BinaryIO = self._raw
+        # Plain files need no flush, the position of the file counts its buffered bytes.
+        self._flush: Callable[[], Any] = lambda: None
+        if compression == "gzip":
+            stream = gzip.GzipFile(
+                filename="",
+                mode="wb",
+                compresslevel=DEFAULT_LEVELS["gzip"] if level is None else level,
+                fileobj=self._raw,
+                mtime=0,
+            )
+            self._stream = stream  # type: ignore[assignment]
+            self._flush = lambda: stream.flush(zlib.Z_SYNC_FLUSH)
+        elif compression == "zstd":
+            self._stream = _zstd_stream(self._raw, level)
+            # A block flush, the default of the zstd writer, ends the pending block without ending the frame.
+            self._flush = self._stream.flush
+
+    def count(self, event: BaseEvent) -> None:
+        values = event.__dict__
+        self.events += 1
+        self.class_uids[values.get("class_uid")] += 1
+        self.severity_ids[values.get("severity_id")] += 1
+
+    def write(self, data: bytes) -> None:
+        self._stream.write(data)
+        self.uncompressed_bytes += len(data)
+
+    def size(self) -> int:
+        # The output pending in the compressor is flushed first, so it is counted.
+        self._flush()
+        return self._raw.tell()
+
+    def finish(self) -> None:
+        self._stream.close()
+        if not self._raw.closed:
+            self._raw.close()
+        manifest = {
+            "file": self.path.name,
+            "compression": self.compression,
+            "events": self.events,
+            "bytes": self.path.stat().st_size,
+            "uncompressed_bytes": self.uncompressed_bytes,
+            "class_uid": _counts(self.class_uids),
+            "severity_id": _counts(self.severity_ids),
+        }
+        manifest_path = self.path.with_name(self.path.name + MANIFEST_SUFFIX)
+        manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+
+def _counts(counter: Counter[Any]) -> dict[str, int]:
+    # Enum members become their values, events missing the field are counted under "null".
+    ordered = sorted(counter.items(), key=lambda item: (item[0] is None, item[0] or 0))
+    return {"null" if key is None else str(int(key)): count for key, count in ordered}
+
+
+def _zstd_stream(raw: BinaryIO, level: Optional[int]) -> BinaryIO:
+    try:
+        import zstandard
+    except ImportError as error:  # pragma: no cover
+        raise ImportError(
+            "Zstandard compression needs the zstandard package, install it with `pip install py-ocsf-models[zstd]`"
+        ) from error
+    compressor = zstandard.ZstdCompressor(
+        level=DEFAULT_LEVELS["zstd"] if level is None else level
+    )
+    stream: BinaryIO = compressor.stream_writer(raw, closefd=True)
+    return stream
@@ -0,0 +1,28 @@
+from functools import lru_cache
+from typing import Sequence, TypeVar
+
+from pydantic import TypeAdapter
+
+from py_ocsf_models.events.base_event import BaseEvent
+
+EventT = TypeVar("EventT", bound=BaseEvent)
+
+
+@lru_cache(maxsize=None)
+def list_adapter(cls: type[EventT]) -> TypeAdapter[list[EventT]]:
+    """Return the TypeAdapter for a list of the given event class, built once per class."""
+    return TypeAdapter(list[cls])  # type: ignore[valid-type]
+
+
+def dump_many(
+    events: Sequence[EventT],
+    cls: type[EventT],
+    exclude_unset: bool = True,
+) -> bytes:
+    """
+    Serialize a batch of events of the same class into a JSON array with a single serializer call.
+
+    Every event must be an instance of `cls`; fields declared only on subclasses of `cls` are not serialized.
+    """
+    batch = events if isinstance(events, list) else list(events)
+    return list_adapter(cls).dump_json(batch, exclude_unset=exclude_unset)
@@ -1,7 +1,7 @@
 from enum import IntEnum
 from typing import Optional
 
-from pydantic import BaseModel
+from py_ocsf_models.base_model import OCSFBaseModel
 
 
 class TypeID(IntEnum):
@@ -19,7 +19,7 @@ class TypeID(IntEnum):
     Other = 99
 
 
-class Account(BaseModel):
+class Account(OCSFBaseModel):
     """
     The Account object contains details about the account that initiated or performed a specific activity within a system or application.
 
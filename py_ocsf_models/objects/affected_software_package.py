@@ -1,8 +1,7 @@
 from enum import IntEnum
 from typing import Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.fingerprint import FingerPrint
 from py_ocsf_models.objects.remediation import Remediation
 
@@ -14,7 +13,7 @@ class SoftwarePackageTypeID(IntEnum):
     Other = 99
 
 
-class AffectedSoftwarePackage(BaseModel):
+class AffectedSoftwarePackage(OCSFBaseModel):
     """
     The Affected Package object describes details about a software package identified as affected by a vulnerability/vulnerabilities.
 
@@ -1,9 +1,9 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from py_ocsf_models.base_model import OCSFBaseModel
 
 
-class Analytic(BaseModel):
+class Analytic(OCSFBaseModel):
     """
     The Analytic object contains details about the analytic technique used to analyze and derive insights from the data or information that led to the creation of a finding or conclusion.
 
@@ -1,14 +1,13 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.group import Group
 from py_ocsf_models.objects.request_elements import RequestElements
 from py_ocsf_models.objects.response_elements import ResponseElements
 from py_ocsf_models.objects.service import Service
 
 
-class API(BaseModel):
+class API(OCSFBaseModel):
     """
     Represents the details of an API interaction, including both request and response elements,
     as well as metadata about the API's operation and the service it belongs to.
@@ -1,12 +1,11 @@
 from typing import List, Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.events.findings.severity_id import SeverityID
 from py_ocsf_models.objects.compliance_status import StatusID
 
 
-class Check(BaseModel):
+class Check(OCSFBaseModel):
     """
     The check object defines a specific, testable compliance verification point that evaluates a target device against a standard, framework, or custom requirement. While checks are typically associated with formal standards (like CIS, NIST, or ISO), they can also represent custom or organizational requirements. When mapped to controls, checks can evaluate specific control_parameters to determine compliance status, but neither the control mapping nor control_parameters are required for a valid check.
 
@@ -1,12 +1,11 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.account import Account
 from py_ocsf_models.objects.organization import Organization
 
 
-class Cloud(BaseModel):
+class Cloud(OCSFBaseModel):
     """
     The Cloud object contains information about a cloud account such as AWS Account ID, regions, etc.
 
@@ -1,13 +1,12 @@
 from typing import List, Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.assessment import Assessment
 from py_ocsf_models.objects.check import Check
 from py_ocsf_models.objects.compliance_status import StatusID
 
 
-class Compliance(BaseModel):
+class Compliance(OCSFBaseModel):
     """
     The Compliance object contains information about Industry and Regulatory Framework standards, controls and requirements or details about custom assessments utilized in a compliance evaluation. Standards define broad security frameworks, controls represent specific security requirements within those frameworks, and checks are the testable verification points used to determine if controls are properly implemented.
 
@@ -1,13 +1,12 @@
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.fingerprint import FingerPrint
 from py_ocsf_models.objects.image import Image
 
 
-class Container(BaseModel):
+class Container(OCSFBaseModel):
     """
     Represents a container instance within a containerized application environment, detailing its image source,
     operational parameters, and unique identifiers.
@@ -1,15 +1,14 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.cvss import CVSSScore
 from py_ocsf_models.objects.cwe import CWE
 from py_ocsf_models.objects.epss import EPSS
 from py_ocsf_models.objects.product import Product
 
 
-class CVE(BaseModel):
+class CVE(OCSFBaseModel):
     """
     Common Vulnerabilities and Exposures (CVE) details.
     """
@@ -1,12 +1,11 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.metric import Metric
 from py_ocsf_models.objects.url import URL
 
 
-class CVSSScore(BaseModel):
+class CVSSScore(OCSFBaseModel):
     """
     Common Vulnerability Scoring System (CVSS) details.
     """
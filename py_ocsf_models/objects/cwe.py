@@ -1,11 +1,10 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.url import URL
 
 
-class CWE(BaseModel):
+class CWE(OCSFBaseModel):
     """
     Common Weakness Enumeration (CWE) details.
     """
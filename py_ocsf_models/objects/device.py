@@ -2,8 +2,7 @@ from datetime import datetime
 from enum import IntEnum
 from typing import List, Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.device_hardware_info import DeviceHardwareInfo
 from py_ocsf_models.objects.geolocation import GeoLocation
 from py_ocsf_models.objects.group import Group
@@ -67,7 +66,7 @@ class RiskLevelID(IntEnum):
     Critical = 4
 
 
-class Device(BaseModel):
+class Device(OCSFBaseModel):
     """
     Represents a device, providing details such as hostname, IP address, operating system, etc.
 
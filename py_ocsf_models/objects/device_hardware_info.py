@@ -1,9 +1,9 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from py_ocsf_models.base_model import OCSFBaseModel
 
 
-class KeyboardInformation(BaseModel):
+class KeyboardInformation(OCSFBaseModel):
     """
     The Keyboard Information object contains details and attributes related to a computer or device keyboard. It encompasses information that describes the characteristics, capabilities, and configuration of the keyboard.
 
@@ -22,7 +22,7 @@ class KeyboardInformation(BaseModel):
     keyboard_type: Optional[str] = None
 
 
-class Display(BaseModel):
+class Display(OCSFBaseModel):
     """
     The Display object contains information about the physical or virtual display connected to a computer system.
 
@@ -41,7 +41,7 @@ class Display(BaseModel):
     scale_factor: Optional[int] = None
 
 
-class DeviceHardwareInfo(BaseModel):
+class DeviceHardwareInfo(OCSFBaseModel):
     """
     The Device Hardware Information object contains details and specifications of the physical components that make up a device. This information provides an overview of the hardware capabilities, configuration, and characteristics of the device.
 
@@ -1,7 +1,7 @@
 from enum import IntEnum
 from typing import Optional
 
-from pydantic import BaseModel
+from py_ocsf_models.base_model import OCSFBaseModel
 
 
 class DNSOpcodeID(IntEnum):
@@ -27,7 +27,7 @@ class DNSOpcodeID(IntEnum):
     DSO_Message = 6
 
 
-class DNSQuery(BaseModel):
+class DNSQuery(OCSFBaseModel):
     """
     The DNS query object represents a specific request made to the Domain Name System (DNS) to retrieve information about a domain or perform a DNS operation.
     This object encapsulates the necessary attributes and methods to construct and send DNS queries, specify the query type (e.g., A, AAAA, MX).
@@ -1,9 +1,9 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from py_ocsf_models.base_model import OCSFBaseModel
 
 
-class Enrichment(BaseModel):
+class Enrichment(OCSFBaseModel):
     """
     Represents enrichment data associated with a specific attribute, providing additional context or information.
     This can include various types of data, depending on the enrichment type, such as location data for an IP address.
@@ -1,7 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.api import API
 from py_ocsf_models.objects.device import Device
 from py_ocsf_models.objects.dns_query import DNSQuery
@@ -10,7 +9,7 @@ from py_ocsf_models.objects.url import URL
 from py_ocsf_models.objects.verdict import VerdictID
 
 
-class EvidenceArtifacts(BaseModel):
+class EvidenceArtifacts(OCSFBaseModel):
     """
     A collection of evidence artifacts associated to the activity/activities that triggered a security detection.
 
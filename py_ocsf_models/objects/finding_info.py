@@ -1,15 +1,14 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.analytic import Analytic
 from py_ocsf_models.objects.kill_chain_phase import KillChainPhase
 from py_ocsf_models.objects.mitre_attack import MITREAttack
 from py_ocsf_models.objects.related_event import RelatedEvent
 
 
-class FindingInformation(BaseModel):
+class FindingInformation(OCSFBaseModel):
     """
     Finding Information describes metadata related to a security finding generated by a security tool or system.
 
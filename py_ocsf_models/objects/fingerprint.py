@@ -1,7 +1,7 @@
 from enum import IntEnum
 from typing import Optional
 
-from pydantic import BaseModel
+from py_ocsf_models.base_model import OCSFBaseModel
 
 
 class AlgorithmID(IntEnum):
@@ -31,7 +31,7 @@ class AlgorithmID(IntEnum):
     Other = 99
 
 
-class FingerPrint(BaseModel):
+class FingerPrint(OCSFBaseModel):
     """
     Represents a digital fingerprint created using a specific hashing algorithm. This class
     encapsulates details about the algorithm used and the resulting hash value.
@@ -1,9 +1,9 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from py_ocsf_models.base_model import OCSFBaseModel
 
 
-class GeoLocation(BaseModel):
+class GeoLocation(OCSFBaseModel):
     """
     The GeoLocation object encapsulates geographical information about a specific location. This includes details that can be used to pinpoint a location globally, identify regional characteristics, and provide additional context about the environment of the location.
 
@@ -1,9 +1,9 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from py_ocsf_models.base_model import OCSFBaseModel
 
 
-class Image(BaseModel):
+class Image(OCSFBaseModel):
     """
     Represents a container image, detailing its name, optional tag, labels, and unique identifier.
     The class encapsulates the core attributes that define a container image in a containerized environment.
@@ -1,13 +1,12 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.operating_system import OperatingSystem
 from py_ocsf_models.objects.product import Product
 
 
-class KBArticle(BaseModel):
+class KBArticle(OCSFBaseModel):
     """
     Describes a knowledgebase article, providing essential information such as its classification,
     release date, applicable operating system, and severity. It includes details like the article's
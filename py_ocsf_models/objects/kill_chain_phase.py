@@ -1,6 +1,6 @@
 from enum import IntEnum
 
-from pydantic import BaseModel
+from py_ocsf_models.base_model import OCSFBaseModel
 
 
 class PhaseID(IntEnum):
@@ -30,7 +30,7 @@ class PhaseID(IntEnum):
     Other = 99
 
 
-class KillChainPhase(BaseModel):
+class KillChainPhase(OCSFBaseModel):
     """
     Base model representing a Cyber Kill Chain phase.
 
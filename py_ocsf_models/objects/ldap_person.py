@@ -3,12 +3,13 @@ from typing import Optional
 
 # FIXME(circular-dependency)
 # from py_ocsf_models.objects.user import User
-from pydantic import BaseModel, EmailStr
+from pydantic import EmailStr
 
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.geolocation import GeoLocation
 
 
-class LDAPPerson(BaseModel):
+class LDAPPerson(OCSFBaseModel):
     """
     The LDAPPerson class encapsulates detailed information about an individual within an LDAP or Active Directory system. It is designed to model both the professional and personal attributes of a person, including their role, contact information, and organizational context.
 
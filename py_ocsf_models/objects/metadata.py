@@ -1,14 +1,13 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
-
 from py_ocsf_models import OCSF_VERSION
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.device import Device
 from py_ocsf_models.objects.product import Product
 
 
-class SchemaExtension(BaseModel):
+class SchemaExtension(OCSFBaseModel):
     """
     The OCSF Schema Extension object provides detailed information about the schema extension used to construct the event.
 
@@ -23,7 +22,7 @@ class SchemaExtension(BaseModel):
     version: str
 
 
-class Logger(BaseModel):
+class Logger(OCSFBaseModel):
     """
     The Logger object represents the device and product where events are stored with times for receipt and transmission. This may be at the source device where the event occurred, a remote scanning device, intermediate hops, or the ultimate destination.
 
@@ -54,7 +53,7 @@ class Logger(BaseModel):
     version: Optional[str] = None
 
 
-class Metadata(BaseModel):
+class Metadata(OCSFBaseModel):
     """
     The Metadata object describes the metadata associated with the event.
 
@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from py_ocsf_models.base_model import OCSFBaseModel
 
 
-class Metric(BaseModel):
+class Metric(OCSFBaseModel):
     """
     The Metric object defines a simple name/value pair entity for a metric.
     """
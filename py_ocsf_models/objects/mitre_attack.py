@@ -1,9 +1,9 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from py_ocsf_models.base_model import OCSFBaseModel
 
 
-class Technique(BaseModel):
+class Technique(OCSFBaseModel):
     """
     The Technique object describes the technique ID and/or name associated to an attack, as defined by ATT&CK MatrixTM.
 
@@ -19,7 +19,7 @@ class Technique(BaseModel):
     uid: str
 
 
-class Tactic(BaseModel):
+class Tactic(OCSFBaseModel):
     """
     The Tactic object describes the tactic ID and/or name that is associated to an attack, as defined by ATT&CK MatrixTM.
 
@@ -35,7 +35,7 @@ class Tactic(BaseModel):
     uid: Optional[str] = None
 
 
-class SubTechnique(BaseModel):
+class SubTechnique(OCSFBaseModel):
     """
     The Sub Technique object describes the sub technique ID and/or name associated to an attack, as defined by ATT&CK MatrixTM.
 
@@ -51,7 +51,7 @@ class SubTechnique(BaseModel):
     uid: Optional[str] = None
 
 
-class MITREAttack(BaseModel):
+class MITREAttack(OCSFBaseModel):
     """
     The MITRE ATT&CK® object describes the tactic, technique & sub-technique associated to an attack as defined in ATT&CK MatrixTM.
 
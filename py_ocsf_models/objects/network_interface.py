@@ -1,7 +1,7 @@
 from enum import IntEnum
 from typing import Optional
 
-from pydantic import BaseModel
+from py_ocsf_models.base_model import OCSFBaseModel
 
 
 class NetworkType(IntEnum):
@@ -25,7 +25,7 @@ class NetworkType(IntEnum):
     Other = 99
 
 
-class NetworkInterface(BaseModel):
+class NetworkInterface(OCSFBaseModel):
     """
     The Network Interface object describes the type and associated attributes of a network interface.
 
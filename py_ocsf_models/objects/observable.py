@@ -1,7 +1,7 @@
 from enum import IntEnum
 from typing import Optional
 
-from pydantic import BaseModel
+from py_ocsf_models.base_model import OCSFBaseModel
 
 
 class ReputationScoreID(IntEnum):
@@ -37,7 +37,7 @@ class ReputationScoreID(IntEnum):
     Other = 99
 
 
-class Reputation(BaseModel):
+class Reputation(OCSFBaseModel):
     """
     BaseModel class for representing reputation information.
 
@@ -109,7 +109,7 @@ class TypeID(IntEnum):
     Other = 99
 
 
-class Observable(BaseModel):
+class Observable(OCSFBaseModel):
     """
     The observable object is a pivot element that contains related information found in many places in the event.
 
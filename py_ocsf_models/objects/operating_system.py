@@ -1,7 +1,7 @@
 from enum import IntEnum
 from typing import Optional
 
-from pydantic import BaseModel
+from py_ocsf_models.base_model import OCSFBaseModel
 
 
 class TypeID(IntEnum):
@@ -19,7 +19,7 @@ class TypeID(IntEnum):
     HP_UX = 402
 
 
-class OperatingSystem(BaseModel):
+class OperatingSystem(OCSFBaseModel):
     """
     Represents the operating system, detailing its architecture, country, language, name, build, and specific editions or service packs.
     It encompasses both broad categorization and specific identifiers like CPE names.
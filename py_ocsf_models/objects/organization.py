@@ -1,9 +1,9 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from py_ocsf_models.base_model import OCSFBaseModel
 
 
-class Organization(BaseModel):
+class Organization(OCSFBaseModel):
     """
     The Organization object describes characteristics of an organization or company and its division if any.
 
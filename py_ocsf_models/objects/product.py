@@ -1,9 +1,9 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from py_ocsf_models.base_model import OCSFBaseModel
 
 
-class Feature(BaseModel):
+class Feature(OCSFBaseModel):
     """
     The Feature object provides information about the software product feature that generated a specific event. It encompasses details related to the capabilities, components, user interface (UI) design, and performance upgrades associated with the feature.
 
@@ -18,7 +18,7 @@ class Feature(BaseModel):
     version: Optional[str] = None
 
 
-class Product(BaseModel):
+class Product(OCSFBaseModel):
     """
     The Product object describes characteristics of a software product.
 
@@ -1,12 +1,11 @@
 from typing import List, Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.mitre_attack import MITREAttack
 from py_ocsf_models.objects.observable import Observable
 
 
-class RelatedEvent(BaseModel):
+class RelatedEvent(OCSFBaseModel):
     """
     Model representing a related event.
 
@@ -1,11 +1,10 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.kb_article import KBArticle
 
 
-class Remediation(BaseModel):
+class Remediation(OCSFBaseModel):
     """
     Describes the remediation strategy for addressing findings, including detailed descriptions, related knowledgebase (KB) articles,
     and external references. This class supports comprehensive remediation planning and documentation.
@@ -1,11 +1,10 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.container import Container
 
 
-class RequestElements(BaseModel):
+class RequestElements(OCSFBaseModel):
     """
     Represents the elements of an API request, especially in containerized applications.
     It includes details about the containers involved, any additional data associated with the request,
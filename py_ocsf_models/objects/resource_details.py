@@ -1,12 +1,11 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.group import Group
 from py_ocsf_models.objects.user import User
 
 
-class ResourceDetails(BaseModel):
+class ResourceDetails(OCSFBaseModel):
     """
     The Resource Details object describes details about resources that were affected by the activity/event.
 
@@ -1,9 +1,9 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from py_ocsf_models.base_model import OCSFBaseModel
 
 
-class Service(BaseModel):
+class Service(OCSFBaseModel):
     """
     Encapsulates information about a service, including its name, unique identifier, version, and any associated labels.
     This model is designed to represent services in a microservices architecture or within any application ecosystem, providing
@@ -1,9 +1,9 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from py_ocsf_models.base_model import OCSFBaseModel
 
 
-class URL(BaseModel):
+class URL(OCSFBaseModel):
     """
     The Uniform Resource Locator (URL) object describes the characteristics of a URL.
 
@@ -1,14 +1,13 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.account import Account
 from py_ocsf_models.objects.group import Group
 from py_ocsf_models.objects.ldap_person import LDAPPerson
 from py_ocsf_models.objects.organization import Organization
 
 
-class User(BaseModel):
+class User(OCSFBaseModel):
     """
     The User object describes the characteristics of a user/person or a security principal. Defined by D3FEND d3f:UserAccount.
 
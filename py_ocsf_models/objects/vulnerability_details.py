@@ -1,15 +1,14 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
-
+from py_ocsf_models.base_model import OCSFBaseModel
 from py_ocsf_models.objects.affected_software_package import AffectedSoftwarePackage
 from py_ocsf_models.objects.cve import CVE
 from py_ocsf_models.objects.cwe import CWE
 from py_ocsf_models.objects.remediation import Remediation
 
 
-class VulnerabilityDetails(BaseModel):
+class VulnerabilityDetails(OCSFBaseModel):
     """
     The vulnerability is an unintended characteristic of a computing component or system configuration that multiplies the risk of an adverse event or a loss occurring either due to accidental exposure, deliberate attack, or conflict with new system components.
 
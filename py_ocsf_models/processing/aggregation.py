@@ -0,0 +1,384 @@
+from enum import IntEnum
+from typing import Any, Iterable, Optional, Sequence
+
+from py_ocsf_models.events.findings.finding import Finding
+from py_ocsf_models.events.findings.risk_level_id import RiskLevelID
+from py_ocsf_models.events.findings.severity_id import SeverityID
+from py_ocsf_models.events.findings.status_id import StatusID
+from py_ocsf_models.processing.field_path import field_values
+from py_ocsf_models.processing.finding_batch import MISSING, FindingBatch
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        "The Finding Aggregation of py-ocsf-models needs NumPy, install it with `pip install py-ocsf-models[numpy]`"
+    ) from error
+
+DEFAULT_CHUNK_SIZE = 65_536
+
+Counts = npt.NDArray[np.int64]
+
+# The values of the enum fields read by add, besides MISSING.
+_SEVERITY_IDS = frozenset([MISSING, *SeverityID])
+_STATUS_IDS = frozenset([MISSING, *StatusID])
+_RISK_LEVEL_IDS = frozenset([MISSING, *RiskLevelID])
+
+
+class FindingAggregation:
+    """
+    The Finding Aggregation holds the counts and score statistics of findings grouped by the values of one field.
+
+    Counts by enum are two-dimensional arrays with one row per group and one column per member of the enum, in definition order, e.g. `severity_counts[group, list(SeverityID).index(SeverityID.High)]`. Findings missing an enum field are counted in `counts` only. Risk score statistics only cover the findings with a risk score, groups without any hold MISSING as their minimum and maximum.
+
+    Attributes:
+    - Group By (group_by) [Required]: The field path the findings are grouped by, e.g. `cloud.account.uid`.
+    - Groups (groups) [Required]: The values of the groups, indexed like the rows of every array, where None groups the findings missing the field.
+    - Counts (counts) [Required]: The number of findings per group.
+    - Severity Counts (severity_counts) [Required]: The number of findings per group and SeverityID.
+    - Status Counts (status_counts) [Required]: The number of findings per group and StatusID.
+    - Risk Level Counts (risk_level_counts) [Required]: The number of findings per group and RiskLevelID.
+    - Risk Score Counts (risk_score_counts) [Required]: The number of findings with a risk score per group.
+    - Risk Score Sums (risk_score_sums) [Required]: The sum of the risk scores per group.
+    - Risk Score Minimums (risk_score_minimums) [Required]: The lowest risk score per group.
+    - Risk Score Maximums (risk_score_maximums) [Required]: The highest risk score per group.
+    """
+
+    def __init__(
+        self,
+        group_by: str,
+        groups: list[Optional[str]],
+        counts: Counts,
+        severity_counts: Counts,
+        status_counts: Counts,
+        risk_level_counts: Counts,
+        risk_score_counts: Counts,
+        risk_score_sums: Counts,
+        risk_score_minimums: Counts,
+        risk_score_maximums: Counts,
+    ) -> None:
+        self.group_by = group_by
+        self.groups = groups
+        self.counts = counts
+        self.severity_counts = severity_counts
+        self.status_counts = status_counts
+        self.risk_level_counts = risk_level_counts
+        self.risk_score_counts = risk_score_counts
+        self.risk_score_sums = risk_score_sums
+        self.risk_score_minimums = risk_score_minimums
+        self.risk_score_maximums = risk_score_maximums
+
+    def risk_score_means(self) -> npt.NDArray[np.float64]:
+        """Return the mean risk score per group, NaN for groups without any risk score."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means: npt.NDArray[np.float64] = (
+                self.risk_score_sums / self.risk_score_counts
+            )
+        return means
+
+    def to_dict(self) -> dict[Optional[str], dict[str, Any]]:
+        """
+        Return the aggregation as plain data keyed by group, for dashboards.
+
+        Enum counts are keyed by member name and omit members without findings, and the risk score statistics are omitted for groups without any risk score.
+        """
+        means = self.risk_score_means().tolist()
+        result: dict[Optional[str], dict[str, Any]] = {}
+        for index, group in enumerate(self.groups):
+            entry: dict[str, Any] = {
+                "count": int(self.counts[index]),
+                "severity": _named_counts(SeverityID, self.severity_counts[index]),
+                "status": _named_counts(StatusID, self.status_counts[index]),
+                "risk_level": _named_counts(RiskLevelID, self.risk_level_counts[index]),
+            }
+            if self.risk_score_counts[index]:
+                entry["risk_score"] = {
+                    "count": int(self.risk_score_counts[index]),
+                    "min": int(self.risk_score_minimums[index]),
+                    "max": int(self.risk_score_maximums[index]),
+                    "mean": means[index],
+                }
+            result[group] = entry
+        return result
+
+
+class FindingAggregator:
+    """
+    The Finding Aggregator counts findings by severity, status and risk level and computes risk score statistics per group, in a single pass over a stream of findings.
+
+    Findings are grouped by the values of a field path, such as `cloud.account.uid`, `cloud.region` or `compliance.standards`. Paths crossing a list field group a finding under every value of the list, so a Compliance Finding with two standards is counted in both groups, and findings without any value are grouped under None. Detection, Compliance and other findings can be mixed: fields missing from a class, such as `risk_level_id` on Compliance Findings, are treated as missing.
+
+    Enum fields are only read as integer codes. Every `chunk_size` findings they are copied into NumPy arrays and counted at once with `bincount`, so memory stays bounded however long the stream is. Columns that are already encoded, such as the ones of a Finding Batch, are aggregated with `add_columns` without building any finding.
+
+    Attributes:
+    - Group By (group_by) [Required]: The field path the findings are grouped by.
+    - Chunk Size (chunk_size) [Optional]: The number of findings buffered before they are counted.
+    """
+
+    def __init__(self, group_by: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.group_by = group_by
+        self.chunk_size = chunk_size
+        self._path = group_by.split(".")
+        self._groups: list[Optional[str]] = []
+        self._group_codes: dict[Optional[str], int] = {}
+        # Buffered rows, one per finding and group value.
+        self._codes: list[int] = []
+        self._severity_ids: list[int] = []
+        self._status_ids: list[int] = []
+        self._risk_level_ids: list[int] = []
+        self._risk_scores: list[int] = []
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._severity_counts = np.zeros((0, len(SeverityID)), dtype=np.int64)
+        self._status_counts = np.zeros((0, len(StatusID)), dtype=np.int64)
+        self._risk_level_counts = np.zeros((0, len(RiskLevelID)), dtype=np.int64)
+        self._risk_score_counts = np.zeros(0, dtype=np.int64)
+        self._risk_score_sums = np.zeros(0, dtype=np.int64)
+        self._risk_score_minimums = np.zeros(0, dtype=np.int64)
+        self._risk_score_maximums = np.zeros(0, dtype=np.int64)
+
+    def add(self, finding: Finding) -> None:
+        """Add a finding to the aggregation, raising a ValueError when one of its enum fields is not a member of its enum."""
+        # Reading __dict__ skips the slow attribute lookup of pydantic for fields missing from the class.
+        values = finding.__dict__
+        severity_id = values.get("severity_id")
+        status_id = values.get("status_id")
+        risk_level_id = values.get("risk_level_id")
+        risk_score = values.get("risk_score")
+        severity_id = MISSING if severity_id is None else int(severity_id)
+        status_id = MISSING if status_id is None else int(status_id)
+        risk_level_id = MISSING if risk_level_id is None else int(risk_level_id)
+        risk_score = MISSING if risk_score is None else int(risk_score)
+        # Enum values are checked before the finding is buffered, so an invalid finding leaves the buffer untouched.
+        if (
+            severity_id not in _SEVERITY_IDS
+            or status_id not in _STATUS_IDS
+            or risk_level_id not in _RISK_LEVEL_IDS
+        ):
+            _enum_columns(SeverityID, np.array([severity_id]))
+            _enum_columns(StatusID, np.array([status_id]))
+            _enum_columns(RiskLevelID, np.array([risk_level_id]))
+        groups = [str(value) for value in field_values(finding, self._path)]
+        for group in groups or (None,):
+            self._codes.append(self._code(group))
+            self._severity_ids.append(severity_id)
+            self._status_ids.append(status_id)
+            self._risk_level_ids.append(risk_level_id)
+            self._risk_scores.append(risk_score)
+        if len(self._codes) >= self.chunk_size:
+            self._flush()
+
+    def update(self, findings: Iterable[Finding]) -> None:
+        """Add every finding of an iterable to the aggregation."""
+        for finding in findings:
+            self.add(finding)
+
+    def add_columns(
+        self,
+        group_codes: npt.NDArray[np.integer[Any]],
+        groups: Sequence[Optional[str]],
+        severity_id: Optional[npt.NDArray[np.integer[Any]]] = None,
+        status_id: Optional[npt.NDArray[np.integer[Any]]] = None,
+        risk_level_id: Optional[npt.NDArray[np.integer[Any]]] = None,
+        risk_score: Optional[npt.NDArray[np.integer[Any]]] = None,
+    ) -> None:
+        """
+        Add findings given as columns to the aggregation.
+
+        Groups are dictionary-encoded: `group_codes` holds, for every finding, the index of its group in `groups` or MISSING. Enum and score columns hold the integer values of the fields or MISSING, and columns that are not given are missing for every finding. A value that is not a member of its enum raises a ValueError before anything is added.
+        """
+        missing = np.full(len(group_codes), MISSING, dtype=np.int64)
+        # Enum values are checked before any group is added.
+        severity_columns = _enum_columns(
+            SeverityID, missing if severity_id is None else severity_id
+        )
+        status_columns = _enum_columns(
+            StatusID, missing if status_id is None else status_id
+        )
+        risk_level_columns = _enum_columns(
+            RiskLevelID, missing if risk_level_id is None else risk_level_id
+        )
+        # MISSING codes index the trailing None group, only added when a finding is missing its group.
+        missing_code = self._code(None) if np.any(group_codes == MISSING) else MISSING
+        lookup = np.array(
+            [self._code(group) for group in groups] + [missing_code], dtype=np.int64
+        )
+        self._accumulate(
+            lookup[group_codes],
+            severity_columns,
+            status_columns,
+            risk_level_columns,
+            missing if risk_score is None else risk_score,
+        )
+
+    def add_batch(self, batch: FindingBatch[Any]) -> None:
+        """Add the findings of a Finding Batch to the aggregation, grouped by one of its dictionary-encoded columns."""
+        if self.group_by not in batch.codes:
+            raise ValueError(
+                f"The Finding Batch has no dictionary-encoded column {self.group_by}"
+            )
+        self.add_columns(
+            batch.codes[self.group_by],
+            batch.dictionaries[self.group_by],
+            batch.columns.get("severity_id"),
+            batch.columns.get("status_id"),
+            batch.columns.get("risk_level_id"),
+            batch.columns.get("risk_score"),
+        )
+
+    def result(self) -> FindingAggregation:
+        """Return the aggregation of every finding added so far."""
+        self._flush()
+        self._grow()
+        minimums = self._risk_score_minimums.copy()
+        maximums = self._risk_score_maximums.copy()
+        unscored = self._risk_score_counts == 0
+        minimums[unscored] = MISSING
+        maximums[unscored] = MISSING
+        return FindingAggregation(
+            self.group_by,
+            list(self._groups),
+            self._counts.copy(),
+            self._severity_counts.copy(),
+            self._status_counts.copy(),
+            self._risk_level_counts.copy(),
+            self._risk_score_counts.copy(),
+            self._risk_score_sums.copy(),
+            minimums,
+            maximums,
+        )
+
+    def _code(self, group: Optional[str]) -> int:
+        code = self._group_codes.get(group)
+        if code is None:
+            code = self._group_codes[group] = len(self._groups)
+            self._groups.append(group)
+        return code
+
+    def _flush(self) -> None:
+        if not self._codes:
+            return
+        self._accumulate(
+            np.array(self._codes, dtype=np.int64),
+            _enum_columns(SeverityID, np.array(self._severity_ids, dtype=np.int64)),
+            _enum_columns(StatusID, np.array(self._status_ids, dtype=np.int64)),
+            _enum_columns(RiskLevelID, np.array(self._risk_level_ids, dtype=np.int64)),
+            np.array(self._risk_scores, dtype=np.int64),
+        )
+        self._codes.clear()
+        self._severity_ids.clear()
+        self._status_ids.clear()
+        self._risk_level_ids.clear()
+        self._risk_scores.clear()
+
+    def _grow(self) -> None:
+        # Groups found since the last chunk get zeroed rows, minimums start from the largest score.
+        extra = len(self._groups) - len(self._counts)
+        if extra <= 0:
+            return
+        self._counts = _extend(self._counts, extra, 0)
+        self._severity_counts = _extend(self._severity_counts, extra, 0)
+        self._status_counts = _extend(self._status_counts, extra, 0)
+        self._risk_level_counts = _extend(self._risk_level_counts, extra, 0)
+        self._risk_score_counts = _extend(self._risk_score_counts, extra, 0)
+        self._risk_score_sums = _extend(self._risk_score_sums, extra, 0)
+        self._risk_score_minimums = _extend(
+            self._risk_score_minimums, extra, np.iinfo(np.int64).max
+        )
+        self._risk_score_maximums = _extend(
+            self._risk_score_maximums, extra, np.iinfo(np.int64).min
+        )
+
+    def _accumulate(
+        self,
+        codes: npt.NDArray[np.int64],
+        severity_columns: npt.NDArray[np.int64],
+        status_columns: npt.NDArray[np.int64],
+        risk_level_columns: npt.NDArray[np.int64],
+        risk_scores: npt.NDArray[np.integer[Any]],
+    ) -> None:
+        # Enum values come as the columns of their members, see _enum_columns.
+        self._grow()
+        group_count = len(self._groups)
+        self._counts += np.bincount(codes, minlength=group_count)
+        self._severity_counts += _enum_counts(
+            SeverityID, codes, severity_columns, group_count
+        )
+        self._status_counts += _enum_counts(
+            StatusID, codes, status_columns, group_count
+        )
+        self._risk_level_counts += _enum_counts(
+            RiskLevelID, codes, risk_level_columns, group_count
+        )
+        scored = risk_scores != MISSING
+        scored_codes = codes[scored]
+        scores = risk_scores[scored].astype(np.int64)
+        self._risk_score_counts += np.bincount(scored_codes, minlength=group_count)
+        self._risk_score_sums += np.bincount(
+            scored_codes, weights=scores, minlength=group_count
+        ).astype(np.int64)
+        np.minimum.at(self._risk_score_minimums, scored_codes, scores)
+        np.maximum.at(self._risk_score_maximums, scored_codes, scores)
+
+
+def aggregate(
+    findings: Iterable[Finding], group_by: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> FindingAggregation:
+    """Aggregate findings by the values of a field path, see FindingAggregator."""
+    aggregator = FindingAggregator(group_by, chunk_size)
+    aggregator.update(findings)
+    return aggregator.result()
+
+
+def _enum_columns(
+    enum: type[IntEnum], values: npt.NDArray[np.integer[Any]]
+) -> npt.NDArray[np.int64]:
+    # Enum values are sparse, e.g. Other is 99, so they are mapped to the column of their member, keeping MISSING.
+    lookup = _enum_lookup(enum)
+    present = values != MISSING
+    in_range = present & (values >= 0) & (values < len(lookup))
+    columns = np.full(len(values), MISSING, dtype=np.int64)
+    columns[in_range] = lookup[values[in_range]]
+    invalid = present & (columns == MISSING)
+    if invalid.any():
+        raise ValueError(f"{values[invalid][0]} is not a valid {enum.__name__}")
+    return columns
+
+
+def _enum_counts(
+    enum: type[IntEnum],
+    codes: npt.NDArray[np.int64],
+    columns: npt.NDArray[np.int64],
+    group_count: int,
+) -> Counts:
+    present = columns != MISSING
+    width = len(enum)
+    counts = np.bincount(
+        codes[present] * width + columns[present], minlength=group_count * width
+    )
+    return counts.reshape(group_count, width)
+
+
+_enum_lookups: dict[type[IntEnum], npt.NDArray[np.int64]] = {}
+
+
+def _enum_lookup(enum: type[IntEnum]) -> npt.NDArray[np.int64]:
+    lookup = _enum_lookups.get(enum)
+    if lookup is None:
+        # Values between the members are MISSING.
+        members = list(enum)
+        lookup = np.full(max(members) + 1, MISSING, dtype=np.int64)
+        lookup[members] = np.arange(len(members))
+        _enum_lookups[enum] = lookup
+    return lookup
+
+
+def _extend(array: Counts, extra: int, fill: int) -> Counts:
+    padding = np.full((extra, *array.shape[1:]), fill, dtype=array.dtype)
+    return np.concatenate((array, padding))
+
+
+def _named_counts(enum: type[IntEnum], counts: Counts) -> dict[str, int]:
+    return {member.name: count for member, count in zip(enum, counts.tolist()) if count}
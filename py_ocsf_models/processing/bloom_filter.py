@@ -0,0 +1,54 @@
+import math
+
+
+class BloomFilter:
+    """
+    The Bloom Filter is a fixed-size probabilistic set of fingerprints.
+
+    Membership checks never miss an added fingerprint but report a fingerprint that was never added with a probability close to the configured error rate, as long as no more than `capacity` fingerprints are added. Its memory is fixed when it is created, roughly 1.8 bytes per expected fingerprint for a 0.1% error rate. Keys are expected to be uniformly distributed hashes of at least 16 bytes, such as finding fingerprints, so bit positions are derived from them without hashing again.
+
+    Attributes:
+    - Capacity (capacity) [Required]: The number of fingerprints the filter is sized for.
+    - Error Rate (error_rate) [Optional]: The expected false positive probability at full capacity.
+    - Size (size): The number of bits of the filter.
+    - Hash Count (hash_count): The number of bits set per fingerprint.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def add(self, key: bytes) -> bool:
+        """Add a fingerprint and return whether it was probably present already."""
+        present = True
+        for position in self._positions(key):
+            byte, bit = divmod(position, 8)
+            mask = 1 << bit
+            if not self._bits[byte] & mask:
+                present = False
+                self._bits[byte] |= mask
+        return present
+
+    def __contains__(self, key: bytes) -> bool:
+        for position in self._positions(key):
+            byte, bit = divmod(position, 8)
+            if not self._bits[byte] & (1 << bit):
+                return False
+        return True
+
+    def _positions(self, key: bytes) -> list[int]:
+        # Double hashing: the i-th position is h1 + i * h2, both taken from the key itself.
+        first = int.from_bytes(key[:8], "little")
+        second = int.from_bytes(key[8:16], "little") | 1
+        return [
+            (first + index * second) % self.size for index in range(self.hash_count)
+        ]
@@ -0,0 +1,89 @@
+from typing import Any, Callable, Generic, Iterable, Iterator, Optional, TypeVar
+
+from py_ocsf_models.events.findings.finding import Finding
+from py_ocsf_models.processing.bloom_filter import BloomFilter
+from py_ocsf_models.processing.fingerprint import finding_fingerprint
+
+FindingT = TypeVar("FindingT", bound=Finding)
+
+Fingerprint = Callable[[Finding], bytes]
+
+
+class FindingDeduplicator(Generic[FindingT]):
+    """
+    The Finding Deduplicator collapses findings that share the same identity fingerprint.
+
+    In the exact mode every distinct finding is kept in memory: a copy of the first occurrence of a fingerprint is kept, so the added findings are left untouched, and the `count` of every later occurrence is added to the copy, counting findings without a `count` as one. Finding classes without a `count` field just drop their duplicates.
+
+    With a capacity, the deduplicator runs in bounded memory instead. It only remembers fingerprints in a Bloom filter, so the first occurrence of every fingerprint is passed on as soon as it is seen and later occurrences are dropped without being counted. A small fraction of distinct findings, close to the error rate, is dropped as well.
+
+    Attributes:
+    - Capacity (capacity) [Optional]: The number of distinct findings the Bloom filter is sized for, or None for the exact mode.
+    - Error Rate (error_rate) [Optional]: The probability of dropping a distinct finding in the bounded mode.
+    - Fingerprint (fingerprint) [Optional]: The function computing the identity of a finding, `finding_fingerprint` by default.
+    - Seen (seen): The number of findings added so far.
+    - Duplicates (duplicates): The number of findings collapsed into an earlier one so far.
+    """
+
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        error_rate: float = 0.001,
+        fingerprint: Fingerprint = finding_fingerprint,
+    ) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.fingerprint = fingerprint
+        self.seen = 0
+        self.duplicates = 0
+        self._filter = BloomFilter(capacity, error_rate) if capacity else None
+        self._findings: dict[bytes, FindingT] = {}
+
+    def add(self, finding: FindingT) -> bool:
+        """Add a finding and return whether it is the first occurrence of its fingerprint."""
+        self.seen += 1
+        key = self.fingerprint(finding)
+        if self._filter is not None:
+            if self._filter.add(key):
+                self.duplicates += 1
+                return False
+            return True
+        kept = self._findings.get(key)
+        if kept is None:
+            self._findings[key] = finding.model_copy()
+            return True
+        self.duplicates += 1
+        if "count" in type(kept).model_fields:
+            # Only some finding classes declare a count.
+            counted: Any = kept
+            counted.count = (counted.count or 1) + (
+                getattr(finding, "count", None) or 1
+            )
+        return False
+
+    def findings(self) -> Iterator[FindingT]:
+        """Yield the distinct findings kept in the exact mode, in the order they were first seen."""
+        return iter(self._findings.values())
+
+
+def deduplicate(
+    findings: Iterable[FindingT],
+    capacity: Optional[int] = None,
+    error_rate: float = 0.001,
+) -> Iterator[FindingT]:
+    """
+    Yield the distinct findings of a stream, collapsing duplicates with a Finding Deduplicator.
+
+    In the exact mode the distinct findings, with their aggregated `count`, are yielded once the input is exhausted. With a capacity the stream is deduplicated in bounded memory and first occurrences are yielded right away.
+    """
+    deduplicator: FindingDeduplicator[FindingT] = FindingDeduplicator(
+        capacity, error_rate
+    )
+    if capacity:
+        for finding in findings:
+            if deduplicator.add(finding):
+                yield finding
+        return
+    for finding in findings:
+        deduplicator.add(finding)
+    yield from deduplicator.findings()
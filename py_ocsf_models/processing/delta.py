@@ -0,0 +1,177 @@
+import os
+import time
+from datetime import datetime, timezone
+from enum import IntEnum
+from hashlib import blake2b
+from typing import Any, Iterable, Iterator, Optional, TypeVar, Union
+
+from py_ocsf_models.events.findings.activity_id import ActivityID
+from py_ocsf_models.events.findings.finding import Finding
+from py_ocsf_models.events.findings.status_id import StatusID
+from py_ocsf_models.processing.external_sort import (
+    DEFAULT_CHUNK_SIZE,
+    sort_by_fingerprint,
+)
+
+FindingT = TypeVar("FindingT", bound=Finding)
+
+# Fields that change between scans without the finding itself changing.
+VOLATILE_FIELDS: dict[str, Any] = {
+    "time": True,
+    "time_dt": True,
+    "count": True,
+    "activity_id": True,
+    "activity_name": True,
+    "type_uid": True,
+    "type_name": True,
+    "status": True,
+    "status_id": True,
+    "metadata": {
+        "processed_time",
+        "processed_time_dt",
+        "logged_time",
+        "logged_time_dt",
+    },
+    "finding_info": {
+        "first_seen_time",
+        "first_seen_time_dt",
+        "last_seen_time",
+        "last_seen_time_dt",
+        "modified_time",
+        "modified_time_dt",
+    },
+}
+
+
+def scan_delta(
+    previous: Iterable[FindingT],
+    current: Iterable[FindingT],
+    scan_time: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    directory: Optional[Union[str, "os.PathLike[str]"]] = None,
+) -> Iterator[FindingT]:
+    """
+    Compare the findings of two scans and yield only the findings that changed, with their status set.
+
+    Findings are matched by `finding_fingerprint`. Both scans are streamed through `sort_by_fingerprint` and compared with a sorted merge, so memory stays bounded by `chunk_size` findings per scan whatever their size. The previous scan is typically read back from disk, e.g. with `read_parquet`.
+
+    - Findings only in the current scan are new: `status_id` New, `activity_id` Create.
+    - Findings in both scans whose content changed, ignoring the VOLATILE_FIELDS, are updated: `activity_id` Update, keeping the `status_id` of the previous scan (New by default). Findings resolved in the previous scan are reopened as New.
+    - Findings only in the previous scan are resolved: `status_id` Resolved, `activity_id` Close, `time` and, when set, `time_dt` set to `scan_time`. Findings that were already resolved are not yielded again.
+    - Unchanged findings are not yielded.
+
+    `finding_info.first_seen_time` is carried forward from the previous scan and `last_seen_time` is set to the `time` of the current finding. OCSF has no Updated status, so updates are reported through `activity_id` and `type_uid`. Yielded findings are copies; the input findings are left untouched.
+    """
+    resolved_time = int(time.time()) if scan_time is None else scan_time
+    previous_findings = _unique(
+        sort_by_fingerprint(previous, chunk_size=chunk_size, directory=directory)
+    )
+    current_findings = _unique(
+        sort_by_fingerprint(current, chunk_size=chunk_size, directory=directory)
+    )
+    previous_pair = next(previous_findings, None)
+    current_pair = next(current_findings, None)
+    while previous_pair is not None or current_pair is not None:
+        if previous_pair is not None and (
+            current_pair is None or previous_pair[0] < current_pair[0]
+        ):
+            if previous_pair[1].status_id != StatusID.Resolved:
+                yield _resolved(previous_pair[1], resolved_time)
+            previous_pair = next(previous_findings, None)
+        elif current_pair is not None and (
+            previous_pair is None or current_pair[0] < previous_pair[0]
+        ):
+            yield _new(current_pair[1])
+            current_pair = next(current_findings, None)
+        elif previous_pair is not None and current_pair is not None:
+            previous_finding = previous_pair[1]
+            current_finding = current_pair[1]
+            if previous_finding.status_id == StatusID.Resolved:
+                yield _updated(previous_finding, current_finding, StatusID.New)
+            elif content_digest(previous_finding) != content_digest(current_finding):
+                yield _updated(
+                    previous_finding,
+                    current_finding,
+                    previous_finding.status_id or StatusID.New,
+                )
+            previous_pair = next(previous_findings, None)
+            current_pair = next(current_findings, None)
+
+
+def content_digest(finding: Finding) -> bytes:
+    """Return a digest of the content of a finding, leaving out the VOLATILE_FIELDS."""
+    content = finding.__pydantic_serializer__.to_json(
+        finding, exclude=VOLATILE_FIELDS, exclude_none=True
+    )
+    return blake2b(content, digest_size=16).digest()
+
+
+def _unique(
+    pairs: Iterator[tuple[bytes, FindingT]],
+) -> Iterator[tuple[bytes, FindingT]]:
+    # A scan reporting the same finding twice is compared through its first occurrence.
+    last_key = None
+    for key, finding in pairs:
+        if key != last_key:
+            yield key, finding
+            last_key = key
+
+
+def _new(finding: FindingT) -> FindingT:
+    first_seen = finding.finding_info.first_seen_time
+    seen_time = getattr(finding, "time", None)
+    return _with_status(
+        finding,
+        StatusID.New,
+        ActivityID.Create,
+        first_seen_time=seen_time if first_seen is None else first_seen,
+        last_seen_time=seen_time,
+    )
+
+
+def _updated(previous: FindingT, current: FindingT, status: StatusID) -> FindingT:
+    first_seen = previous.finding_info.first_seen_time
+    return _with_status(
+        current,
+        status,
+        ActivityID.Update,
+        first_seen_time=(
+            getattr(previous, "time", None) if first_seen is None else first_seen
+        ),
+        last_seen_time=getattr(current, "time", None),
+    )
+
+
+def _resolved(finding: FindingT, scan_time: int) -> FindingT:
+    resolved = _with_status(finding, StatusID.Resolved, ActivityID.Close)
+    # The event times are declared by the finding classes, not by Finding.
+    event: Any = resolved
+    event.time = scan_time
+    if getattr(event, "time_dt", None) is not None:
+        event.time_dt = datetime.fromtimestamp(scan_time, tz=timezone.utc)
+    return resolved
+
+
+def _with_status(
+    finding: FindingT, status: StatusID, activity: ActivityID, **seen_times: Any
+) -> FindingT:
+    updated = finding.model_copy()
+    updated.status_id = status
+    updated.status = status.name
+    updated.activity_id = activity
+    updated.activity_name = activity.name
+    type_field = type(finding).model_fields.get("type_uid")
+    if type_field is not None:
+        type_uid = getattr(finding, "class_uid", 0) * 100 + activity
+        if isinstance(type_field.annotation, type) and issubclass(
+            type_field.annotation, IntEnum
+        ):
+            type_uid = type_field.annotation(type_uid)
+        event: Any = updated
+        event.type_uid = type_uid
+    if seen_times:
+        finding_info = finding.finding_info.model_copy()
+        for name, value in seen_times.items():
+            setattr(finding_info, name, value)
+        updated.finding_info = finding_info
+    return updated
@@ -0,0 +1,23 @@
+from typing import Any, Sequence
+
+from pydantic import BaseModel
+
+
+def field_values(model: BaseModel, path: Sequence[str]) -> list[Any]:
+    """
+    Return the values of a field path within a model, e.g. `("resources", "uid")`.
+
+    Paths crossing a list field collect the values of every item of the list, so a path can have any number of values. Missing fields, fields set to None and fields missing from the model class yield no value.
+    """
+    values: list[Any] = [model]
+    for name in path:
+        nested: list[Any] = []
+        for item in values:
+            # Reading __dict__ skips the slow attribute lookup of pydantic for fields missing from the class.
+            field = item.__dict__.get(name) if isinstance(item, BaseModel) else None
+            if isinstance(field, list):
+                nested.extend(element for element in field if element is not None)
+            elif field is not None:
+                nested.append(field)
+        values = nested
+    return values
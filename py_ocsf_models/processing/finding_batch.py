@@ -0,0 +1,237 @@
+from typing import Any, Generic, Iterable, Iterator, Optional, Sequence, TypeVar, Union
+
+from py_ocsf_models.events.findings.finding import Finding
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        "The Finding Batch of py-ocsf-models needs NumPy, install it with `pip install py-ocsf-models[numpy]`"
+    ) from error
+
+FindingT = TypeVar("FindingT", bound=Finding)
+
+# Scalar columns and their dtypes, missing values are stored as MISSING.
+SCALAR_COLUMNS: dict[str, Any] = {
+    "severity_id": np.int8,
+    "status_id": np.int8,
+    "risk_level_id": np.int8,
+    "time": np.int64,
+    "risk_score": np.int32,
+    "impact_score": np.int32,
+    "confidence_score": np.int32,
+}
+
+# String columns stored as codes into a list of distinct values, missing values are coded as MISSING.
+DICTIONARY_COLUMNS = ("cloud.region", "cloud.account.uid", "finding_info.uid")
+
+MISSING = -1
+
+Mask = npt.NDArray[np.bool_]
+
+
+class FindingBatch(Generic[FindingT]):
+    """
+    The Finding Batch holds a batch of findings of one class column-wise, for vectorized filtering, counting and sorting.
+
+    Scalar fields such as `severity_id` or `time` are stored in NumPy arrays and string fields such as `cloud.region` are dictionary-encoded: each row holds an integer code into the list of distinct values of the column. Missing values are stored as MISSING, both as scalars and as codes. Every finding is also kept serialized as JSON, so rows are only turned back into findings when they are accessed by index or iteration.
+
+    Filtering and sorting return new batches sharing the serialized findings, the dictionaries and the lookups of the original batch.
+
+    Attributes:
+    - Finding Class (cls) [Required]: The finding class the rows are materialized as.
+    - Columns (columns) [Required]: The scalar columns, by field path.
+    - Codes (codes) [Required]: The codes of the dictionary-encoded columns, by field path.
+    - Dictionaries (dictionaries) [Required]: The distinct values of the dictionary-encoded columns, indexed by code, by field path.
+    - Lookups (lookups) [Required]: The code of every distinct value of the dictionary-encoded columns, by field path, so queries resolve values to codes without searching the dictionaries.
+    """
+
+    def __init__(
+        self,
+        cls: type[FindingT],
+        columns: dict[str, npt.NDArray[Any]],
+        codes: dict[str, npt.NDArray[np.int32]],
+        dictionaries: dict[str, list[str]],
+        lookups: dict[str, dict[str, int]],
+        rows: bytes,
+        row_offsets: npt.NDArray[np.int64],
+    ) -> None:
+        self.cls = cls
+        self.columns = columns
+        self.codes = codes
+        self.dictionaries = dictionaries
+        self.lookups = lookups
+        self._rows = rows
+        # The start and end offsets of every row in the serialized findings.
+        self._row_offsets = row_offsets
+
+    @classmethod
+    def from_findings(
+        cls,
+        findings: Iterable[FindingT],
+        scalar_columns: Optional[dict[str, Any]] = None,
+        dictionary_columns: Sequence[str] = DICTIONARY_COLUMNS,
+        finding_class: Optional[type[FindingT]] = None,
+    ) -> "FindingBatch[FindingT]":
+        """
+        Build a batch from findings of one class.
+
+        `scalar_columns` maps integer field paths to their NumPy dtypes and defaults to SCALAR_COLUMNS. Paths missing from the finding class, such as `cloud.region` on Compliance Findings, hold MISSING. The finding class is taken from the first finding unless given, which is needed for empty batches.
+        """
+        if scalar_columns is None:
+            scalar_columns = SCALAR_COLUMNS
+        scalar_paths = [path.split(".") for path in scalar_columns]
+        dictionary_paths = [path.split(".") for path in dictionary_columns]
+        scalars: list[list[int]] = [[] for _ in scalar_paths]
+        codes: list[list[int]] = [[] for _ in dictionary_paths]
+        lookups: list[dict[str, int]] = [{} for _ in dictionary_paths]
+        rows = bytearray()
+        offsets = [0]
+        for finding in findings:
+            if finding_class is None:
+                finding_class = type(finding)
+            elif type(finding) is not finding_class:
+                raise ValueError(
+                    f"A Finding Batch holds findings of one class, got {type(finding).__name__} and {finding_class.__name__}"
+                )
+            for values, path in zip(scalars, scalar_paths):
+                value = _resolve(finding, path)
+                values.append(MISSING if value is None else int(value))
+            for values, lookup, path in zip(codes, lookups, dictionary_paths):
+                value = _resolve(finding, path)
+                values.append(
+                    MISSING if value is None else lookup.setdefault(value, len(lookup))
+                )
+            rows += finding.__pydantic_serializer__.to_json(finding, exclude_unset=True)
+            offsets.append(len(rows))
+        if finding_class is None:
+            raise ValueError("The finding class of an empty Finding Batch is required")
+        bounds = np.array(offsets, dtype=np.int64)
+        return cls(
+            finding_class,
+            {
+                path: np.array(values, dtype=dtype)
+                for (path, dtype), values in zip(scalar_columns.items(), scalars)
+            },
+            {
+                path: np.array(values, dtype=np.int32)
+                for path, values in zip(dictionary_columns, codes)
+            },
+            {path: list(lookup) for path, lookup in zip(dictionary_columns, lookups)},
+            dict(zip(dictionary_columns, lookups)),
+            bytes(rows),
+            np.stack((bounds[:-1], bounds[1:]), axis=1),
+        )
+
+    def __len__(self) -> int:
+        return len(self._row_offsets)
+
+    def __getitem__(self, index: int) -> FindingT:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("FindingBatch index out of range")
+        start, end = self._row_offsets[index]
+        return self.cls.model_validate_json(self._rows[start:end])
+
+    def __iter__(self) -> Iterator[FindingT]:
+        for start, end in self._row_offsets.tolist():
+            yield self.cls.model_validate_json(self._rows[start:end])
+
+    def column(self, path: str) -> npt.NDArray[Any]:
+        """Return a scalar column, or the values of a dictionary-encoded column as an array of strings and None."""
+        if path in self.columns:
+            return self.columns[path]
+        values = np.array([*self.dictionaries[path], None], dtype=object)
+        # MISSING codes index the trailing None.
+        return values[self.codes[path]]
+
+    def equals(self, path: str, value: Union[int, str, None]) -> Mask:
+        """Return the mask of the rows whose field equals a value, where None matches missing values."""
+        mask: Mask
+        if path in self.columns:
+            mask = self.columns[path] == (MISSING if value is None else value)
+        elif value is None:
+            mask = self.codes[path] == MISSING
+        elif isinstance(value, str) and value in self.lookups[path]:
+            mask = self.codes[path] == self.lookups[path][value]
+        else:
+            mask = np.zeros(len(self), dtype=np.bool_)
+        return mask
+
+    def isin(self, path: str, values: Iterable[Union[int, str]]) -> Mask:
+        """Return the mask of the rows whose field equals one of the values."""
+        if path in self.columns:
+            return np.isin(self.columns[path], list(values))
+        lookup = self.lookups[path]
+        matching = np.array(
+            [
+                lookup[value]
+                for value in values
+                if isinstance(value, str) and value in lookup
+            ],
+            dtype=np.int32,
+        )
+        return np.isin(self.codes[path], matching)
+
+    def filter(self, mask: Mask) -> "FindingBatch[FindingT]":
+        """Return a batch with the rows selected by a boolean mask."""
+        return self.take(np.flatnonzero(mask))
+
+    def take(self, indices: npt.NDArray[np.intp]) -> "FindingBatch[FindingT]":
+        """Return a batch with the rows at the given positions, in that order."""
+        return FindingBatch(
+            self.cls,
+            {path: values[indices] for path, values in self.columns.items()},
+            {path: codes[indices] for path, codes in self.codes.items()},
+            self.dictionaries,
+            self.lookups,
+            self._rows,
+            self._row_offsets[indices],
+        )
+
+    def sort_by(self, path: str, descending: bool = False) -> "FindingBatch[FindingT]":
+        """
+        Return a batch sorted by a column.
+
+        The sort is stable and dictionary-encoded columns are sorted by their values, not by their codes. Missing values come first in ascending order.
+        """
+        keys = self.columns.get(path)
+        if keys is None:
+            dictionary = self.dictionaries[path]
+            ranks = np.empty(len(dictionary) + 1, dtype=np.int64)
+            # Rank every value among the sorted values, MISSING codes take the last slot, ranked first.
+            ranks[np.argsort(np.array(dictionary, dtype=object), kind="stable")] = (
+                np.arange(1, len(dictionary) + 1)
+            )
+            ranks[-1] = 0
+            keys = ranks[self.codes[path]]
+        order = np.argsort(-keys if descending else keys, kind="stable")
+        return self.take(order)
+
+    def count_by(self, path: str) -> dict[Union[int, str, None], int]:
+        """Count the rows per value of a column, counting missing values under None."""
+        counts: dict[Union[int, str, None], int] = {}
+        if path in self.columns:
+            values, value_counts = np.unique(self.columns[path], return_counts=True)
+            for value, count in zip(values.tolist(), value_counts.tolist()):
+                counts[None if value == MISSING else value] = count
+            return counts
+        dictionary = self.dictionaries[path]
+        code_counts = np.bincount(self.codes[path] + 1, minlength=len(dictionary) + 1)
+        if code_counts[0]:
+            counts[None] = int(code_counts[0])
+        for value, count in zip(dictionary, code_counts[1:].tolist()):
+            if count:
+                counts[value] = count
+        return counts
+
+
+def _resolve(finding: Finding, path: list[str]) -> Any:
+    value: Any = finding
+    for name in path:
+        value = getattr(value, name, None)
+        if value is None:
+            return None
+    return value
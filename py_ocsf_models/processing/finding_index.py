@@ -0,0 +1,144 @@
+from typing import (
+    Any,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from py_ocsf_models.events.findings.finding import Finding
+from py_ocsf_models.processing.field_path import field_values
+
+FindingT = TypeVar("FindingT", bound=Finding)
+
+INDEXED_PATHS = (
+    "finding_info.uid",
+    "cloud.account.uid",
+    "resources.uid",
+    "vulnerabilities.cve.uid",
+    "finding_info.attacks.technique.uid",
+)
+
+# The rows holding a value, kept in a dict rather than a set so lookups return findings in insertion order.
+Postings = dict[int, None]
+
+
+class FindingIndex(Generic[FindingT]):
+    """
+    The Finding Index answers lookups such as "every finding of resource X" or "every finding mapped to technique T1078" from hash indexes instead of scanning every finding.
+
+    Every indexed field path maps each of its values to the rows of the findings holding it. Paths crossing a list field, such as `resources.uid`, index a finding under every value of the list. Findings of different classes can be indexed together, fields missing from a class, such as `vulnerabilities` on Compliance Findings, are simply not indexed.
+
+    `add` returns the row of the finding, which `remove` takes to drop it from every index. The values of a finding are read when it is added, so a finding changed afterwards must be removed and added again for the indexes to reflect it.
+
+    Attributes:
+    - Paths (paths) [Optional]: The indexed field paths, INDEXED_PATHS by default.
+    """
+
+    def __init__(
+        self,
+        findings: Iterable[FindingT] = (),
+        paths: Sequence[str] = INDEXED_PATHS,
+    ) -> None:
+        self.paths = tuple(paths)
+        self._split_paths = [path.split(".") for path in self.paths]
+        self._indexes: dict[str, dict[Any, Postings]] = {path: {} for path in paths}
+        self._findings: dict[int, FindingT] = {}
+        # The postings holding every row, to remove it without reading the finding again.
+        self._row_postings: dict[int, list[tuple[dict[Any, Postings], Any]]] = {}
+        self._next_row = 0
+        self.update(findings)
+
+    def __len__(self) -> int:
+        return len(self._findings)
+
+    def __iter__(self) -> Iterator[FindingT]:
+        return iter(self._findings.values())
+
+    def __contains__(self, row: object) -> bool:
+        return row in self._findings
+
+    def __getitem__(self, row: int) -> FindingT:
+        return self._findings[row]
+
+    def add(self, finding: FindingT) -> int:
+        """Index a finding and return its row."""
+        row = self._next_row
+        self._next_row += 1
+        self._findings[row] = finding
+        row_postings = []
+        for path, split_path in zip(self.paths, self._split_paths):
+            index = self._indexes[path]
+            for value in field_values(finding, split_path):
+                postings = index.get(value)
+                if postings is None:
+                    postings = index[value] = {}
+                elif row in postings:
+                    # The value repeats within the finding, e.g. two resources with the same uid.
+                    continue
+                postings[row] = None
+                row_postings.append((index, value))
+        self._row_postings[row] = row_postings
+        return row
+
+    def update(self, findings: Iterable[FindingT]) -> list[int]:
+        """Index every finding of an iterable and return their rows."""
+        return [self.add(finding) for finding in findings]
+
+    def remove(self, row: int) -> FindingT:
+        """Drop the finding of a row from every index and return it, raising a KeyError for unknown rows."""
+        finding = self._findings.pop(row)
+        for index, value in self._row_postings.pop(row):
+            postings = index[value]
+            del postings[row]
+            if not postings:
+                del index[value]
+        return finding
+
+    def rows(self, path: str, value: Any) -> list[int]:
+        """Return the rows of the findings holding a value at an indexed path, in insertion order."""
+        return list(self._postings(path, value))
+
+    def find(self, path: str, value: Any) -> list[FindingT]:
+        """Return the findings holding a value at an indexed path, in insertion order."""
+        findings = self._findings
+        return [findings[row] for row in self._postings(path, value)]
+
+    def find_all(self, conditions: Mapping[str, Any]) -> list[FindingT]:
+        """
+        Return the findings matching every condition, mapping indexed paths to values, in insertion order.
+
+        The rows of the rarest value are checked against the others, so a selective condition keeps the lookup cheap.
+        """
+        if not conditions:
+            return list(self._findings.values())
+        postings = sorted(
+            (self._postings(path, value) for path, value in conditions.items()),
+            key=len,
+        )
+        rarest, others = postings[0], postings[1:]
+        findings = self._findings
+        return [
+            findings[row] for row in rarest if all(row in other for other in others)
+        ]
+
+    def values(self, path: str) -> list[Any]:
+        """Return the distinct values of an indexed path."""
+        return list(self._index(path))
+
+    def count(self, path: str, value: Any) -> int:
+        """Return the number of findings holding a value at an indexed path."""
+        return len(self._postings(path, value))
+
+    def _index(self, path: str) -> dict[Any, Postings]:
+        index = self._indexes.get(path)
+        if index is None:
+            raise ValueError(f"{path} is not indexed")
+        return index
+
+    def _postings(self, path: str, value: Any) -> Postings:
+        postings: Optional[Postings] = self._index(path).get(value)
+        return {} if postings is None else postings
@@ -0,0 +1,31 @@
+from hashlib import blake2b
+
+from py_ocsf_models.events.findings.finding import Finding
+
+FINGERPRINT_SIZE = 16
+
+_SEPARATOR = "\x1f"
+_RESOURCE_SEPARATOR = "\x1e"
+
+
+def finding_fingerprint(finding: Finding) -> bytes:
+    """
+    Return a 16-byte fingerprint of the stable identity of a finding.
+
+    The fingerprint covers `class_uid`, `finding_info.uid`, the sorted `resources[].uid`, `cloud.account.uid` and `cloud.region`, so re-emitting a finding in a later scan yields the same fingerprint even though volatile fields such as `time`, `time_dt` or `metadata.processed_time` changed. Fields missing from the finding class, such as `cloud` on Compliance Findings, are hashed as empty.
+    """
+    resources = getattr(finding, "resources", None) or ()
+    cloud = getattr(finding, "cloud", None)
+    account = cloud.account if cloud is not None else None
+    identity = _SEPARATOR.join(
+        (
+            str(int(getattr(finding, "class_uid", 0))),
+            finding.finding_info.uid,
+            _RESOURCE_SEPARATOR.join(
+                sorted(resource.uid or "" for resource in resources)
+            ),
+            (account.uid or "") if account is not None else "",
+            (cloud.region or "") if cloud is not None else "",
+        )
+    )
+    return blake2b(identity.encode(), digest_size=FINGERPRINT_SIZE).digest()
@@ -0,0 +1,157 @@
+import os
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
+from types import TracebackType
+from typing import Iterable, Iterator, Optional
+
+from py_ocsf_models.events.base_event import BaseEvent
+from py_ocsf_models.io.event_decoder import (
+    FINDING_CLASSES,
+    SerializedEvent,
+    event_adapter,
+)
+
+DEFAULT_CHUNK_SIZE = 1_000
+
+
+class ParallelSerializer:
+    """
+    The Parallel Serializer validates OCSF events and serializes them back to JSON in a pool of worker processes, so large batches use every core instead of the one the GIL allows. On a free-threaded interpreter, worker threads run in parallel as well and avoid sending events to other processes.
+
+    Events are given as raw JSON lines or as decoded dictionaries and sent to the workers in chunks. Every worker validates the events of its chunk as the class matching their `class_uid` and returns them as newline-delimited JSON bytes, so models are never pickled between processes. Only a bounded number of chunks is in flight at a time, so the input is consumed as the output is read.
+
+    Attributes:
+    - Workers (workers) [Optional]: The number of worker processes or threads, the number of CPUs by default.
+    - Chunk Size (chunk_size) [Optional]: The number of events sent to a worker at a time.
+    - Ordered (ordered) [Optional]: Whether chunks are yielded in input order, or as soon as they are ready.
+    - Exclude Unset (exclude_unset) [Optional]: Whether fields that were not explicitly set are left out of the output.
+    - Classes (classes) [Optional]: The event classes to validate, the Detection, Compliance and Application Security Posture Findings by default.
+    - Threads (threads) [Optional]: Whether the workers are threads of the current process instead of processes. Threads only run in parallel on a free-threaded interpreter.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        ordered: bool = True,
+        exclude_unset: bool = True,
+        classes: tuple[type[BaseEvent], ...] = tuple(FINDING_CLASSES.values()),
+        threads: bool = False,
+    ) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive number of events")
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.ordered = ordered
+        self.exclude_unset = exclude_unset
+        self.classes = classes
+        self.threads = threads
+        self._executor: Executor
+        if threads:
+            # Threads share the validator and serializers, which are built before they start.
+            _build(classes)
+            self._executor = ThreadPoolExecutor(self.workers)
+        else:
+            # Every worker process builds them once, when it starts.
+            self._executor = ProcessPoolExecutor(
+                self.workers, initializer=_build, initargs=(classes,)
+            )
+
+    def dump(self, events: Iterable[SerializedEvent]) -> Iterator[bytes]:
+        """
+        Validate and serialize the events, yielding the newline-delimited JSON of one chunk at a time.
+
+        Blank JSON lines are skipped. The ValidationError of the first invalid event found is raised, and the chunks still in flight are cancelled.
+        """
+        iterator = iter(events)
+        pending: deque[Future[bytes]] = deque()
+        try:
+            while True:
+                # Two chunks per worker keep the workers busy while the output of the others is read.
+                while len(pending) < 2 * self.workers:
+                    chunk = list(islice(iterator, self.chunk_size))
+                    if not chunk:
+                        break
+                    pending.append(
+                        self._executor.submit(
+                            _dump_chunk, chunk, self.classes, self.exclude_unset
+                        )
+                    )
+                if not pending:
+                    return
+                if self.ordered:
+                    yield pending.popleft().result()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+                        yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def close(self) -> None:
+        """Shut the workers down."""
+        self._executor.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> "ParallelSerializer":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def dump_parallel(
+    events: Iterable[SerializedEvent],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ordered: bool = True,
+    exclude_unset: bool = True,
+    classes: tuple[type[BaseEvent], ...] = tuple(FINDING_CLASSES.values()),
+    threads: bool = False,
+) -> Iterator[bytes]:
+    """Validate and serialize the events in a pool of worker processes or threads, yielding newline-delimited JSON one chunk at a time."""
+    with ParallelSerializer(
+        workers, chunk_size, ordered, exclude_unset, classes, threads
+    ) as serializer:
+        yield from serializer.dump(events)
+
+
+def _build(classes: tuple[type[BaseEvent], ...]) -> None:
+    event_adapter(classes)
+    for cls in classes:
+        cls.model_rebuild()
+
+
+def _dump_chunk(
+    chunk: list[SerializedEvent],
+    classes: tuple[type[BaseEvent], ...],
+    exclude_unset: bool,
+) -> bytes:
+    adapter = event_adapter(classes)
+    output = bytearray()
+    for data in chunk:
+        if isinstance(data, (str, bytes, bytearray)):
+            if not data.strip():
+                continue
+            event = adapter.validate_json(data)
+        else:
+            event = adapter.validate_python(data)
+        output += event.__pydantic_serializer__.to_json(
+            event, exclude_unset=exclude_unset
+        )
+        output += b"\n"
+    return bytes(output)
@@ -0,0 +1,166 @@
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from functools import lru_cache
+from importlib import metadata
+from os import PathLike
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import pydantic
+import pydantic_core
+from pydantic import BaseModel
+from pydantic._internal._config import ConfigWrapper
+from pydantic_core import SchemaSerializer, SchemaValidator
+
+SCHEMA_CACHE_DIR_ENV = "PY_OCSF_MODELS_SCHEMA_CACHE_DIR"
+
+PACKAGE_DIRECTORY = Path(__file__).parent
+
+_cache_directory: Optional[Path] = (
+    Path(os.environ[SCHEMA_CACHE_DIR_ENV])
+    if os.environ.get(SCHEMA_CACHE_DIR_ENV)
+    else None
+)
+
+
+def enable_schema_cache(directory: Optional[Union[str, PathLike[str]]] = None) -> None:
+    """
+    Store the schemas of OCSF models on disk and reuse them in later processes.
+
+    Once enabled, the first validation or serialization of a model loads its validator and serializer from the cache directory instead of building them, and models that still have to be built are written to it. Cached schemas are kept apart per package version, pydantic version, pydantic-core version and Python version, so upgrading any of them never reuses stale entries.
+
+    The directory defaults to `py_ocsf_models` inside the user cache directory. The cache can also be enabled with the PY_OCSF_MODELS_SCHEMA_CACHE_DIR environment variable. Its files are pickles, so the directory must only be writable by trusted users.
+    """
+    global _cache_directory
+    if directory is None:
+        directory = (
+            Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+            / "py_ocsf_models"
+        )
+    _cache_directory = Path(directory)
+
+
+def disable_schema_cache() -> None:
+    """Stop reading and writing cached schemas."""
+    global _cache_directory
+    _cache_directory = None
+
+
+def schema_cache_directory() -> Optional[Path]:
+    """Return the directory holding the cached schemas of this environment, or None when the cache is disabled."""
+    if _cache_directory is None:
+        return None
+    return _cache_directory / _cache_key()
+
+
+def load_cached_schema(cls: type[BaseModel]) -> bool:
+    """
+    Install the cached validator and serializer of a model.
+
+    Returns False, leaving the model untouched, when the cache is disabled or holds no usable entry for it. The model keeps building its full core schema lazily, for example for `model_json_schema`, because the cache only stores what validation and serialization need.
+    """
+    path = _cache_path(cls)
+    if path is None:
+        return False
+    try:
+        with path.open("rb") as cache_file:
+            schema, core_config = pickle.load(cache_file)
+        validator = SchemaValidator(schema, core_config)
+        serializer = SchemaSerializer(schema, core_config)
+    except (
+        OSError,
+        EOFError,
+        pickle.UnpicklingError,
+        AttributeError,
+        ImportError,
+        TypeError,
+        ValueError,
+        pydantic_core.SchemaError,
+    ):
+        # A missing, truncated or otherwise unusable entry is rebuilt.
+        return False
+    cls.__pydantic_validator__ = validator
+    cls.__pydantic_serializer__ = serializer
+    return True
+
+
+def store_schema(cls: type[BaseModel]) -> None:
+    """Write the schema of a built model to the cache, ignoring models whose schema cannot be pickled."""
+    path = _cache_path(cls)
+    if path is None or not cls.__pydantic_complete__:
+        return
+    core_config = ConfigWrapper(cls.model_config, check=False).core_config(
+        title=cls.__name__
+    )
+    try:
+        payload = pickle.dumps(
+            (_strip_metadata(cls.__pydantic_core_schema__), core_config),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=path.name, delete=False
+        ) as temporary_file:
+            temporary_file.write(payload)
+        os.replace(temporary_file.name, path)
+    except OSError:
+        return
+
+
+def is_loaded_from_cache(cls: type[BaseModel]) -> bool:
+    """Return whether a model validates with a cached validator instead of one built in this process."""
+    return not cls.__pydantic_complete__ and isinstance(
+        cls.__dict__.get("__pydantic_validator__"), SchemaValidator
+    )
+
+
+def _cache_path(cls: type[BaseModel]) -> Optional[Path]:
+    directory = schema_cache_directory()
+    if directory is None:
+        return None
+    return directory / f"{cls.__module__}.{cls.__qualname__}.pickle"
+
+
+@lru_cache(maxsize=None)
+def _cache_key() -> str:
+    try:
+        version = metadata.version("py-ocsf-models")
+    except metadata.PackageNotFoundError:
+        version = "source"
+    return (
+        f"{version}-{_source_digest()}"
+        f"-pydantic-{pydantic.VERSION}"
+        f"-pydantic-core-{pydantic_core.__version__}"
+        f"-py{sys.version_info.major}{sys.version_info.minor}"
+    )
+
+
+def _source_digest() -> str:
+    # Editable installs and source checkouts keep their version while the models change.
+    digest = hashlib.sha256()
+    for path in sorted(PACKAGE_DIRECTORY.rglob("*.py")):
+        stat = path.stat()
+        digest.update(
+            f"{path.relative_to(PACKAGE_DIRECTORY)}:{stat.st_mtime_ns}:{stat.st_size};".encode()
+        )
+    return digest.hexdigest()[:16]
+
+
+def _strip_metadata(schema: Any) -> Any:
+    # Core schema metadata only serves JSON schema generation and holds closures that cannot be pickled.
+    if isinstance(schema, list):
+        return [_strip_metadata(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    is_core_schema = isinstance(schema.get("type"), str)
+    return {
+        key: (value if is_core_schema and key == "default" else _strip_metadata(value))
+        for key, value in schema.items()
+        if not (is_core_schema and key == "metadata")
+    }
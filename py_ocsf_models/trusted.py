@@ -0,0 +1,185 @@
+import os
+import random
+import types
+from collections.abc import Mapping
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Optional, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+Converter = Callable[[Any], Any]
+
+_ConstructionPlan = tuple[
+    dict[str, Any],
+    set[str],
+    dict[str, Converter],
+    tuple[str, ...],
+    tuple[tuple[str, Callable[[], Any]], ...],
+]
+
+_IMMUTABLE_TYPES = (type(None), str, int, float, bool, Enum)
+
+_new_object = object.__new__
+_set_attribute = object.__setattr__
+
+VALIDATION_SAMPLE_RATE_ENV = "PY_OCSF_MODELS_TRUSTED_VALIDATION_SAMPLE_RATE"
+
+_validation_sample_rate = float(os.environ.get(VALIDATION_SAMPLE_RATE_ENV, "0"))
+
+
+def set_validation_sample_rate(rate: float) -> None:
+    """
+    Set the fraction of trusted constructions that are checked against the validated path.
+
+    A rate of 0 disables the check and a rate of 1 checks every object. The initial value is read from the PY_OCSF_MODELS_TRUSTED_VALIDATION_SAMPLE_RATE environment variable.
+    """
+    global _validation_sample_rate
+    if not 0 <= rate <= 1:
+        raise ValueError("The validation sample rate must be between 0 and 1")
+    _validation_sample_rate = rate
+
+
+def construct_trusted(cls: type[ModelT], data: Mapping[str, Any]) -> ModelT:
+    """
+    Build a model and all of its nested models from plain data without running validation.
+
+    This is a nested-aware `model_construct` meant for producers whose data is already valid: nested dicts and lists of dicts are turned into their model classes and integers are turned into their enum members, but no other coercion or check takes place. The result serializes exactly like the model returned by `model_validate` for the same valid data.
+
+    When a validation sample rate is set, a random sample of the calls also validates the data and raises a ValueError if both paths serialize differently.
+    """
+    model = _construct(cls, data)
+    if _validation_sample_rate and random.random() < _validation_sample_rate:
+        _check_against_validation(cls, data, model)
+    return model
+
+
+def _check_against_validation(
+    cls: type[ModelT], data: Mapping[str, Any], model: ModelT
+) -> None:
+    validated = cls.model_validate(data)
+    if validated.model_dump_json(exclude_unset=True) != model.model_dump_json(
+        exclude_unset=True, warnings=False
+    ):
+        raise ValueError(
+            f"Trusted construction of {cls.__name__} differs from its validated counterpart"
+        )
+
+
+def _construct(cls: type[ModelT], data: Mapping[str, Any]) -> ModelT:
+    plan = _construction_plan(cls)
+    if plan is None:
+        return cls.model_construct(**_convert(cls, data))
+    template, field_names, converters, required, factories = plan
+    fields_set = field_names.intersection(data)
+    values = template.copy()
+    for name in fields_set:
+        converter = converters.get(name)
+        values[name] = data[name] if converter is None else converter(data[name])
+    for name in required:
+        if name not in fields_set:
+            del values[name]
+    for name, factory in factories:
+        if name not in fields_set:
+            values[name] = factory()
+    model = _new_object(cls)
+    _set_attribute(model, "__dict__", values)
+    _set_attribute(model, "__pydantic_fields_set__", fields_set)
+    _set_attribute(model, "__pydantic_extra__", None)
+    _set_attribute(model, "__pydantic_private__", None)
+    return model
+
+
+def _convert(cls: type[BaseModel], data: Mapping[str, Any]) -> dict[str, Any]:
+    converters = _field_converters(cls)
+    values = {}
+    for name, value in data.items():
+        converter = converters.get(name)
+        values[name] = value if converter is None else converter(value)
+    return values
+
+
+@lru_cache(maxsize=None)
+def _construction_plan(cls: type[BaseModel]) -> Optional[_ConstructionPlan]:
+    # Models relying on hooks that model_construct honours take the slow path.
+    if (
+        cls.__pydantic_post_init__
+        or cls.__pydantic_root_model__
+        or cls.model_config.get("extra") == "allow"
+        or any(field.alias is not None for field in cls.model_fields.values())
+    ):
+        return None
+    # The template holds every field in declaration order, which is the order
+    # the serializer emits them in, so values are only ever overwritten.
+    template: dict[str, Any] = {}
+    required = []
+    factories = []
+    for name, field in cls.model_fields.items():
+        template[name] = None
+        if field.is_required():
+            required.append(name)
+        elif field.default_factory is None and isinstance(
+            field.default, _IMMUTABLE_TYPES
+        ):
+            template[name] = field.default
+        else:
+            factories.append((name, _default_factory(field)))
+    return (
+        template,
+        set(template),
+        _field_converters(cls),
+        tuple(required),
+        tuple(factories),
+    )
+
+
+def _default_factory(field: FieldInfo) -> Callable[[], Any]:
+    return lambda: field.get_default(call_default_factory=True, validated_data={})
+
+
+@lru_cache(maxsize=None)
+def _field_converters(cls: type[BaseModel]) -> dict[str, Converter]:
+    converters = {}
+    for name, field in cls.model_fields.items():
+        converter = _converter_for(field.annotation)
+        if converter is not None:
+            converters[name] = converter
+    return converters
+
+
+def _converter_for(annotation: Any) -> Optional[Converter]:
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(members) != 1:
+            return None
+        inner = _converter_for(members[0])
+        if inner is None:
+            return None
+        return lambda value: None if value is None else inner(value)
+    if origin is list:
+        (item_annotation,) = get_args(annotation) or (Any,)
+        item_converter = _converter_for(item_annotation)
+        if item_converter is None:
+            return None
+        return lambda values: [item_converter(value) for value in values]
+    if origin is dict:
+        _, value_annotation = get_args(annotation) or (Any, Any)
+        value_converter = _converter_for(value_annotation)
+        if value_converter is None:
+            return None
+        return lambda values: {
+            key: value_converter(value) for key, value in values.items()
+        }
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        model_cls = annotation
+        return lambda value: (
+            value if isinstance(value, model_cls) else _construct(model_cls, value)
+        )
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        enum_cls = annotation
+        return lambda value: value if isinstance(value, enum_cls) else enum_cls(value)
+    return None
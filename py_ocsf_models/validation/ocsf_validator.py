@@ -0,0 +1,518 @@
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional, Union
+
+from py_ocsf_models import OCSF_VERSION
+
+SCHEMAS_PATH = Path(__file__).parent / "schemas"
+
+SerializedEvent = Union[str, bytes, Mapping[str, Any]]
+
+_INTEGER_TYPES = {"integer_t", "long_t"}
+
+
+class CompiledAttribute:
+    """
+    A schema attribute resolved to the checks it needs, so that validating a value does not look anything up in the raw schema.
+
+    Attributes:
+    - Name (name): The attribute name.
+    - Base Type (base_type): The primitive OCSF type the attribute type derives from (e.g. string_t for datetime_t).
+    - Type Name (type_name): The OCSF type of the attribute, as declared by the schema.
+    - Is Array (is_array): Whether the attribute holds a list of values.
+    - Requirement (requirement): Whether the attribute is required, recommended or optional.
+    - Enum (enum) [Optional]: The captions of the allowed values, keyed by value.
+    - Object Type (object_type) [Optional]: The name of the object the attribute holds.
+    - Profile (profile) [Optional]: The profile that adds the attribute to its class or object.
+    - Sibling (sibling) [Optional]: The attribute holding the caption of the enum value.
+    - Deprecated (deprecated): Whether the attribute is deprecated.
+    - Regex (regex) [Optional]: The pattern string values must match.
+    - Max Length (max_len) [Optional]: The maximum length of string values.
+    - Range (range) [Optional]: The inclusive bounds of numeric values.
+    """
+
+    __slots__ = (
+        "name",
+        "base_type",
+        "type_name",
+        "is_array",
+        "requirement",
+        "enum",
+        "object_type",
+        "profile",
+        "sibling",
+        "deprecated",
+        "regex",
+        "max_len",
+        "range",
+    )
+
+    def __init__(
+        self, name: str, attribute: Mapping[str, Any], types: Mapping[str, Any]
+    ) -> None:
+        type_name = attribute["type"]
+        type_definition = types.get(type_name, {})
+        self.name = name
+        self.type_name = type_name
+        self.base_type = type_definition.get("type", type_name)
+        self.is_array = bool(attribute.get("is_array"))
+        self.requirement = attribute.get("requirement", "optional")
+        self.enum: Optional[dict[Any, str]] = None
+        if "enum" in attribute:
+            # Enum keys are always strings in the schema; integer enums are
+            # compared against the decoded integer values.
+            self.enum = {
+                int(value) if self.base_type in _INTEGER_TYPES else value: caption
+                for value, caption in attribute["enum"].items()
+            }
+        self.object_type: Optional[str] = attribute.get("object_type")
+        self.profile: Optional[str] = attribute.get("profile")
+        self.sibling: Optional[str] = attribute.get("sibling")
+        self.deprecated = bool(attribute.get("@deprecated"))
+        self.regex = (
+            re.compile(type_definition["regex"]) if "regex" in type_definition else None
+        )
+        self.max_len: Optional[int] = type_definition.get("max_len")
+        self.range: Optional[list[int]] = type_definition.get("range")
+
+
+class CompiledObject:
+    """
+    A schema class or object with its compiled attributes.
+
+    Attributes:
+    - Name (name): The class or object name.
+    - Attributes (attributes): The compiled attributes, keyed by name.
+    - At Least One (at_least_one): Attributes of which at least one must be present.
+    - Deprecated (deprecated): Whether the object is deprecated.
+    - Open (is_open): Whether the object accepts arbitrary attributes (e.g. unmapped).
+    """
+
+    __slots__ = (
+        "name",
+        "attributes",
+        "at_least_one",
+        "deprecated",
+        "is_open",
+        "_by_profiles",
+    )
+
+    def __init__(
+        self, name: str, definition: Mapping[str, Any], types: Mapping[str, Any]
+    ) -> None:
+        self.name = name
+        self.attributes = {
+            attribute_name: CompiledAttribute(attribute_name, attribute, types)
+            for attribute_name, attribute in definition["attributes"].items()
+        }
+        self.at_least_one: list[str] = definition.get("constraints", {}).get(
+            "at_least_one", []
+        )
+        self.deprecated = bool(definition.get("@deprecated"))
+        self.is_open = not self.attributes
+        self._by_profiles: dict[frozenset[str], dict[str, CompiledAttribute]] = {}
+
+    def attributes_for(self, profiles: frozenset[str]) -> dict[str, CompiledAttribute]:
+        """Return the attributes available with the given profiles applied."""
+        attributes = self._by_profiles.get(profiles)
+        if attributes is None:
+            attributes = {
+                name: attribute
+                for name, attribute in self.attributes.items()
+                if attribute.profile is None or attribute.profile in profiles
+            }
+            self._by_profiles[profiles] = attributes
+        return attributes
+
+
+class OCSFValidator:
+    """
+    The OCSF Validator checks serialized events against a vendored copy of the OCSF schema, without any network access.
+
+    The vendored schema is trimmed from the official OCSF schema export to the event classes modeled by this package and the objects they reference. It is compiled once per version and shared by every validator instance.
+
+    Results follow the shape of the schema.ocsf.io validation API (`/api/v2/validate`): a dictionary with `error_count`, `warning_count`, `errors` and `warnings`, where each error or warning carries an `error` code, a `message` and, when it relates to an attribute, its `attribute_path` and `attribute` name.
+
+    Attributes:
+    - Version (version) [Optional]: The OCSF schema version to validate against. Defaults to the version modeled by this package.
+    """
+
+    def __init__(self, version: str = OCSF_VERSION) -> None:
+        self.version = version
+        self._classes, self._objects = _compile_schema(version)
+
+    def validate(self, event: SerializedEvent) -> dict[str, Any]:
+        """Validate a single event given as JSON text or as a decoded dictionary."""
+        if isinstance(event, (str, bytes)):
+            event = json.loads(event)
+        return _Validation(self, event).run()
+
+    def validate_many(self, events: Iterable[SerializedEvent]) -> list[dict[str, Any]]:
+        """Validate each event of the iterable and return one result per event."""
+        return [self.validate(event) for event in events]
+
+
+@lru_cache(maxsize=None)
+def _compile_schema(
+    version: str,
+) -> tuple[dict[int, CompiledObject], dict[str, CompiledObject]]:
+    path = SCHEMAS_PATH / f"{version}.json"
+    if not path.is_file():
+        raise ValueError(f"OCSF schema version {version} is not available offline")
+    schema = json.loads(path.read_text(encoding="utf-8"))
+    types = schema["types"]
+    classes = {
+        int(uid): CompiledObject(definition["name"], definition, types)
+        for uid, definition in schema["classes"].items()
+    }
+    objects = {
+        name: CompiledObject(name, definition, types)
+        for name, definition in schema["objects"].items()
+    }
+    return classes, objects
+
+
+def _json_type(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    return "object"
+
+
+class _Validation:
+    def __init__(self, validator: OCSFValidator, event: Any) -> None:
+        self.validator = validator
+        self.event = event
+        self.errors: list[dict[str, Any]] = []
+        self.warnings: list[dict[str, Any]] = []
+        self.profiles: frozenset[str] = frozenset()
+
+    def run(self) -> dict[str, Any]:
+        event = self.event
+        if not isinstance(event, Mapping):
+            self.error("event_not_object", "The event must be a JSON object.")
+            return self.result()
+
+        class_uid = event.get("class_uid")
+        if class_uid is None:
+            self.error(
+                "class_uid_missing",
+                'Missing required attribute "class_uid".',
+                "class_uid",
+                "class_uid",
+            )
+            return self.result()
+        compiled_class = (
+            self.validator._classes.get(class_uid)
+            if isinstance(class_uid, int) and not isinstance(class_uid, bool)
+            else None
+        )
+        if compiled_class is None:
+            self.error(
+                "class_uid_unknown",
+                f"Unknown class_uid value {class_uid!r}.",
+                "class_uid",
+                "class_uid",
+                value=class_uid,
+            )
+            return self.result()
+
+        metadata = event.get("metadata")
+        if isinstance(metadata, Mapping):
+            profiles = metadata.get("profiles")
+            if isinstance(profiles, list):
+                self.profiles = frozenset(
+                    profile for profile in profiles if isinstance(profile, str)
+                )
+            version = metadata.get("version")
+            if isinstance(version, str) and version != self.validator.version:
+                self.warning(
+                    "version_incorrect",
+                    f'Event version "{version}" does not match the validated schema version "{self.validator.version}".',
+                    "metadata.version",
+                    "version",
+                    value=version,
+                )
+
+        self.validate_object(event, compiled_class, None)
+        self.validate_type_uid(event, class_uid)
+        return self.result()
+
+    def result(self) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+        metadata = (
+            self.event.get("metadata") if isinstance(self.event, Mapping) else None
+        )
+        if isinstance(metadata, Mapping) and "uid" in metadata:
+            result["uid"] = metadata["uid"]
+        result["error_count"] = len(self.errors)
+        result["warning_count"] = len(self.warnings)
+        result["errors"] = self.errors
+        result["warnings"] = self.warnings
+        return result
+
+    def error(
+        self,
+        code: str,
+        message: str,
+        attribute_path: Optional[str] = None,
+        attribute: Optional[str] = None,
+        **details: Any,
+    ) -> None:
+        self.errors.append(_issue(code, message, attribute_path, attribute, details))
+
+    def warning(
+        self,
+        code: str,
+        message: str,
+        attribute_path: Optional[str] = None,
+        attribute: Optional[str] = None,
+        **details: Any,
+    ) -> None:
+        self.warnings.append(_issue(code, message, attribute_path, attribute, details))
+
+    def validate_type_uid(self, event: Mapping[str, Any], class_uid: int) -> None:
+        type_uid = event.get("type_uid")
+        activity_id = event.get("activity_id")
+        if not isinstance(type_uid, int) or not isinstance(activity_id, int):
+            return
+        expected = class_uid * 100 + activity_id
+        if type_uid != expected:
+            self.error(
+                "type_uid_incorrect",
+                f"Event's type_uid value of {type_uid} does not match expected value of {expected} (class_uid {class_uid} * 100 + activity_id {activity_id}).",
+                "type_uid",
+                "type_uid",
+                value=type_uid,
+                expected_value=expected,
+            )
+
+    def validate_object(
+        self,
+        value: Mapping[str, Any],
+        compiled: CompiledObject,
+        parent_path: Optional[str],
+    ) -> None:
+        if compiled.is_open:
+            return
+        attributes = compiled.attributes_for(self.profiles)
+
+        for name, attribute_value in value.items():
+            path = name if parent_path is None else f"{parent_path}.{name}"
+            attribute = attributes.get(name)
+            if attribute is None:
+                self.error(
+                    "attribute_unknown",
+                    f'Unknown attribute at "{path}"; attribute "{name}" is not defined in {compiled.name}.',
+                    path,
+                    name,
+                )
+                continue
+            if attribute_value is None:
+                continue
+            if attribute.deprecated:
+                self.warning(
+                    "attribute_deprecated",
+                    f'Attribute "{path}" is deprecated.',
+                    path,
+                    name,
+                )
+            if attribute.is_array:
+                if not isinstance(attribute_value, list):
+                    self.wrong_type(path, attribute, attribute_value, "array")
+                    continue
+                for index, item in enumerate(attribute_value):
+                    self.validate_value(f"{path}[{index}]", attribute, item)
+            else:
+                self.validate_value(path, attribute, attribute_value)
+            if (
+                attribute.enum is not None
+                and attribute.sibling is not None
+                and not attribute.is_array
+            ):
+                self.validate_sibling(
+                    value,
+                    attribute.name,
+                    attribute.enum,
+                    attribute.sibling,
+                    attribute_value,
+                    parent_path,
+                )
+
+        for name, attribute in attributes.items():
+            if value.get(name) is not None or attribute.requirement == "optional":
+                continue
+            path = name if parent_path is None else f"{parent_path}.{name}"
+            if attribute.requirement == "required":
+                self.error(
+                    "attribute_required_missing",
+                    f'Required attribute "{path}" is missing.',
+                    path,
+                    name,
+                )
+            else:
+                self.warning(
+                    "attribute_recommended_missing",
+                    f'Recommended attribute "{path}" is missing.',
+                    path,
+                    name,
+                )
+
+        if compiled.at_least_one and not any(
+            value.get(name) is not None for name in compiled.at_least_one
+        ):
+            self.error(
+                "constraint_failed",
+                f'Constraint failed: "at_least_one" from object "{compiled.name}"; expected at least one of {compiled.at_least_one} at "{parent_path or ""}".',
+                parent_path,
+                compiled.name,
+                constraint={"at_least_one": compiled.at_least_one},
+            )
+
+    def validate_value(
+        self, path: str, attribute: CompiledAttribute, value: Any
+    ) -> None:
+        base_type = attribute.base_type
+        if base_type == "object_t":
+            if not isinstance(value, Mapping):
+                self.wrong_type(path, attribute, value, "object")
+            elif attribute.object_type is not None:
+                compiled = self.validator._objects.get(attribute.object_type)
+                if compiled is not None:
+                    if compiled.deprecated:
+                        self.warning(
+                            "object_deprecated",
+                            f'Object "{attribute.object_type}" at "{path}" is deprecated.',
+                            path,
+                            attribute.name,
+                        )
+                    self.validate_object(value, compiled, path)
+            return
+        if base_type == "json_t":
+            return
+        if base_type == "string_t":
+            if not isinstance(value, str):
+                self.wrong_type(path, attribute, value, "string")
+                return
+            if attribute.max_len is not None and len(value) > attribute.max_len:
+                self.error(
+                    "attribute_value_exceeds_max_len",
+                    f'Attribute "{path}" value length of {len(value)} exceeds maximum length of {attribute.max_len}.',
+                    path,
+                    attribute.name,
+                    value=value,
+                    max_len=attribute.max_len,
+                )
+            if attribute.regex is not None and not attribute.regex.match(value):
+                self.error(
+                    "attribute_value_regex_not_matched",
+                    f'Attribute "{path}" value does not match regex of type "{attribute.type_name}".',
+                    path,
+                    attribute.name,
+                    value=value,
+                    regex=attribute.regex.pattern,
+                )
+        elif base_type in _INTEGER_TYPES:
+            if not isinstance(value, int) or isinstance(value, bool):
+                self.wrong_type(path, attribute, value, "integer")
+                return
+        elif base_type == "float_t":
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                self.wrong_type(path, attribute, value, "number")
+                return
+        elif base_type == "boolean_t":
+            if not isinstance(value, bool):
+                self.wrong_type(path, attribute, value, "boolean")
+                return
+
+        if attribute.range is not None and not (
+            attribute.range[0] <= value <= attribute.range[1]
+        ):
+            self.error(
+                "attribute_value_exceeds_range",
+                f'Attribute "{path}" value {value} is outside of the range {attribute.range}.',
+                path,
+                attribute.name,
+                value=value,
+                range=attribute.range,
+            )
+        if attribute.enum is not None and value not in attribute.enum:
+            self.error(
+                "attribute_enum_value_unknown",
+                f'Unknown enum value at "{path}"; value {value!r} is not defined for enum "{attribute.name}".',
+                path,
+                attribute.name,
+                value=value,
+            )
+
+    def validate_sibling(
+        self,
+        value: Mapping[str, Any],
+        name: str,
+        enum: Mapping[Any, str],
+        sibling: str,
+        enum_value: Any,
+        parent_path: Optional[str],
+    ) -> None:
+        if not isinstance(enum_value, (int, str)):
+            return
+        caption = enum.get(enum_value)
+        sibling_value = value.get(sibling)
+        # "Other" (99) values carry a source specific caption in the sibling.
+        if caption is None or sibling_value is None or enum_value == 99:
+            return
+        if sibling_value != caption:
+            path = sibling if parent_path is None else f"{parent_path}.{sibling}"
+            self.warning(
+                "attribute_enum_sibling_incorrect",
+                f'Attribute "{path}" value {sibling_value!r} does not match the caption {caption!r} of "{name}" value {enum_value!r}.',
+                path,
+                sibling,
+                value=sibling_value,
+                expected_value=caption,
+            )
+
+    def wrong_type(
+        self, path: str, attribute: CompiledAttribute, value: Any, expected: str
+    ) -> None:
+        self.error(
+            "attribute_wrong_type",
+            f'Attribute "{path}" value has wrong type; expected {attribute.type_name}{" array" if attribute.is_array else ""}, got {_json_type(value)}.',
+            path,
+            attribute.name,
+            value=value,
+            expected_type=attribute.type_name,
+            expected_json_type=expected,
+        )
+
+
+def _issue(
+    code: str,
+    message: str,
+    attribute_path: Optional[str],
+    attribute: Optional[str],
+    details: Mapping[str, Any],
+) -> dict[str, Any]:
+    issue: dict[str, Any] = {"error": code, "message": message}
+    if attribute_path is not None:
+        issue["attribute_path"] = attribute_path
+    if attribute is not None:
+        issue["attribute"] = attribute
+    issue.update(details)
+    return issue
+
+
+def validate_events(
+    events: Iterable[SerializedEvent], version: str = OCSF_VERSION
+) -> list[dict[str, Any]]:
+    """Validate serialized events offline and return one result per event."""
+    return OCSFValidator(version).validate_many(events)
@@ -0,0 +1,169 @@
+"""
+Compact read-only views of the OCSF models.
+
+The view of every event and object model is generated from it on first use and can be imported as `<Name>View`, e.g. `from py_ocsf_models.views import DetectionFindingView`.
+"""
+
+import importlib
+import types
+from collections import namedtuple
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Optional, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from py_ocsf_models._synchronized import synchronized_cache
+
+VIEW_SUFFIX = "View"
+
+Converter = Callable[[Any], Any]
+
+
+class ModelView(tuple[Any, ...]):
+    """
+    The Model View is the base class of the read-only, tuple-backed views of the OCSF models.
+
+    A view holds the fields of its model, under the same attribute names, in a tuple instead of a `__dict__`, so it takes a fraction of the memory of the model. Views are built straight from parsed JSON without validation: nested objects become views as well, lists become tuples and every other value is kept as it was parsed, e.g. enum fields hold plain integers and datetime fields hold strings. Missing fields and fields set to null are both None.
+
+    `to_model` validates the view into a full model when one is needed.
+    """
+
+    __slots__ = ()
+
+    _model: ClassVar[type[BaseModel]]
+    _fields: ClassVar[tuple[str, ...]]
+
+    @classmethod
+    def from_data(cls, data: Mapping[str, Any]) -> Any:
+        """Build a view from a parsed JSON object, without validation."""
+        return _view(cls, data)
+
+    @classmethod
+    def from_json(cls, json_data: Union[str, bytes, bytearray]) -> Any:
+        """Build a view from a JSON object, or a list of views from a JSON array, without validation."""
+        data = from_json(json_data)
+        if isinstance(data, list):
+            return [_view(cls, item) for item in data]
+        return _view(cls, data)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the fields of the view that are not None as plain JSON data."""
+        return {
+            name: _plain(value)
+            for name, value in zip(self._fields, self)
+            if value is not None
+        }
+
+    def to_model(self) -> BaseModel:
+        """Validate the view into a full model."""
+        return self._model.model_validate(self.to_dict())
+
+
+@synchronized_cache
+def view_class(cls: type[BaseModel]) -> type[ModelView]:
+    """Return the view of a model class, generating it on first use."""
+    name = f"{cls.__name__}{VIEW_SUFFIX}"
+    fields = tuple(cls.model_fields)
+    base = namedtuple(name, fields, module=__name__)  # type: ignore[misc]
+    # Every field is optional, as it is when loading a view from JSON.
+    base.__new__.__defaults__ = (None,) * len(fields)
+    view_cls: type[ModelView] = type(
+        name,
+        (base, ModelView),
+        {
+            "__slots__": (),
+            "__module__": __name__,
+            "__qualname__": name,
+            "__doc__": f"A read-only view of the {cls.__name__} model.",
+            "_model": cls,
+        },
+    )
+    return view_cls
+
+
+def __getattr__(name: str) -> type[ModelView]:
+    model = (
+        _exported_model(name.removesuffix(VIEW_SUFFIX))
+        if name.endswith(VIEW_SUFFIX)
+        else None
+    )
+    if model is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    view_cls = view_class(model)
+    globals()[name] = view_cls
+    return view_cls
+
+
+def _exported_model(name: str) -> Optional[type[BaseModel]]:
+    from py_ocsf_models import _LAZY_EXPORTS
+
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        return None
+    model = getattr(importlib.import_module(module), name)
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        return model
+    return None
+
+
+def _view(view_cls: type[ModelView], data: Mapping[str, Any]) -> ModelView:
+    # Only the keys present in the data are visited, which are far fewer than the fields of most events.
+    template, fields = _view_plan(view_cls)
+    values = template.copy()
+    for name, value in data.items():
+        field = fields.get(name)
+        if field is not None:
+            index, converter = field
+            values[index] = (
+                value if converter is None or value is None else converter(value)
+            )
+    return tuple.__new__(view_cls, values)
+
+
+@lru_cache(maxsize=None)
+def _view_plan(
+    view_cls: type[ModelView],
+) -> tuple[list[None], dict[str, tuple[int, Optional[Converter]]]]:
+    fields = {
+        name: (index, _converter_for(field.annotation))
+        for index, (name, field) in enumerate(view_cls._model.model_fields.items())
+    }
+    return [None] * len(fields), fields
+
+
+def _converter_for(annotation: Any) -> Optional[Converter]:
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _converter_for(members[0]) if len(members) == 1 else None
+    if origin is list:
+        (item_annotation,) = get_args(annotation) or (Any,)
+        item_converter = _converter_for(item_annotation)
+        if item_converter is None:
+            return tuple
+        return lambda values: tuple(map(item_converter, values))
+    if origin is dict:
+        _, value_annotation = get_args(annotation) or (Any, Any)
+        value_converter = _converter_for(value_annotation)
+        if value_converter is None:
+            return None
+        return lambda values: {
+            key: value_converter(value) for key, value in values.items()
+        }
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        model_cls = annotation
+        # The view class is looked up when converting, so recursive models do not recurse here.
+        return lambda value: _view(view_class(model_cls), value)
+    return None
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, ModelView):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    return value
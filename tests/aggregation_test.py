@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+
+from py_ocsf_models.events.findings.compliance_finding import ComplianceFinding
+from py_ocsf_models.events.findings.compliance_finding_type_id import (
+    ComplianceFindingTypeID,
+)
+from py_ocsf_models.events.findings.risk_level_id import RiskLevelID
+from py_ocsf_models.events.findings.severity_id import SeverityID
+from py_ocsf_models.events.findings.status_id import StatusID
+from py_ocsf_models.processing.aggregation import FindingAggregator, aggregate
+from py_ocsf_models.processing.finding_batch import MISSING, FindingBatch
+
+
+def build_compliance_finding(detection_finding, standards):
+    return ComplianceFinding.model_validate(
+        detection_finding.model_dump(exclude={"cloud", "class_uid", "type_uid"})
+        | {
+            "compliance": {"standards": standards},
+            "type_uid": ComplianceFindingTypeID.Create,
+        }
+    )
+
+
+class TestAggregate:
+    def test_by_account(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(9)]
+        findings[0].risk_score = 10
+        findings[3].risk_score = 30
+        findings[3].risk_level_id = RiskLevelID.High
+        findings[6].status_id = StatusID.Resolved
+
+        aggregation = aggregate(findings, "cloud.account.uid")
+
+        assert aggregation.groups == ["000000000000", "000000000001", "000000000002"]
+        assert aggregation.counts.tolist() == [3, 3, 3]
+        high = list(SeverityID).index(SeverityID.High)
+        assert aggregation.severity_counts[:, high].tolist() == [0, 1, 0]
+        assert aggregation.to_dict()["000000000000"] == {
+            "count": 3,
+            "severity": {"Unknown": 2, "Medium": 1},
+            "status": {"New": 2, "Resolved": 1},
+            "risk_level": {"High": 1},
+            "risk_score": {"count": 2, "min": 10, "max": 30, "mean": 20.0},
+        }
+        assert "risk_score" not in aggregation.to_dict()["000000000001"]
+        assert aggregation.risk_score_minimums.tolist() == [10, MISSING, MISSING]
+        assert np.isnan(aggregation.risk_score_means()[1])
+
+    def test_chunks(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(25)]
+        for index, finding in enumerate(findings):
+            finding.risk_score = index
+
+        chunked = aggregate(findings, "cloud.region", chunk_size=4)
+        whole = aggregate(findings, "cloud.region")
+
+        assert chunked.to_dict() == whole.to_dict()
+        assert chunked.risk_score_sums.tolist() == [
+            sum(range(0, 25, 2)),
+            sum(range(1, 25, 2)),
+        ]
+
+    def test_by_list_field(self, detection_finding_factory):
+        findings = [
+            build_compliance_finding(detection_finding_factory(0), ["CIS", "NIST"]),
+            build_compliance_finding(detection_finding_factory(4), ["CIS"]),
+            build_compliance_finding(detection_finding_factory(5), None),
+            detection_finding_factory(1),
+        ]
+
+        aggregation = aggregate(findings, "compliance.standards").to_dict()
+
+        assert aggregation["CIS"]["count"] == 2
+        assert aggregation["CIS"]["severity"] == {"Unknown": 1, "High": 1}
+        assert aggregation["NIST"]["count"] == 1
+        assert aggregation[None]["count"] == 2
+
+    def test_add_batch(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(12)]
+        findings[5].cloud.region = None
+        aggregator = FindingAggregator("cloud.region")
+
+        aggregator.add_batch(FindingBatch.from_findings(findings[:6]))
+        aggregator.update(findings[6:])
+
+        assert (
+            aggregator.result().to_dict()
+            == aggregate(findings, "cloud.region").to_dict()
+        )
+        with pytest.raises(ValueError):
+            FindingAggregator("resources.uid").add_batch(
+                FindingBatch.from_findings(findings)
+            )
+
+    def test_add_columns(self):
+        aggregator = FindingAggregator("cloud.account.uid")
+
+        aggregator.add_columns(
+            np.array([0, 1, 0, MISSING]),
+            ["a", "b"],
+            severity_id=np.array([SeverityID.Other, 1, 99, MISSING]),
+        )
+        aggregation = aggregator.result().to_dict()
+
+        assert aggregation["a"]["severity"] == {"Other": 2}
+        assert aggregation["a"]["status"] == {}
+        assert aggregation["b"]["severity"] == {"Informational": 1}
+        assert aggregation[None] == {
+            "count": 1,
+            "severity": {},
+            "status": {},
+            "risk_level": {},
+        }
+
+    @pytest.mark.parametrize("severity_id", [7, 50, 100, -2])
+    def test_invalid_enum_values(self, severity_id):
+        aggregator = FindingAggregator("cloud.account.uid")
+        aggregator.add_columns(np.array([0]), ["a"], severity_id=np.array([1]))
+        before = aggregator.result().to_dict()
+
+        with pytest.raises(
+            ValueError, match=f"{severity_id} is not a valid SeverityID"
+        ):
+            aggregator.add_columns(
+                np.array([0, 1, MISSING]),
+                ["a", "b"],
+                severity_id=np.array([2, 3, severity_id]),
+            )
+
+        assert aggregator.result().to_dict() == before
+
+    def test_invalid_finding(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(4)]
+        aggregator = FindingAggregator("cloud.account.uid", chunk_size=2)
+        aggregator.update(findings[:1])
+
+        with pytest.raises(ValueError, match="7 is not a valid SeverityID"):
+            aggregator.add(findings[1].model_copy(update={"severity_id": 7}))
+        aggregator.update(findings[1:])
+
+        assert (
+            aggregator.result().to_dict()
+            == aggregate(findings, "cloud.account.uid").to_dict()
+        )
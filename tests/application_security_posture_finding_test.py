@@ -1,7 +1,5 @@
 from datetime import datetime
 
-import requests
-
 from py_ocsf_models import OCSF_VERSION
 from py_ocsf_models.events.findings.activity_id import ActivityID
 from py_ocsf_models.events.findings.application_security_posture_finding import (
@@ -26,6 +24,7 @@ from py_ocsf_models.objects.product import Feature, Product
 from py_ocsf_models.objects.remediation import Remediation
 from py_ocsf_models.objects.resource_details import ResourceDetails
 from py_ocsf_models.objects.vulnerability_details import VulnerabilityDetails
+from py_ocsf_models.validation.ocsf_validator import OCSFValidator
 
 
 class TestApplicationSecurityPostureFinding:
@@ -230,9 +229,5 @@ class TestApplicationSecurityPostureFinding:
 
         # Convert to JSON and validate against OCSF schema
         app_sec_finding_json = app_sec_finding.model_dump_json(exclude_unset=True)
-        url = "https://schema.ocsf.io/api/v2/validate"
-        headers = {"content-type": "application/json"}
-
-        response = requests.post(url, headers=headers, data=app_sec_finding_json)
-        assert response.status_code == 200, f"Schema validation failed: {response.text}"
-        assert response.json()["error_count"] == 0
+        result = OCSFValidator().validate(app_sec_finding_json)
+        assert result["error_count"] == 0, f"Schema validation failed: {result}"
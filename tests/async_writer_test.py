@@ -0,0 +1,144 @@
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from py_ocsf_models.io.async_writer import AsyncFileWriter, AsyncMemoryWriter
+
+
+def ndjson(findings):
+    return b"".join(
+        finding.model_dump_json(exclude_unset=True).encode() + b"\n"
+        for finding in findings
+    )
+
+
+class TestAsyncFindingWriter:
+    def test_memory_writer(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(10)]
+
+        async def main():
+            async with AsyncMemoryWriter(max_queue_size=2, batch_size=3) as writer:
+                for finding in findings[:4]:
+                    await writer.write(finding)
+                await writer.flush()
+                assert writer.count == 4
+
+                async def remaining():
+                    for finding in findings[4:]:
+                        yield finding
+
+                assert await writer.write_many(remaining()) == 6
+            return writer
+
+        writer = asyncio.run(main())
+
+        assert writer.count == 10
+        assert writer.getvalue() == ndjson(findings)
+
+    def test_file_writer(self, detection_finding_factory, tmp_path):
+        findings = [detection_finding_factory(index) for index in range(5)]
+        path = tmp_path / "findings.ndjson"
+
+        async def main():
+            with ThreadPoolExecutor(1) as executor:
+                async with AsyncFileWriter(path, executor=executor) as writer:
+                    await writer.write_many(findings)
+
+        asyncio.run(main())
+
+        assert path.read_bytes() == ndjson(findings)
+
+    def test_stream_is_left_open(self, detection_finding_factory):
+        stream = io.BytesIO()
+
+        async def main():
+            async with AsyncFileWriter(stream) as writer:
+                await writer.write(detection_finding_factory(0))
+
+        asyncio.run(main())
+
+        assert stream.getvalue() == ndjson([detection_finding_factory(0)])
+
+    def test_backpressure(self, detection_finding_factory):
+        finding = detection_finding_factory(0)
+
+        class SlowWriter(AsyncMemoryWriter):
+            release = None
+
+            async def _write(self, data):
+                await self.release.wait()
+                await super()._write(data)
+
+        async def main():
+            writer = SlowWriter(max_queue_size=2, batch_size=1)
+            writer.release = asyncio.Event()
+            # The first finding is taken by the sink, two more fill the queue.
+            for _ in range(3):
+                await writer.write(finding)
+                await asyncio.sleep(0)
+            blocked = asyncio.create_task(writer.write(finding))
+            await asyncio.sleep(0.01)
+            assert not blocked.done()
+            writer.release.set()
+            await blocked
+            await writer.close()
+            return writer
+
+        assert asyncio.run(main()).count == 4
+
+    def test_errors_are_raised(self, detection_finding_factory):
+        class FailingWriter(AsyncMemoryWriter):
+            async def _write(self, data):
+                raise OSError("disk full")
+
+        async def main():
+            writer = FailingWriter()
+            await writer.write(detection_finding_factory(0))
+            with pytest.raises(OSError, match="disk full"):
+                await writer.flush()
+            with pytest.raises(OSError, match="disk full"):
+                await writer.write(detection_finding_factory(1))
+            with pytest.raises(OSError, match="disk full"):
+                await writer.close()
+            closed = AsyncMemoryWriter()
+            await closed.close()
+            with pytest.raises(ValueError, match="closed"):
+                await closed.write(detection_finding_factory(2))
+
+        asyncio.run(main())
+
+    def test_file_is_opened_lazily(self, detection_finding_factory, tmp_path):
+        path = tmp_path / "findings.ndjson"
+        empty_path = tmp_path / "empty.ndjson"
+
+        async def main():
+            writer = AsyncFileWriter(path)
+            assert not path.exists()
+            await writer.write(detection_finding_factory(0))
+            await writer.flush()
+            assert path.exists()
+            await writer.close()
+            empty = AsyncFileWriter(empty_path)
+            await empty.close()
+
+        asyncio.run(main())
+
+        assert path.read_bytes() == ndjson([detection_finding_factory(0)])
+        assert empty_path.read_bytes() == b""
+
+    def test_body_errors_are_not_replaced(self, detection_finding_factory):
+        class FailingWriter(AsyncMemoryWriter):
+            async def _write(self, data):
+                raise OSError("disk full")
+
+        async def main():
+            async with FailingWriter() as writer:
+                await writer.write(detection_finding_factory(0))
+                with pytest.raises(OSError, match="disk full"):
+                    await writer.flush()
+                raise KeyError("body")
+
+        with pytest.raises(KeyError, match="body"):
+            asyncio.run(main())
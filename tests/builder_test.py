@@ -0,0 +1,117 @@
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from py_ocsf_models.builder import FindingBuilder
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.frozen import freeze
+
+TEMPLATE_FIELDS = ("metadata", "cloud", "category_uid", "class_uid", "activity_id")
+
+
+def builder_for(finding):
+    return FindingBuilder(
+        DetectionFinding,
+        **{name: getattr(finding, name) for name in TEMPLATE_FIELDS},
+    )
+
+
+def event_fields(finding):
+    fields = finding.model_dump(exclude_unset=True)
+    for name in TEMPLATE_FIELDS:
+        fields.pop(name)
+    return fields
+
+
+class TestFindingBuilder:
+    def test_build_shares_templates(self, detection_finding_factory):
+        builder = builder_for(detection_finding_factory(0))
+        expected = [detection_finding_factory(index) for index in (6, 12)]
+
+        findings = [builder.build(**event_fields(finding)) for finding in expected]
+
+        assert findings == expected
+        assert [
+            finding.model_dump_json(exclude_unset=True) for finding in findings
+        ] == [finding.model_dump_json(exclude_unset=True) for finding in expected]
+        assert findings[0].metadata is findings[1].metadata
+        assert findings[0].cloud is findings[1].cloud
+        assert findings[0].finding_info is not findings[1].finding_info
+
+    def test_templates_are_frozen(self, detection_finding_factory):
+        template = detection_finding_factory(0)
+        builder = builder_for(template)
+        finding = builder.build(**event_fields(template))
+
+        with pytest.raises(ValidationError):
+            finding.metadata.product.name = "Other"
+        with pytest.raises(ValidationError):
+            finding.cloud.account.uid = "123456789012"
+        finding.finding_info.title = "Renamed"
+        template.cloud.region = "ap-south-1"
+
+        assert builder.templates["metadata"].product.name == "Prowler"
+        assert builder.templates["cloud"].region == "eu-west-1"
+
+    def test_templates_are_validated(self, detection_finding_factory):
+        with pytest.raises(ValidationError):
+            FindingBuilder(DetectionFinding, cloud={"region": "eu-west-1"})
+        with pytest.raises(ValueError):
+            FindingBuilder(DetectionFinding, unknown=1)
+
+        builder = FindingBuilder(
+            DetectionFinding, cloud={"provider": "aws", "region": "eu-west-1"}
+        )
+        assert builder.templates["cloud"].provider == "aws"
+
+    def test_overrides_copy_on_write(self, detection_finding_factory):
+        template = detection_finding_factory(0)
+        builder = builder_for(template)
+        fields = event_fields(template)
+
+        first = builder.build(overrides={"cloud.region": "us-east-1"}, **fields)
+        second = builder.build(overrides={"cloud.region": "us-east-1"}, **fields)
+        other = builder.build(overrides={"cloud.account.uid": "999"}, **fields)
+
+        assert first.cloud.region == "us-east-1"
+        assert first.cloud is second.cloud
+        assert first.cloud.account is builder.templates["cloud"].account
+        assert first.metadata is builder.templates["metadata"]
+        assert other.cloud.account.uid == "999"
+        assert other.cloud.account.name == "Account"
+        assert builder.templates["cloud"].region == "eu-west-1"
+        assert builder.templates["cloud"].account.uid == "000000000000"
+        with pytest.raises(ValidationError):
+            builder.build(overrides={"cloud.account.type_id": "unknown"}, **fields)
+        with pytest.raises(ValueError):
+            builder.build(overrides={"finding_info.title": "Title"}, **fields)
+        with pytest.raises(ValueError):
+            builder.build(overrides={"cloud.unknown": 1}, **fields)
+
+    def test_variant_cache_is_bounded(self, detection_finding_factory):
+        template = detection_finding_factory(0)
+        builder = FindingBuilder(
+            DetectionFinding, variant_cache_size=2, cloud=template.cloud
+        )
+
+        for region in ("a", "b", "c", "a"):
+            builder._override({"cloud.region": region})
+
+        assert [key[1][0][1] for key in builder._variants] == ["c", "a"]
+
+
+class TestFreeze:
+    def test_frozen_copy(self, detection_finding_factory):
+        metadata = detection_finding_factory(0).metadata
+
+        frozen = freeze(metadata)
+
+        assert frozen == metadata
+        assert metadata == frozen
+        assert isinstance(frozen, type(metadata))
+        assert frozen.model_dump_json() == metadata.model_dump_json()
+        assert freeze(frozen) is frozen
+        assert pickle.loads(pickle.dumps(frozen)) == frozen
+        with pytest.raises(ValidationError):
+            frozen.product.feature.name = "Other"
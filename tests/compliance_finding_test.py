@@ -1,7 +1,5 @@
 from datetime import datetime
 
-import requests
-
 from py_ocsf_models import OCSF_VERSION
 from py_ocsf_models.events.findings.activity_id import ActivityID
 from py_ocsf_models.events.findings.category_uid import CategoryUID
@@ -22,6 +20,7 @@ from py_ocsf_models.objects.product import Feature, Product
 from py_ocsf_models.objects.resource_details import ResourceDetails
 from py_ocsf_models.objects.url import URL
 from py_ocsf_models.objects.verdict import VerdictID
+from py_ocsf_models.validation.ocsf_validator import OCSFValidator
 
 
 class TestComplianceFinding:
@@ -159,9 +158,5 @@ class TestComplianceFinding:
         assert uid == "123"
 
         compliance_finding_json = compliance_finding.model_dump_json(exclude_unset=True)
-        url = "https://schema.ocsf.io/api/v2/validate"
-        headers = {"content-type": "application/json"}
-
-        response = requests.post(url, headers=headers, data=compliance_finding_json)
-        assert response.status_code == 200, f"Schema validation failed: {response.text}"
-        assert response.json()["error_count"] == 0
+        result = OCSFValidator().validate(compliance_finding_json)
+        assert result["error_count"] == 0, f"Schema validation failed: {result}"
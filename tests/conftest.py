@@ -0,0 +1,68 @@
+import pytest
+
+from py_ocsf_models import OCSF_VERSION
+from py_ocsf_models.events.findings.category_uid import CategoryUID
+from py_ocsf_models.events.findings.class_uid import ClassUID
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.events.findings.detection_finding_type_id import (
+    DetectionFindingTypeID,
+)
+from py_ocsf_models.events.findings.severity_id import SeverityID
+from py_ocsf_models.events.findings.status_id import StatusID
+from py_ocsf_models.objects.account import Account, TypeID
+from py_ocsf_models.objects.cloud import Cloud
+from py_ocsf_models.objects.finding_info import FindingInformation
+from py_ocsf_models.objects.metadata import Metadata
+from py_ocsf_models.objects.product import Feature, Product
+from py_ocsf_models.objects.resource_details import ResourceDetails
+
+
+def build_detection_finding(index):
+    return DetectionFinding(
+        metadata=Metadata(
+            version=OCSF_VERSION,
+            product=Product(
+                feature=Feature(name="Prowler", uid="prowler", version="5.0.0"),
+                name="Prowler",
+                vendor_name="Prowler",
+                version="5.0.0",
+            ),
+            profiles=["cloud"],
+        ),
+        finding_info=FindingInformation(
+            title=f"Finding {index}",
+            uid=f"prowler-aws-check-{index}",
+            desc="Description",
+        ),
+        severity_id=SeverityID(index % 6),
+        severity=SeverityID(index % 6).name,
+        status_id=StatusID.New,
+        status=StatusID.New.name,
+        activity_id=1,
+        category_uid=CategoryUID.Findings.value,
+        class_uid=ClassUID.DetectionFinding.value,
+        type_uid=DetectionFindingTypeID.Create,
+        time=1700000000 + index,
+        cloud=Cloud(
+            account=Account(
+                name="Account",
+                type_id=TypeID.AWS_Account,
+                uid=f"{index % 3:012d}",
+            ),
+            provider="aws",
+            region=("eu-west-1", "us-east-1")[index % 2],
+        ),
+        resources=[
+            ResourceDetails(
+                name=f"bucket-{index}",
+                type="AwsS3Bucket",
+                uid=f"arn:aws:s3:::bucket-{index}",
+                region="eu-west-1",
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def detection_finding_factory():
+    return build_detection_finding
@@ -0,0 +1,87 @@
+from hashlib import blake2b
+
+from py_ocsf_models.objects.resource_details import ResourceDetails
+from py_ocsf_models.processing.bloom_filter import BloomFilter
+from py_ocsf_models.processing.dedup import FindingDeduplicator, deduplicate
+from py_ocsf_models.processing.fingerprint import finding_fingerprint
+
+
+class TestFindingFingerprint:
+    def test_volatile_fields_are_ignored(self, detection_finding_factory):
+        finding = detection_finding_factory(1)
+        rescanned = detection_finding_factory(1)
+        rescanned.time = finding.time + 3600
+        rescanned.metadata.processed_time = 1800000000
+        rescanned.finding_info.title = "Renamed"
+
+        assert finding_fingerprint(finding) == finding_fingerprint(rescanned)
+        assert len(finding_fingerprint(finding)) == 16
+
+    def test_identity_fields_are_hashed(self, detection_finding_factory):
+        finding = detection_finding_factory(1)
+        fingerprint = finding_fingerprint(finding)
+
+        other_region = detection_finding_factory(1)
+        other_region.cloud.region = "ap-south-1"
+        other_resource = detection_finding_factory(1)
+        other_resource.resources[0].uid = "arn:aws:s3:::other"
+        other_check = detection_finding_factory(1)
+        other_check.finding_info.uid = "prowler-aws-other"
+
+        assert finding_fingerprint(other_region) != fingerprint
+        assert finding_fingerprint(other_resource) != fingerprint
+        assert finding_fingerprint(other_check) != fingerprint
+
+    def test_resource_order_is_ignored(self, detection_finding_factory):
+        finding = detection_finding_factory(1)
+        finding.resources.append(ResourceDetails(uid="arn:aws:s3:::other"))
+        reordered = detection_finding_factory(1)
+        reordered.resources.insert(0, ResourceDetails(uid="arn:aws:s3:::other"))
+
+        assert finding_fingerprint(finding) == finding_fingerprint(reordered)
+
+
+class TestDeduplicate:
+    def test_exact_mode_increments_count(self, detection_finding_factory):
+        findings = [detection_finding_factory(index % 3) for index in range(7)]
+        findings[3].count = 5
+
+        distinct = list(deduplicate(findings))
+
+        assert [finding.finding_info.uid for finding in distinct] == [
+            "prowler-aws-check-0",
+            "prowler-aws-check-1",
+            "prowler-aws-check-2",
+        ]
+        assert [finding.count for finding in distinct] == [7, 2, 2]
+        assert '"count":7' in distinct[0].model_dump_json(exclude_unset=True)
+        assert distinct[0] is not findings[0]
+        assert [finding.count for finding in findings[:3]] == [None, None, None]
+
+    def test_bounded_mode(self, detection_finding_factory):
+        findings = [detection_finding_factory(index % 50) for index in range(200)]
+        deduplicator = FindingDeduplicator(capacity=1000)
+
+        distinct = [finding for finding in findings if deduplicator.add(finding)]
+
+        assert len(distinct) == 50
+        assert deduplicator.seen == 200
+        assert deduplicator.duplicates == 150
+        assert distinct[0].count is None
+
+
+class TestBloomFilter:
+    def test_membership(self):
+        bloom_filter = BloomFilter(capacity=10_000, error_rate=0.01)
+        added = [fingerprint(index) for index in range(10_000)]
+        absent = [fingerprint(index) for index in range(10_000, 20_000)]
+
+        already_present = sum(bloom_filter.add(key) for key in added)
+
+        assert all(key in bloom_filter for key in added)
+        assert already_present < 200
+        assert sum(key in bloom_filter for key in absent) < 200
+
+
+def fingerprint(index):
+    return blake2b(index.to_bytes(8, "little"), digest_size=16).digest()
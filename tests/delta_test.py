@@ -0,0 +1,106 @@
+from datetime import datetime, timezone
+
+from py_ocsf_models.events.findings.activity_id import ActivityID
+from py_ocsf_models.events.findings.detection_finding_type_id import (
+    DetectionFindingTypeID,
+)
+from py_ocsf_models.events.findings.status_id import StatusID
+from py_ocsf_models.processing.delta import scan_delta
+from py_ocsf_models.processing.external_sort import sort_by_fingerprint
+from py_ocsf_models.processing.fingerprint import finding_fingerprint
+
+
+class TestSortByFingerprint:
+    def test_in_memory(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(20)]
+
+        keys = [key for key, _ in sort_by_fingerprint(findings)]
+
+        assert keys == sorted(finding_fingerprint(finding) for finding in findings)
+
+    def test_spills_runs(self, detection_finding_factory, tmp_path):
+        findings = [detection_finding_factory(index) for index in range(50)]
+
+        pairs = list(sort_by_fingerprint(findings, chunk_size=7, directory=tmp_path))
+
+        assert [key for key, _ in pairs] == sorted(
+            finding_fingerprint(finding) for finding in findings
+        )
+        assert all(finding_fingerprint(finding) == key for key, finding in pairs)
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestScanDelta:
+    def test_new_updated_resolved(self, detection_finding_factory):
+        previous = [detection_finding_factory(index) for index in range(4)]
+        previous[0].time_dt = datetime.fromtimestamp(previous[0].time, tz=timezone.utc)
+        current = [detection_finding_factory(index) for index in (1, 2, 3, 4)]
+        for finding in current:
+            finding.time += 86400
+        current[1].finding_info.title = "Renamed"
+
+        delta = {
+            finding.finding_info.uid: finding
+            for finding in scan_delta(previous, current, scan_time=1800000000)
+        }
+
+        assert sorted(delta) == [
+            "prowler-aws-check-0",
+            "prowler-aws-check-2",
+            "prowler-aws-check-4",
+        ]
+        resolved = delta["prowler-aws-check-0"]
+        assert resolved.status_id == StatusID.Resolved
+        assert resolved.activity_id == ActivityID.Close
+        assert resolved.type_uid == DetectionFindingTypeID.Close
+        assert resolved.time == 1800000000
+        assert resolved.time_dt == datetime.fromtimestamp(1800000000, tz=timezone.utc)
+        assert previous[0].time_dt.timestamp() == previous[0].time
+        updated = delta["prowler-aws-check-2"]
+        assert updated.status_id == StatusID.New
+        assert updated.activity_id == ActivityID.Update
+        assert updated.type_uid == DetectionFindingTypeID.Update
+        assert updated.finding_info.first_seen_time == previous[2].time
+        assert updated.finding_info.last_seen_time == current[1].time
+        new = delta["prowler-aws-check-4"]
+        assert new.status_id == StatusID.New
+        assert new.type_uid == DetectionFindingTypeID.Create
+        assert new.finding_info.first_seen_time == current[3].time
+        assert current[1].activity_id == 1
+        assert current[1].finding_info.last_seen_time is None
+
+    def test_resolved_findings(self, detection_finding_factory):
+        previous = [detection_finding_factory(index) for index in range(2)]
+        for finding in previous:
+            finding.status_id = StatusID.Resolved
+        current = [detection_finding_factory(1)]
+
+        delta = list(scan_delta(previous, current))
+
+        assert len(delta) == 1
+        assert delta[0].finding_info.uid == "prowler-aws-check-1"
+        assert delta[0].status_id == StatusID.New
+        assert delta[0].activity_id == ActivityID.Update
+
+    def test_first_seen_time_is_carried_forward(self, detection_finding_factory):
+        previous = detection_finding_factory(1)
+        previous.finding_info.first_seen_time = 1600000000
+        current = detection_finding_factory(1)
+        current.severity = "Changed"
+
+        (updated,) = scan_delta([previous], [current])
+
+        assert updated.finding_info.first_seen_time == 1600000000
+
+    def test_spills_both_scans(self, detection_finding_factory, tmp_path):
+        previous = [detection_finding_factory(index) for index in range(0, 60)]
+        current = [detection_finding_factory(index) for index in range(30, 90)]
+
+        delta = list(
+            scan_delta(previous, current, scan_time=0, chunk_size=8, directory=tmp_path)
+        )
+
+        statuses = [finding.status_id for finding in delta]
+        assert statuses.count(StatusID.Resolved) == 30
+        assert statuses.count(StatusID.New) == 30
+        assert len(delta) == 60
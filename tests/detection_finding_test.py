@@ -1,8 +1,6 @@
 import uuid
 from datetime import datetime
 
-import requests
-
 from py_ocsf_models import OCSF_VERSION
 from py_ocsf_models.events.findings.activity_id import ActivityID
 from py_ocsf_models.events.findings.category_uid import CategoryUID
@@ -32,6 +30,7 @@ from py_ocsf_models.objects.product import Feature, Product
 from py_ocsf_models.objects.remediation import KBArticle, Remediation
 from py_ocsf_models.objects.resource_details import ResourceDetails
 from py_ocsf_models.objects.vulnerability_details import VulnerabilityDetails
+from py_ocsf_models.validation.ocsf_validator import OCSFValidator
 
 PROWLER_VERSION = "4.1.0"
 PROWLER_PRODUCT = "Prowler"
@@ -520,9 +519,5 @@ class TestDetectionFinding:
 
         detection_finding_json = detection_finding.model_dump_json(exclude_unset=True)
 
-        url = "https://schema.ocsf.io/api/v2/validate"
-        headers = {"content-type": "application/json"}
-
-        response = requests.post(url, headers=headers, data=detection_finding_json)
-        assert response.status_code == 200, f"Schema validation failed: {response.text}"
-        assert response.json()["error_count"] == 0
+        result = OCSFValidator().validate(detection_finding_json)
+        assert result["error_count"] == 0, f"Schema validation failed: {result}"
@@ -0,0 +1,79 @@
+import io
+
+import pytest
+from pydantic import ValidationError
+
+from py_ocsf_models.events.findings.class_uid import ClassUID
+from py_ocsf_models.events.findings.compliance_finding import ComplianceFinding
+from py_ocsf_models.events.findings.compliance_finding_type_id import (
+    ComplianceFindingTypeID,
+)
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.io.event_decoder import decode_event, decode_events, event_adapter
+
+
+def build_compliance_finding(detection_finding):
+    return ComplianceFinding.model_validate(
+        detection_finding.model_dump(exclude={"cloud", "class_uid", "type_uid"})
+        | {
+            "compliance": {"standards": ["CIS"]},
+            "class_uid": ClassUID.ComplianceFinding,
+            "type_uid": ComplianceFindingTypeID.Create,
+        }
+    )
+
+
+class CustomDetectionFinding(DetectionFinding):
+    pass
+
+
+class TestEventDecoder:
+    def test_decode_event(self, detection_finding_factory):
+        detection_finding = detection_finding_factory(0)
+        compliance_finding = build_compliance_finding(detection_finding_factory(1))
+
+        for finding in (detection_finding, compliance_finding):
+            decoded = decode_event(finding.model_dump_json(exclude_unset=True))
+            assert type(decoded) is type(finding)
+            assert decoded == finding
+            assert decode_event(finding.model_dump(exclude_unset=True)) == finding
+
+    def test_type_uid_without_class_uid(self, detection_finding_factory):
+        finding = build_compliance_finding(detection_finding_factory(0))
+        data = finding.model_dump(exclude_unset=True)
+        del data["class_uid"]
+
+        assert type(decode_event(data)) is ComplianceFinding
+
+    @pytest.mark.parametrize(
+        "data", ['{"class_uid": 1001}', '{"type_uid": 100101}', '{"time": 1}']
+    )
+    def test_unsupported_class(self, data):
+        with pytest.raises(ValidationError, match="class_uid or type_uid of class"):
+            decode_event(data)
+
+    def test_invalid_event_reports_its_class(self, detection_finding_factory):
+        data = detection_finding_factory(0).model_dump(exclude_unset=True)
+        del data["finding_info"]
+
+        with pytest.raises(ValidationError) as error:
+            decode_event(data)
+        assert error.value.error_count() == 1
+        assert error.value.errors()[0]["loc"] == (2004, "finding_info")
+
+    def test_decode_events(self, detection_finding_factory):
+        findings = [
+            detection_finding_factory(0),
+            build_compliance_finding(detection_finding_factory(1)),
+        ]
+        data = b"\n".join(
+            finding.model_dump_json(exclude_unset=True).encode() for finding in findings
+        )
+
+        assert list(decode_events(io.BytesIO(data + b"\n\n"))) == findings
+
+    def test_event_adapter(self):
+        assert event_adapter() is event_adapter()
+        assert event_adapter((DetectionFinding,)) is not event_adapter()
+        with pytest.raises(ValueError, match="share the tag 2004"):
+            event_adapter((DetectionFinding, CustomDetectionFinding))
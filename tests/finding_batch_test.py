@@ -0,0 +1,149 @@
+import numpy as np
+import pytest
+
+from py_ocsf_models.events.findings.compliance_finding import ComplianceFinding
+from py_ocsf_models.events.findings.compliance_finding_type_id import (
+    ComplianceFindingTypeID,
+)
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.processing.finding_batch import MISSING, FindingBatch
+
+
+class TestFindingBatch:
+    def test_columns(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(6)]
+        findings[2].cloud.region = None
+
+        batch = FindingBatch.from_findings(findings)
+
+        assert len(batch) == 6
+        assert batch.cls is DetectionFinding
+        assert batch.column("severity_id").tolist() == [0, 1, 2, 3, 4, 5]
+        assert batch.column("severity_id").dtype == np.int8
+        assert batch.column("time").tolist() == [1700000000 + i for i in range(6)]
+        assert batch.column("risk_score").tolist() == [MISSING] * 6
+        assert batch.column("cloud.region").tolist() == [
+            "eu-west-1",
+            "us-east-1",
+            None,
+            "us-east-1",
+            "eu-west-1",
+            "us-east-1",
+        ]
+        assert batch.dictionaries["cloud.account.uid"] == [
+            "000000000000",
+            "000000000001",
+            "000000000002",
+        ]
+
+    def test_rows(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(4)]
+
+        batch = FindingBatch.from_findings(findings)
+
+        assert list(batch) == findings
+        assert batch[1] == findings[1]
+        assert batch[-1] == findings[-1]
+        with pytest.raises(IndexError):
+            batch[4]
+
+    def test_filter(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(12)]
+        batch = FindingBatch.from_findings(findings)
+
+        high = batch.filter(
+            (batch.column("severity_id") >= 4)
+            & batch.equals("cloud.region", "eu-west-1")
+        )
+
+        assert [finding.finding_info.uid for finding in high] == [
+            "prowler-aws-check-4",
+            "prowler-aws-check-10",
+        ]
+        assert high.dictionaries is batch.dictionaries
+        assert high.lookups is batch.lookups
+        assert not batch.equals("cloud.region", "ap-south-1").any()
+        assert batch.isin("severity_id", [0, 1]).sum() == 4
+        assert batch.isin("cloud.account.uid", ["000000000001"]).sum() == 4
+        assert batch.isin("cloud.region", ["ap-south-1"]).sum() == 0
+        assert batch.isin("cloud.region", []).sum() == 0
+
+    def test_lookups(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(6)]
+        batch = FindingBatch.from_findings(findings)
+
+        for path, dictionary in batch.dictionaries.items():
+            assert batch.lookups[path] == {
+                value: code for code, value in enumerate(dictionary)
+            }
+        assert batch.equals("finding_info.uid", "prowler-aws-check-3").tolist() == [
+            False,
+            False,
+            False,
+            True,
+            False,
+            False,
+        ]
+        assert batch.isin(
+            "finding_info.uid", ["prowler-aws-check-1", "prowler-aws-check-5", "x"]
+        ).nonzero()[0].tolist() == [1, 5]
+
+    def test_sort_by(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(6)]
+        findings[3].cloud.region = None
+        batch = FindingBatch.from_findings(findings)
+
+        by_severity = batch.sort_by("severity_id", descending=True)
+        by_region = batch.sort_by("cloud.region")
+
+        assert by_severity.column("severity_id").tolist() == [5, 4, 3, 2, 1, 0]
+        assert by_severity[0] == findings[5]
+        assert by_region.column("cloud.region").tolist() == [
+            None,
+            "eu-west-1",
+            "eu-west-1",
+            "eu-west-1",
+            "us-east-1",
+            "us-east-1",
+        ]
+        assert by_region.column("time").tolist() == [
+            1700000003,
+            1700000000,
+            1700000002,
+            1700000004,
+            1700000001,
+            1700000005,
+        ]
+
+    def test_count_by(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(7)]
+        findings[0].cloud.region = None
+
+        batch = FindingBatch.from_findings(findings)
+
+        assert batch.count_by("cloud.region") == {
+            None: 1,
+            "eu-west-1": 3,
+            "us-east-1": 3,
+        }
+        assert batch.count_by("severity_id") == {0: 2, 1: 1, 2: 1, 3: 1, 4: 1, 5: 1}
+        assert batch.count_by("risk_score") == {None: 7}
+
+    def test_one_class(self, detection_finding_factory):
+        compliance_finding = ComplianceFinding.model_validate(
+            detection_finding_factory(0).model_dump(
+                exclude={"cloud", "class_uid", "type_uid"}
+            )
+            | {
+                "compliance": {"standards": ["CIS"]},
+                "type_uid": ComplianceFindingTypeID.Create,
+            }
+        )
+
+        with pytest.raises(ValueError):
+            FindingBatch.from_findings(
+                [detection_finding_factory(0), compliance_finding]
+            )
+        with pytest.raises(ValueError):
+            FindingBatch.from_findings([])
+        assert len(FindingBatch.from_findings([], finding_class=DetectionFinding)) == 0
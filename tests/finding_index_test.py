@@ -0,0 +1,117 @@
+import pytest
+
+from py_ocsf_models.events.findings.compliance_finding import ComplianceFinding
+from py_ocsf_models.events.findings.compliance_finding_type_id import (
+    ComplianceFindingTypeID,
+)
+from py_ocsf_models.objects.cve import CVE
+from py_ocsf_models.objects.mitre_attack import MITREAttack, Technique
+from py_ocsf_models.objects.resource_details import ResourceDetails
+from py_ocsf_models.objects.vulnerability_details import VulnerabilityDetails
+from py_ocsf_models.processing.finding_index import FindingIndex
+
+
+class TestFindingIndex:
+    def test_find(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(6)]
+        findings[1].vulnerabilities = [
+            VulnerabilityDetails(cve=CVE(uid="CVE-2024-3094")),
+            VulnerabilityDetails(cve=CVE(uid="CVE-2021-44228")),
+        ]
+        findings[4].vulnerabilities = [
+            VulnerabilityDetails(cve=CVE(uid="CVE-2024-3094"))
+        ]
+        findings[2].finding_info.attacks = [
+            MITREAttack(technique=Technique(name="Valid Accounts", uid="T1078"))
+        ]
+
+        index = FindingIndex(findings)
+
+        assert len(index) == 6
+        assert index.find("resources.uid", "arn:aws:s3:::bucket-3") == [findings[3]]
+        assert index.find("cloud.account.uid", "000000000001") == [
+            findings[1],
+            findings[4],
+        ]
+        assert index.find("vulnerabilities.cve.uid", "CVE-2024-3094") == [
+            findings[1],
+            findings[4],
+        ]
+        assert index.find("finding_info.attacks.technique.uid", "T1078") == [
+            findings[2]
+        ]
+        assert index.find("finding_info.uid", "prowler-aws-check-5") == [findings[5]]
+        assert index.find("finding_info.uid", "unknown") == []
+        assert index.count("cloud.account.uid", "000000000000") == 2
+        assert sorted(index.values("vulnerabilities.cve.uid")) == [
+            "CVE-2021-44228",
+            "CVE-2024-3094",
+        ]
+        with pytest.raises(ValueError):
+            index.find("cloud.region", "eu-west-1")
+
+    def test_find_all(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(9)]
+        for finding in findings[::2]:
+            finding.finding_info.attacks = [
+                MITREAttack(technique=Technique(name="Valid Accounts", uid="T1078"))
+            ]
+        index = FindingIndex(findings)
+
+        matching = index.find_all(
+            {
+                "cloud.account.uid": "000000000000",
+                "finding_info.attacks.technique.uid": "T1078",
+            }
+        )
+
+        assert matching == [findings[0], findings[6]]
+        assert index.find_all({}) == findings
+
+    def test_add_remove(self, detection_finding_factory):
+        index = FindingIndex()
+        first = detection_finding_factory(0)
+        second = detection_finding_factory(3)
+        second.resources.append(
+            ResourceDetails(
+                type="AwsS3Bucket",
+                uid="arn:aws:s3:::bucket-0",
+            )
+        )
+
+        first_row = index.add(first)
+        second_row = index.add(second)
+
+        assert index.rows("resources.uid", "arn:aws:s3:::bucket-0") == [
+            first_row,
+            second_row,
+        ]
+        assert index.remove(first_row) is first
+        assert first_row not in index
+        assert index[second_row] is second
+        assert index.find("resources.uid", "arn:aws:s3:::bucket-0") == [second]
+        assert index.remove(second_row) is second
+        assert index.values("cloud.account.uid") == []
+        assert index.values("resources.uid") == []
+        with pytest.raises(KeyError):
+            index.remove(second_row)
+
+    def test_mixed_classes(self, detection_finding_factory):
+        detection_finding = detection_finding_factory(1)
+        compliance_finding = ComplianceFinding.model_validate(
+            detection_finding_factory(2).model_dump(
+                exclude={"cloud", "class_uid", "type_uid"}
+            )
+            | {
+                "compliance": {"standards": ["CIS"]},
+                "type_uid": ComplianceFindingTypeID.Create,
+            }
+        )
+
+        index = FindingIndex([detection_finding, compliance_finding])
+
+        assert index.values("cloud.account.uid") == ["000000000001"]
+        assert index.find("resources.uid", "arn:aws:s3:::bucket-2") == [
+            compliance_finding
+        ]
+        assert list(index) == [detection_finding, compliance_finding]
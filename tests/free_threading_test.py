@@ -0,0 +1,54 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.frozen import frozen_class
+from py_ocsf_models.interning import InterningPool
+from py_ocsf_models.objects.account import Account
+from py_ocsf_models.views import view_class
+
+THREADS = 16
+
+
+def race(function, *args):
+    # Start every call at once, to make races as likely as possible.
+    barrier = threading.Barrier(THREADS)
+
+    def call():
+        barrier.wait()
+        return function(*args)
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        futures = [executor.submit(call) for _ in range(THREADS)]
+        return [future.result() for future in futures]
+
+
+class TestFreeThreading:
+    def test_generated_classes_are_unique(self):
+        class RacedAccount(Account):
+            pass
+
+        assert len({id(cls) for cls in race(frozen_class, RacedAccount)}) == 1
+        assert len({id(cls) for cls in race(view_class, RacedAccount)}) == 1
+
+    def test_shared_interning_pool(self, detection_finding_factory):
+        data = [
+            detection_finding_factory(index).model_dump_json() for index in range(20)
+        ]
+
+        def intern(pool):
+            return [
+                pool.intern(DetectionFinding.model_validate_json(json)) for json in data
+            ]
+
+        serial_pool = InterningPool()
+        expected = intern(serial_pool)
+        pool = InterningPool(max_size=4)
+
+        results = race(intern, pool)
+
+        assert all(findings == expected for findings in results)
+        assert pool.hits + pool.misses == THREADS * (
+            serial_pool.hits + serial_pool.misses
+        )
+        assert len(pool) == 4
@@ -0,0 +1,94 @@
+import copy
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from py_ocsf_models import frozen
+from py_ocsf_models.frozen import (
+    FrozenAccount,
+    FrozenProduct,
+    freeze,
+    frozen_class,
+    is_frozen,
+    model_class,
+)
+from py_ocsf_models.objects.account import Account
+from py_ocsf_models.objects.product import Feature, Product
+
+
+def account(**fields):
+    return Account(name="Account", type_id=10, uid="123456789012", **fields)
+
+
+class TestFrozenVariants:
+    def test_generated_from_object_models(self):
+        assert FrozenAccount is frozen_class(Account)
+        assert issubclass(FrozenAccount, Account)
+        assert model_class(FrozenAccount) is Account
+        assert FrozenAccount.model_fields.keys() == Account.model_fields.keys()
+        assert "FrozenCloud" in dir(frozen)
+        assert "FrozenTypeID" not in dir(frozen)
+        with pytest.raises(AttributeError, match="FrozenTypeID"):
+            _ = frozen.FrozenTypeID
+        with pytest.raises(AttributeError, match="FrozenDetectionFinding"):
+            _ = frozen.FrozenDetectionFinding
+
+    def test_validation(self):
+        product = FrozenProduct.model_validate_json(
+            '{"vendor_name":"Prowler","feature":{"name":"Prowler"}}'
+        )
+
+        assert is_frozen(product)
+        assert is_frozen(product.feature)
+        assert product == Product(
+            vendor_name="Prowler", feature=Feature(name="Prowler")
+        )
+        assert product.model_dump_json(exclude_unset=True) == (
+            '{"feature":{"name":"Prowler"},"vendor_name":"Prowler"}'
+        )
+        with pytest.raises(ValidationError):
+            product.feature.name = "Other"
+        with pytest.raises(ValidationError):
+            FrozenProduct(name="Prowler")
+
+    def test_hashable(self):
+        first = FrozenAccount(
+            name="Account", type_id=10, uid="123456789012", labels=["prod"]
+        )
+        second = freeze(account(labels=["prod"]))
+        other = freeze(account(labels=["dev"]))
+
+        counts = {first: 1}
+        counts[second] = counts.get(second, 0) + 1
+
+        assert counts == {first: 2}
+        assert hash(first) == hash(second)
+        assert hash(first) != hash(other)
+        assert {first, second, other} == {first, other}
+        with pytest.raises(TypeError):
+            first.labels.append("dev")
+
+    def test_copies(self):
+        original = freeze(account(labels=["prod"]))
+
+        updated = original.model_copy(update={"labels": ["dev"]})
+
+        assert is_frozen(updated)
+        assert hash(updated) == hash(freeze(account(labels=["dev"])))
+        assert hash(updated) != hash(original)
+        assert copy.deepcopy(original) == original
+        assert pickle.loads(pickle.dumps(original)) == original
+        assert pickle.loads(pickle.dumps(FrozenAccount)) is FrozenAccount
+
+    def test_freeze(self):
+        data = {"vendor_name": "Prowler", "feature": {"name": "Prowler"}}
+        product = Product.model_validate(data)
+
+        frozen_product = freeze(product)
+        product.feature.name = "Other"
+
+        assert frozen_product.feature.name == "Prowler"
+        assert frozen_product == Product.model_validate(data)
+        assert freeze(frozen_product) is frozen_product
+        assert freeze([product])[0] == product
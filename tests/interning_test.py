@@ -0,0 +1,79 @@
+import pytest
+from pydantic import ValidationError
+
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.interning import InterningPool, interning, interning_pool
+from py_ocsf_models.objects.account import Account
+from py_ocsf_models.objects.product import Product
+
+
+class TestInterning:
+    def test_model_validate_json_shares_objects(self, detection_finding_factory):
+        lines = [
+            detection_finding_factory(index).model_dump_json(exclude_unset=True)
+            for index in (0, 3, 6)
+        ]
+
+        with interning() as pool:
+            findings = [DetectionFinding.model_validate_json(line) for line in lines]
+
+        assert [
+            finding.model_dump_json(exclude_unset=True) for finding in findings
+        ] == lines
+        assert findings[0].metadata.product is findings[1].metadata.product
+        assert (
+            findings[0].metadata.product.feature is findings[2].metadata.product.feature
+        )
+        assert findings[0].cloud.account is findings[2].cloud.account
+        assert findings[0].metadata is not findings[1].metadata
+        assert pool.misses == 3
+        assert pool.hits == 6
+        with pytest.raises(ValidationError):
+            findings[0].cloud.account.uid = "123456789012"
+
+    def test_model_validate_shares_objects(self, detection_finding_factory):
+        data = detection_finding_factory(0).model_dump(exclude_unset=True)
+        pool = InterningPool()
+
+        with interning(pool):
+            first = DetectionFinding.model_validate(data)
+        with interning(pool):
+            second = DetectionFinding.model_validate(data)
+            account = Account.model_validate(data["cloud"]["account"])
+
+        assert first.metadata.product is second.metadata.product
+        assert account is first.cloud.account
+        assert first == second
+        assert interning_pool() is None
+
+    def test_disabled_by_default(self, detection_finding_factory):
+        line = detection_finding_factory(0).model_dump_json(exclude_unset=True)
+
+        first = DetectionFinding.model_validate_json(line)
+        second = DetectionFinding.model_validate_json(line)
+
+        assert first.metadata.product is not second.metadata.product
+        first.cloud.account.uid = "123456789012"
+
+    def test_set_fields_are_kept_apart(self):
+        with interning() as pool:
+            implicit = Product.model_validate({"vendor_name": "Prowler"})
+            explicit = Product.model_validate({"vendor_name": "Prowler", "lang": None})
+            again = Product.model_validate({"vendor_name": "Prowler"})
+
+        assert implicit is again
+        assert implicit is not explicit
+        assert explicit.model_dump_json(exclude_unset=True) == (
+            '{"lang":null,"vendor_name":"Prowler"}'
+        )
+        assert len(pool) == 2
+
+    def test_pool_is_bounded(self):
+        pool = InterningPool(max_size=2)
+
+        for name in ("a", "b", "c", "a"):
+            pool.intern(Product(vendor_name=name))
+
+        assert len(pool) == 2
+        assert pool.misses == 4
+        assert pool.hits == 0
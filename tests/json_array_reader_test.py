@@ -0,0 +1,130 @@
+import io
+
+import pytest
+
+from py_ocsf_models.events.findings.class_uid import ClassUID
+from py_ocsf_models.events.findings.compliance_finding import ComplianceFinding
+from py_ocsf_models.events.findings.compliance_finding_type_id import (
+    ComplianceFindingTypeID,
+)
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.io.json_array_reader import JSONArrayReader, read_json_array
+
+
+def build_compliance_finding(detection_finding):
+    return ComplianceFinding.model_validate(
+        detection_finding.model_dump(exclude={"cloud", "class_uid", "type_uid"})
+        | {
+            "compliance": {"standards": ["CIS"]},
+            "class_uid": ClassUID.ComplianceFinding,
+            "type_uid": ComplianceFindingTypeID.Create,
+        }
+    )
+
+
+def json_array(findings, indent=None):
+    return (
+        b"[\n"
+        + b",\n".join(
+            finding.model_dump_json(exclude_unset=True, indent=indent).encode()
+            for finding in findings
+        )
+        + b"\n]\n"
+    )
+
+
+class TestJSONArrayReader:
+    @pytest.mark.parametrize("chunk_size", [7, 256, 1024 * 1024])
+    def test_dispatches_on_class_uid(self, detection_finding_factory, chunk_size):
+        findings = [
+            detection_finding_factory(0),
+            build_compliance_finding(detection_finding_factory(1)),
+            detection_finding_factory(2),
+        ]
+
+        read = list(
+            JSONArrayReader(io.BytesIO(json_array(findings)), chunk_size=chunk_size)
+        )
+
+        assert [type(finding) for finding in read] == [
+            DetectionFinding,
+            ComplianceFinding,
+            DetectionFinding,
+        ]
+        assert read == findings
+
+    def test_indented(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(3)]
+        data = b"\xef\xbb\xbf  " + json_array(findings, indent=2)
+
+        assert list(JSONArrayReader(io.BytesIO(data), chunk_size=64)) == findings
+
+    def test_brackets_in_strings(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(3)]
+        findings[0].finding_info.desc = 'Policy {"Statement": [{"Effect": "Allow"}'
+        findings[1].finding_info.title = 'Unbalanced }, {"class_uid": 2003} \\" ]'
+
+        assert list(read_json_array(io.BytesIO(json_array(findings)))) == findings
+
+    @pytest.mark.parametrize("chunk_size", [7, 256, 1024 * 1024])
+    @pytest.mark.parametrize("message", ["{[", "}\n,\n1", "]}]}, {"])
+    def test_unbalanced_bracket_in_string(
+        self, detection_finding_factory, chunk_size, message
+    ):
+        finding = detection_finding_factory(0)
+        finding.message = message
+
+        read = list(
+            read_json_array(io.BytesIO(json_array([finding])), chunk_size=chunk_size)
+        )
+
+        assert read == [finding]
+
+    @pytest.mark.parametrize("chunk_size", [7, 256, 1024 * 1024])
+    def test_escaped_quote_before_brace(self, detection_finding_factory, chunk_size):
+        findings = [detection_finding_factory(index) for index in range(2)]
+        findings[0].message = 'Say \\"}], and "} \\'
+
+        read = list(
+            read_json_array(io.BytesIO(json_array(findings)), chunk_size=chunk_size)
+        )
+
+        assert read == findings
+
+    def test_path(self, detection_finding_factory, tmp_path):
+        findings = [detection_finding_factory(index) for index in range(2)]
+        path = tmp_path / "findings.json"
+        path.write_bytes(json_array(findings))
+
+        with JSONArrayReader(path) as reader:
+            assert list(reader) == findings
+            assert reader.count == 2
+        assert reader._stream.closed
+
+    @pytest.mark.parametrize("data", [b"[]", b" [\n ] \n"])
+    def test_empty(self, data):
+        assert list(read_json_array(io.BytesIO(data))) == []
+
+    @pytest.mark.parametrize(
+        "data, message",
+        [
+            (b'{"class_uid": 2004}', "not a JSON array"),
+            (b"[1]", "Expected an event object"),
+            (b'[{"class_uid": 1001}]', "Unsupported class_uid 1001"),
+            (b'[{"class_uid": 2004, "time": 1', "truncated"),
+            (b'[{"class_uid": 2004, }]', "Invalid event"),
+            (b"[] []", "Unexpected data"),
+        ],
+    )
+    def test_invalid(self, data, message):
+        with pytest.raises(ValueError, match=message):
+            list(read_json_array(io.BytesIO(data), chunk_size=4))
+
+    def test_missing_separator(self, detection_finding_factory):
+        finding = detection_finding_factory(0).model_dump_json(exclude_unset=True)
+        data = f"[{finding} {finding}]".encode()
+
+        reader = JSONArrayReader(io.BytesIO(data))
+        with pytest.raises(ValueError, match="Expected ','"):
+            list(reader)
+        assert reader.count == 1
@@ -0,0 +1,44 @@
+import subprocess
+import sys
+
+import pytest
+
+import py_ocsf_models
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+
+
+class TestLazyImport:
+    def test_top_level_exports(self):
+        assert py_ocsf_models.DetectionFinding is DetectionFinding
+        assert "DetectionFinding" in py_ocsf_models.__all__
+        assert "DetectionFinding" in dir(py_ocsf_models)
+
+    def test_all_lists_every_export(self):
+        assert py_ocsf_models.__all__ == [
+            "OCSF_VERSION",
+            *py_ocsf_models._LAZY_EXPORTS,
+        ]
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError, match="NotAModel"):
+            _ = py_ocsf_models.NotAModel
+
+    def test_import_is_lazy(self):
+        code = (
+            "import sys\n"
+            "import py_ocsf_models\n"
+            "assert 'py_ocsf_models.objects.device' not in sys.modules\n"
+            "from py_ocsf_models.events.findings.detection_finding import DetectionFinding\n"
+            "assert 'email_validator' not in sys.modules\n"
+            "assert not DetectionFinding.__pydantic_complete__\n"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_schema_is_built_on_first_use(self, detection_finding_factory):
+        finding = detection_finding_factory(1)
+
+        assert type(finding).__pydantic_complete__
+        assert DetectionFinding.model_validate_json(finding.model_dump_json()) == (
+            finding
+        )
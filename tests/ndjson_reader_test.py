@@ -0,0 +1,134 @@
+import os
+
+import pytest
+
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.io.ndjson_reader import NDJSONReader
+
+
+def write_ndjson(path, findings, separator=b"\n"):
+    path.write_bytes(
+        separator.join(
+            finding.model_dump_json(exclude_unset=True).encode() for finding in findings
+        )
+    )
+
+
+class TestNDJSONReader:
+    def test_random_access(self, detection_finding_factory, tmp_path):
+        findings = [detection_finding_factory(index) for index in range(5)]
+        path = tmp_path / "findings.ndjson"
+        write_ndjson(path, findings)
+
+        with NDJSONReader(path) as reader:
+            assert len(reader) == 5
+            assert isinstance(reader[3], DetectionFinding)
+            assert reader[3] == findings[3]
+            assert reader[-1] == findings[-1]
+            assert list(reader) == findings
+            with pytest.raises(IndexError):
+                reader[5]
+
+    def test_skips_blank_lines(self, detection_finding_factory, tmp_path):
+        findings = [detection_finding_factory(index) for index in range(3)]
+        path = tmp_path / "findings.ndjson"
+        write_ndjson(path, findings, separator=b"\n\n \r\n")
+
+        with NDJSONReader(path) as reader:
+            assert list(reader) == findings
+            assert (
+                reader.raw(1)
+                == findings[1].model_dump_json(exclude_unset=True).encode()
+            )
+
+    def test_find(self, detection_finding_factory, tmp_path):
+        findings = [detection_finding_factory(index) for index in range(5)]
+        path = tmp_path / "findings.ndjson"
+        write_ndjson(path, findings)
+
+        with NDJSONReader(path) as reader:
+            assert reader.row_of("prowler-aws-check-2") == 2
+            assert reader.find("prowler-aws-check-4") == findings[4]
+            assert reader.find("missing") is None
+
+    def test_reuses_the_index(self, detection_finding_factory, tmp_path, monkeypatch):
+        findings = [detection_finding_factory(index) for index in range(5)]
+        path = tmp_path / "findings.ndjson"
+        write_ndjson(path, findings)
+        with NDJSONReader(path) as reader:
+            reader.row_of("prowler-aws-check-0")
+
+        def scan(self):
+            raise AssertionError("The file was scanned again")
+
+        monkeypatch.setattr(NDJSONReader, "_scan", scan)
+        monkeypatch.setattr(NDJSONReader, "_index_uids", scan)
+        with NDJSONReader(path) as reader:
+            assert len(reader) == 5
+            assert reader.find("prowler-aws-check-3") == findings[3]
+
+    def test_rebuilds_a_stale_index(self, detection_finding_factory, tmp_path):
+        findings = [detection_finding_factory(index) for index in range(5)]
+        path = tmp_path / "findings.ndjson"
+        index_path = tmp_path / "findings.idx"
+        write_ndjson(path, findings[:2])
+        with NDJSONReader(path, index_path=index_path) as reader:
+            assert reader.find("prowler-aws-check-1") == findings[1]
+
+        write_ndjson(path, findings)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        with NDJSONReader(path, index_path=index_path) as reader:
+            assert len(reader) == 5
+            assert reader.find("prowler-aws-check-4") == findings[4]
+
+    def test_without_persisting(self, detection_finding_factory, tmp_path):
+        path = tmp_path / "findings.ndjson"
+        write_ndjson(path, [detection_finding_factory(0)])
+
+        with NDJSONReader(path, persist=False) as reader:
+            assert reader.row_of("prowler-aws-check-0") == 0
+
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "findings.ndjson"
+        path.write_bytes(b"")
+
+        with NDJSONReader(path) as reader:
+            assert len(reader) == 0
+            assert list(reader) == []
+            assert reader.find("missing") is None
+
+    def test_failed_index_write(self, detection_finding_factory, tmp_path):
+        path = tmp_path / "findings.ndjson"
+        write_ndjson(path, [detection_finding_factory(0)])
+        index_path = tmp_path / "findings.ndjson.index"
+        index_path.mkdir()
+
+        with NDJSONReader(path) as reader:
+            assert len(reader) == 1
+
+        assert sorted(tmp_path.iterdir()) == [path, index_path]
+        assert list(index_path.iterdir()) == []
+
+    def test_closes_the_file_when_opening_fails(self, tmp_path, monkeypatch):
+        path = tmp_path / "findings.ndjson"
+        path.write_bytes(b"{}\n")
+        files = []
+        close = NDJSONReader.close
+
+        def scan(self):
+            raise RuntimeError("Scan failed")
+
+        def recording_close(self):
+            close(self)
+            files.append(self._file)
+
+        monkeypatch.setattr(NDJSONReader, "_scan", scan)
+        monkeypatch.setattr(NDJSONReader, "close", recording_close)
+        with pytest.raises(RuntimeError, match="Scan failed"):
+            NDJSONReader(path)
+
+        assert [file.closed for file in files] == [True]
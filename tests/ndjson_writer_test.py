@@ -0,0 +1,67 @@
+import io
+import json
+
+import pytest
+
+from py_ocsf_models.io.ndjson_writer import NDJSONWriter, write_ndjson
+
+
+class TestNDJSONWriter:
+    def test_write_many_matches_model_dump_json(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(10)]
+        stream = io.BytesIO()
+
+        with NDJSONWriter(stream, buffer_size=256) as writer:
+            assert writer.write_many(findings) == 10
+            assert writer.count == 10
+            lines = stream.getvalue().splitlines()
+
+        assert len(lines) == 10
+        for line, finding in zip(lines, findings):
+            assert json.loads(line) == json.loads(
+                finding.model_dump_json(exclude_unset=True)
+            )
+
+    def test_buffer_is_flushed_when_full(self, detection_finding_factory):
+        stream = io.BytesIO()
+        writer = NDJSONWriter(stream, buffer_size=1)
+
+        writer.write(detection_finding_factory(0))
+
+        assert stream.getvalue().endswith(b"\n")
+        assert not writer._buffer
+
+    def test_buffer_is_kept_until_flush(self, detection_finding_factory):
+        stream = io.BytesIO()
+        writer = NDJSONWriter(stream)
+
+        writer.write(detection_finding_factory(0))
+        assert stream.getvalue() == b""
+
+        writer.flush()
+        assert stream.getvalue().count(b"\n") == 1
+
+    def test_invalid_buffer_size(self):
+        with pytest.raises(ValueError):
+            NDJSONWriter(io.BytesIO(), buffer_size=0)
+
+    def test_write_ndjson_to_path(self, tmp_path, detection_finding_factory):
+        path = tmp_path / "findings.ocsf.ndjson"
+
+        written = write_ndjson(
+            (detection_finding_factory(index) for index in range(5)), path
+        )
+
+        assert written == 5
+        lines = path.read_bytes().splitlines()
+        assert [json.loads(line)["finding_info"]["uid"] for line in lines] == [
+            f"prowler-aws-check-{index}" for index in range(5)
+        ]
+
+    def test_write_ndjson_to_stream(self, detection_finding_factory):
+        stream = io.BytesIO()
+
+        write_ndjson([detection_finding_factory(0)], stream, exclude_unset=False)
+
+        assert not stream.closed
+        assert json.loads(stream.getvalue())["class_uid"] == 2004
@@ -0,0 +1,108 @@
+import json
+
+import pytest
+
+from py_ocsf_models.validation.ocsf_validator import OCSFValidator, validate_events
+
+
+def errors_by_code(result):
+    return {error["error"]: error for error in result["errors"]}
+
+
+class TestOCSFValidator:
+    def test_valid_event(self, detection_finding_factory):
+        event = detection_finding_factory(1).model_dump_json(exclude_unset=True)
+
+        result = OCSFValidator().validate(event)
+
+        assert result["error_count"] == 0
+        assert result["errors"] == []
+        assert result["warning_count"] == len(result["warnings"])
+
+    def test_validate_many(self, detection_finding_factory):
+        events = [
+            detection_finding_factory(index).model_dump_json(exclude_unset=True)
+            for index in range(3)
+        ]
+
+        results = validate_events(events)
+
+        assert [result["error_count"] for result in results] == [0, 0, 0]
+
+    def test_error_shape(self, detection_finding_factory):
+        event = json.loads(
+            detection_finding_factory(1).model_dump_json(exclude_unset=True)
+        )
+        del event["finding_info"]["uid"]
+
+        result = OCSFValidator().validate(event)
+
+        assert result["error_count"] == 1
+        assert result["errors"] == [
+            {
+                "error": "attribute_required_missing",
+                "message": 'Required attribute "finding_info.uid" is missing.',
+                "attribute_path": "finding_info.uid",
+                "attribute": "uid",
+            }
+        ]
+
+    def test_invalid_attributes(self, detection_finding_factory):
+        event = json.loads(
+            detection_finding_factory(1).model_dump_json(exclude_unset=True)
+        )
+        event["severity_id"] = 42
+        event["time"] = "yesterday"
+        event["resources"][0]["unknown"] = "value"
+        event["type_uid"] = 200402
+
+        errors = errors_by_code(OCSFValidator().validate(event))
+
+        assert errors["attribute_enum_value_unknown"]["attribute_path"] == (
+            "severity_id"
+        )
+        assert errors["attribute_wrong_type"]["attribute_path"] == "time"
+        assert errors["attribute_unknown"]["attribute_path"] == "resources[0].unknown"
+        assert errors["type_uid_incorrect"]["expected_value"] == 200401
+
+    def test_profile_attributes_need_the_profile(self, detection_finding_factory):
+        event = json.loads(
+            detection_finding_factory(1).model_dump_json(exclude_unset=True)
+        )
+        event["metadata"]["profiles"] = []
+
+        errors = errors_by_code(OCSFValidator().validate(event))
+
+        assert errors["attribute_unknown"]["attribute_path"] == "cloud"
+
+    def test_regex_and_constraints(self, detection_finding_factory):
+        event = json.loads(
+            detection_finding_factory(1).model_dump_json(exclude_unset=True)
+        )
+        event["metadata"]["profiles"].append("datetime")
+        event["time_dt"] = "not a date"
+        event["finding_info"]["analytic"] = {"type_id": 1}
+
+        errors = errors_by_code(OCSFValidator().validate(event))
+
+        assert errors["attribute_value_regex_not_matched"]["attribute_path"] == (
+            "time_dt"
+        )
+        assert errors["constraint_failed"]["attribute_path"] == (
+            "finding_info.analytic"
+        )
+
+    def test_unknown_class_uid(self):
+        result = OCSFValidator().validate('{"class_uid": 1001}')
+
+        assert result["error_count"] == 1
+        assert result["errors"][0]["error"] == "class_uid_unknown"
+
+    def test_missing_class_uid(self):
+        result = OCSFValidator().validate({})
+
+        assert result["errors"][0]["error"] == "class_uid_missing"
+
+    def test_unavailable_version(self):
+        with pytest.raises(ValueError):
+            OCSFValidator("0.0.1")
@@ -0,0 +1,49 @@
+import pytest
+from pydantic import ValidationError
+
+from py_ocsf_models.processing.parallel import ParallelSerializer, dump_parallel
+
+
+def serialized(findings):
+    return [
+        finding.model_dump_json(exclude_unset=True).encode() + b"\n"
+        for finding in findings
+    ]
+
+
+class TestParallelSerializer:
+    def test_ordered(self, detection_finding_factory):
+        lines = serialized(detection_finding_factory(index) for index in range(10))
+
+        chunks = list(dump_parallel(lines, workers=2, chunk_size=3))
+
+        assert len(chunks) == 4
+        assert b"".join(chunks) == b"".join(lines)
+
+    def test_unordered_and_dictionaries(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(10)]
+        data = [finding.model_dump(exclude_unset=True) for finding in findings]
+
+        with ParallelSerializer(workers=2, chunk_size=2, ordered=False) as serializer:
+            output = b"".join(serializer.dump(data))
+            assert b"".join(serializer.dump([b"\n", b"  "])) == b""
+
+        assert sorted(output.splitlines(keepends=True)) == sorted(serialized(findings))
+
+    def test_threads(self, detection_finding_factory):
+        lines = serialized(detection_finding_factory(index) for index in range(10))
+
+        output = b"".join(dump_parallel(lines, workers=4, chunk_size=2, threads=True))
+
+        assert output == b"".join(lines)
+
+    def test_invalid_event(self, detection_finding_factory):
+        lines = serialized(detection_finding_factory(index) for index in range(4))
+        lines[2] = b'{"class_uid": 2004}'
+
+        with pytest.raises(ValidationError, match="Field required"):
+            list(dump_parallel(lines, workers=2, chunk_size=1))
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError, match="chunk_size"):
+            ParallelSerializer(chunk_size=0)
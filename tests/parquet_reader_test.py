@@ -0,0 +1,112 @@
+import io
+
+import pytest
+
+from py_ocsf_models.events.findings.compliance_finding import ComplianceFinding
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.io.parquet_reader import ParquetReader, read_parquet
+from py_ocsf_models.io.parquet_writer import write_parquet
+
+
+@pytest.fixture
+def parquet_file(tmp_path, detection_finding_factory):
+    path = tmp_path / "findings.parquet"
+    write_parquet(
+        (detection_finding_factory(index) for index in range(12)),
+        path,
+        DetectionFinding,
+        row_group_size=4,
+    )
+    return path
+
+
+class TestParquetReader:
+    def test_round_trip(self, parquet_file, detection_finding_factory):
+        findings = list(read_parquet(parquet_file, validate=True))
+
+        assert len(findings) == 12
+        assert all(isinstance(finding, DetectionFinding) for finding in findings)
+        original = detection_finding_factory(5)
+        assert findings[5].finding_info == original.finding_info
+        assert findings[5].cloud == original.cloud
+        assert findings[5].severity_id == original.severity_id
+
+    def test_unmapped_is_decoded(self, detection_finding_factory):
+        finding = detection_finding_factory(1)
+        finding.unmapped = {"check": {"id": 1}}
+        stream = io.BytesIO()
+        write_parquet([finding], stream, DetectionFinding)
+        stream.seek(0)
+
+        (read,) = read_parquet(stream)
+
+        assert read.unmapped == {"check": {"id": 1}}
+
+    def test_column_projection(self, parquet_file):
+        reader = ParquetReader(
+            parquet_file, columns=["finding_info.uid", "severity_id", "status_id"]
+        )
+
+        batch = next(iter(reader))
+
+        assert batch.record_batch.schema.names == [
+            "finding_info",
+            "severity_id",
+            "status_id",
+        ]
+        assert batch.column("finding_info.uid").to_pylist()[:2] == [
+            "prowler-aws-check-0",
+            "prowler-aws-check-1",
+        ]
+        finding = batch[1]
+        assert finding.finding_info.uid == "prowler-aws-check-1"
+        assert finding.severity_id == 1
+        assert finding.cloud is None
+
+    def test_list_projection(self, parquet_file):
+        reader = ParquetReader(parquet_file, columns=["resources.uid"])
+
+        finding = next(reader.events())
+
+        assert finding.resources[0].uid == "arn:aws:s3:::bucket-0"
+
+    def test_filters_prune_row_groups(self, parquet_file):
+        reader = ParquetReader(
+            parquet_file,
+            columns=["finding_info.uid"],
+            filters=[
+                ("time", ">=", 1700000006),
+                ("cloud.account.uid", "==", "000000000000"),
+            ],
+        )
+
+        uids = [finding.finding_info.uid for finding in reader.events()]
+
+        assert reader.row_groups == [1, 2]
+        assert uids == ["prowler-aws-check-6", "prowler-aws-check-9"]
+
+    def test_disjunction(self, parquet_file):
+        findings = read_parquet(
+            parquet_file,
+            columns=["severity_id"],
+            filters=[[("time", "==", 1700000000)], [("time", "==", 1700000011)]],
+        )
+
+        assert [finding.severity_id for finding in findings] == [0, 5]
+
+    def test_batches_are_lazy(self, parquet_file):
+        batch = next(iter(ParquetReader(parquet_file, batch_size=3)))
+
+        assert len(batch) == 3
+        assert batch[-1].finding_info.uid == "prowler-aws-check-2"
+        with pytest.raises(IndexError):
+            batch[3]
+
+    def test_unknown_column(self, parquet_file):
+        with pytest.raises(ValueError):
+            ParquetReader(parquet_file, columns=["finding_info.unknown"])
+
+    def test_explicit_class(self, parquet_file):
+        reader = ParquetReader(parquet_file, ComplianceFinding, columns=["time"])
+
+        assert reader.cls is ComplianceFinding
@@ -0,0 +1,94 @@
+import io
+import json
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from py_ocsf_models.events.findings.application_security_posture_finding import (
+    ApplicationSecurityPostureFinding,
+)
+from py_ocsf_models.events.findings.compliance_finding import ComplianceFinding
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.io.arrow_schema import arrow_schema, to_record_batch
+from py_ocsf_models.io.parquet_writer import ParquetWriter, write_parquet
+
+
+class TestArrowSchema:
+    @pytest.mark.parametrize(
+        "cls",
+        [DetectionFinding, ComplianceFinding, ApplicationSecurityPostureFinding],
+    )
+    def test_schema_has_every_field(self, cls):
+        schema = arrow_schema(cls)
+
+        assert schema.names == list(cls.model_fields)
+        assert schema.metadata[b"py_ocsf_models.class"].endswith(cls.__name__.encode())
+
+    def test_nested_types(self):
+        schema = arrow_schema(DetectionFinding)
+
+        assert schema.field("severity_id").type == pa.int32()
+        assert not schema.field("severity_id").nullable
+        assert schema.field("cloud").nullable
+        account = schema.field("cloud").type.field("account")
+        assert account.type.field("uid").type == pa.string()
+        resources = schema.field("resources").type
+        assert pa.types.is_list(resources)
+        assert resources.value_type.field("uid").type == pa.string()
+        assert schema.field("unmapped").metadata == {b"encoding": b"json"}
+
+    def test_record_batch(self, detection_finding_factory):
+        finding = detection_finding_factory(1)
+        finding.unmapped = {"check": {"id": 1}}
+
+        batch = to_record_batch([finding], DetectionFinding)
+
+        batch.validate(full=True)
+        row = batch.to_pylist()[0]
+        assert row["finding_info"]["uid"] == "prowler-aws-check-1"
+        assert row["cloud"]["account"]["uid"] == "000000000001"
+        assert row["resources"][0]["uid"] == "arn:aws:s3:::bucket-1"
+        assert json.loads(row["unmapped"]) == {"check": {"id": 1}}
+
+
+class TestParquetWriter:
+    def test_row_groups_are_written_incrementally(self, detection_finding_factory):
+        stream = io.BytesIO()
+
+        with ParquetWriter(
+            stream, DetectionFinding, row_group_size=4, batch_size=3
+        ) as writer:
+            assert writer.write_many(
+                detection_finding_factory(index) for index in range(10)
+            )
+            assert writer.count == 10
+        parquet_file = pq.ParquetFile(io.BytesIO(stream.getvalue()))
+
+        assert [
+            parquet_file.metadata.row_group(index).num_rows
+            for index in range(parquet_file.num_row_groups)
+        ] == [4, 4, 2]
+        assert parquet_file.read(columns=["finding_info"]).column(0).to_pylist()[9][
+            "uid"
+        ] == ("prowler-aws-check-9")
+
+    def test_write_parquet(self, tmp_path, detection_finding_factory):
+        path = tmp_path / "findings.parquet"
+
+        written = write_parquet(
+            (detection_finding_factory(index) for index in range(5)),
+            path,
+            DetectionFinding,
+        )
+
+        table = pq.read_table(path, columns=["severity_id", "status_id"])
+        assert written == 5
+        assert table.column("severity_id").to_pylist() == [0, 1, 2, 3, 4]
+        assert table.column("status_id").to_pylist() == [1] * 5
+
+    def test_rejects_other_classes(self, detection_finding_factory):
+        writer = ParquetWriter(io.BytesIO(), ComplianceFinding)
+
+        with pytest.raises(TypeError):
+            writer.write(detection_finding_factory(1))
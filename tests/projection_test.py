@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.io.projection import Projection, compile_include
+
+PATHS = [
+    "finding_info.title",
+    "severity_id",
+    "resources[].uid",
+    "resources.region",
+    "cloud.account",
+    "metadata.profiles",
+]
+
+
+class TestCompileInclude:
+    def test_paths(self):
+        assert compile_include(DetectionFinding, PATHS) == {
+            "finding_info": {"title": True},
+            "severity_id": True,
+            "resources": {"__all__": {"uid": True, "region": True}},
+            "cloud": {"account": True},
+            "metadata": {"profiles": True},
+        }
+
+    def test_whole_field_wins(self):
+        assert compile_include(
+            DetectionFinding, ["cloud.region", "cloud", "cloud.account.uid"]
+        ) == {"cloud": True}
+
+    def test_unknown_paths(self):
+        with pytest.raises(ValueError):
+            compile_include(DetectionFinding, ["finding_info.unknown"])
+        with pytest.raises(ValueError):
+            compile_include(DetectionFinding, ["severity_id.name"])
+
+
+class TestProjection:
+    def test_dump(self, detection_finding_factory):
+        finding = detection_finding_factory(1)
+        projection = Projection(DetectionFinding, PATHS)
+
+        dumped = projection.dump(finding)
+
+        assert dumped == {
+            "metadata": {"profiles": ["cloud"]},
+            "severity_id": 1,
+            "finding_info": {"title": "Finding 1"},
+            "resources": [{"region": "eu-west-1", "uid": "arn:aws:s3:::bucket-1"}],
+            "cloud": {
+                "account": {
+                    "name": "Account",
+                    "type_id": 10,
+                    "uid": "000000000001",
+                }
+            },
+        }
+        assert dumped == finding.model_dump(
+            include=projection.include, exclude_unset=True
+        )
+        dumped["metadata"]["profiles"].append("datetime")
+        assert finding.metadata.profiles == ["cloud"]
+
+    @pytest.mark.parametrize("exclude_unset", [True, False])
+    def test_matches_pydantic(self, detection_finding_factory, exclude_unset):
+        finding = detection_finding_factory(2)
+        finding.resources = None
+        projection = Projection(DetectionFinding, PATHS, exclude_unset)
+
+        assert projection.dump(finding) == finding.model_dump(
+            include=projection.include, exclude_unset=exclude_unset
+        )
+        assert projection.dump(finding, mode="json") == finding.model_dump(
+            include=projection.include, exclude_unset=exclude_unset, mode="json"
+        )
+        assert projection.dump_json(finding).decode() == finding.model_dump_json(
+            include=projection.include, exclude_unset=exclude_unset
+        )
+
+    def test_dump_many_json(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(3)]
+        projection = Projection(DetectionFinding, ["finding_info.uid", "time"])
+
+        dumped = json.loads(projection.dump_many_json(iter(findings)))
+
+        assert dumped == [
+            {
+                "finding_info": {"uid": f"prowler-aws-check-{index}"},
+                "time": 1700000000 + index,
+            }
+            for index in range(3)
+        ]
@@ -0,0 +1,108 @@
+import gzip
+import json
+
+import pytest
+import zstandard
+
+from py_ocsf_models.io.rotating_writer import RotatingFileWriter
+
+
+def ndjson(findings):
+    return b"".join(
+        finding.model_dump_json(exclude_unset=True).encode() + b"\n"
+        for finding in findings
+    )
+
+
+def manifest(path):
+    return json.loads(path.with_name(path.name + ".manifest.json").read_text())
+
+
+class TestRotatingFileWriter:
+    def test_rolls_over_by_event_count(self, detection_finding_factory, tmp_path):
+        findings = [detection_finding_factory(index) for index in range(5)]
+
+        with RotatingFileWriter(tmp_path, "scan", max_events=2) as writer:
+            assert writer.write_many(findings) == 5
+
+        assert [path.name for path in writer.files] == [
+            "scan-00000.ndjson.gz",
+            "scan-00001.ndjson.gz",
+            "scan-00002.ndjson.gz",
+        ]
+        content = b"".join(gzip.decompress(path.read_bytes()) for path in writer.files)
+        assert content == ndjson(findings)
+        assert [manifest(path)["events"] for path in writer.files] == [2, 2, 1]
+
+    def test_rolls_over_by_size(self, detection_finding_factory, tmp_path):
+        findings = [detection_finding_factory(index) for index in range(20)]
+
+        with RotatingFileWriter(
+            tmp_path, compression=None, max_bytes=4096, buffer_size=1024
+        ) as writer:
+            writer.write_many(findings)
+
+        assert len(writer.files) > 1
+        assert all(path.suffix == ".ndjson" for path in writer.files)
+        assert all(path.stat().st_size >= 4096 for path in writer.files[:-1])
+        content = b"".join(path.read_bytes() for path in writer.files)
+        assert content == ndjson(findings)
+
+    @pytest.mark.parametrize("compression", ["gzip", "zstd", None])
+    def test_compressed_size_stays_within_max_bytes(
+        self, detection_finding_factory, tmp_path, compression
+    ):
+        findings = [detection_finding_factory(index) for index in range(3000)]
+
+        with RotatingFileWriter(
+            tmp_path, compression=compression, max_bytes=20000, buffer_size=4096
+        ) as writer:
+            writer.write_many(findings)
+
+        assert len(writer.files) > 2
+        assert all(
+            20000 <= path.stat().st_size <= 20000 + 4096 for path in writer.files[:-1]
+        )
+
+    def test_zstd(self, detection_finding_factory, tmp_path):
+        findings = [detection_finding_factory(index) for index in range(3)]
+
+        with RotatingFileWriter(tmp_path, compression="zstd", level=10) as writer:
+            writer.write_many(findings)
+
+        (path,) = writer.files
+        assert path.name == "events-00000.ndjson.zst"
+        reader = zstandard.ZstdDecompressor().stream_reader(path.read_bytes())
+        assert reader.read() == ndjson(findings)
+
+    def test_manifest(self, detection_finding_factory, tmp_path):
+        findings = [detection_finding_factory(index % 2) for index in range(3)]
+
+        with RotatingFileWriter(tmp_path) as writer:
+            writer.write_many(findings)
+
+        (path,) = writer.files
+        assert manifest(path) == {
+            "file": "events-00000.ndjson.gz",
+            "compression": "gzip",
+            "events": 3,
+            "bytes": path.stat().st_size,
+            "uncompressed_bytes": len(ndjson(findings)),
+            "class_uid": {"2004": 3},
+            "severity_id": {
+                str(findings[0].severity_id.value): 2,
+                str(findings[1].severity_id.value): 1,
+            },
+        }
+
+    def test_closed(self, detection_finding_factory, tmp_path):
+        writer = RotatingFileWriter(tmp_path)
+        writer.close()
+
+        assert writer.files == []
+        with pytest.raises(ValueError, match="closed"):
+            writer.write(detection_finding_factory(0))
+
+    def test_invalid_compression(self, tmp_path):
+        with pytest.raises(ValueError, match="Unsupported compression"):
+            RotatingFileWriter(tmp_path, compression="brotli")
@@ -0,0 +1,104 @@
+import pickle
+import subprocess
+import sys
+
+import pytest
+from pydantic import BaseModel
+
+from py_ocsf_models import schema_cache
+
+COLD_START = """
+import sys
+from pathlib import Path
+
+from py_ocsf_models import schema_cache
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+
+schema_cache.enable_schema_cache(sys.argv[1])
+event = Path(sys.argv[2]).read_text()
+finding = DetectionFinding.model_validate_json(event)
+assert finding.model_dump_json(exclude_unset=True) == event
+print(schema_cache.is_loaded_from_cache(DetectionFinding))
+assert DetectionFinding.model_json_schema()["title"] == "DetectionFinding"
+"""
+
+
+def cold_start(cache_directory, event_path):
+    completed = subprocess.run(
+        [sys.executable, "-c", COLD_START, str(cache_directory), str(event_path)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return completed.stdout.strip()
+
+
+class TestSchemaCache:
+    def test_disabled_by_default(self):
+        assert schema_cache.schema_cache_directory() is None
+
+    def test_cold_start_loads_cached_schema(self, tmp_path, detection_finding_factory):
+        event_path = tmp_path / "event.json"
+        event_path.write_text(
+            detection_finding_factory(1).model_dump_json(exclude_unset=True)
+        )
+        cache_directory = tmp_path / "cache"
+
+        assert cold_start(cache_directory, event_path) == "False"
+        assert cold_start(cache_directory, event_path) == "True"
+        assert list(cache_directory.glob("*/*DetectionFinding.pickle"))
+
+    def test_corrupt_entry_is_rebuilt(self, tmp_path, detection_finding_factory):
+        event_path = tmp_path / "event.json"
+        event_path.write_text(
+            detection_finding_factory(1).model_dump_json(exclude_unset=True)
+        )
+        cache_directory = tmp_path / "cache"
+        cold_start(cache_directory, event_path)
+        for entry in cache_directory.glob("*/*.pickle"):
+            entry.write_bytes(b"corrupt")
+
+        assert cold_start(cache_directory, event_path) == "False"
+        assert cold_start(cache_directory, event_path) == "True"
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            b"",
+            pickle.dumps(("schema", {}))[:-3],
+            pickle.dumps("schema"),
+            pickle.dumps(({"type": "unknown"}, {})),
+        ],
+    )
+    def test_unusable_entry_is_ignored(self, tmp_path, payload):
+        class Model(BaseModel):
+            name: str
+
+        schema_cache.enable_schema_cache(tmp_path)
+        try:
+            path = schema_cache._cache_path(Model)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(payload)
+
+            assert not schema_cache.load_cached_schema(Model)
+        finally:
+            schema_cache.disable_schema_cache()
+
+    def test_enable_and_disable(self, tmp_path):
+        schema_cache.enable_schema_cache(tmp_path)
+        try:
+            directory = schema_cache.schema_cache_directory()
+            assert directory is not None
+            assert directory.parent == tmp_path
+        finally:
+            schema_cache.disable_schema_cache()
+
+        assert schema_cache.schema_cache_directory() is None
+
+    def test_first_use_at_module_level(self):
+        code = (
+            "from py_ocsf_models.objects.product import Feature\n"
+            "print(Feature.__pydantic_validator__.validate_python({'name': 'x'}))\n"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)
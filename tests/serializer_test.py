@@ -0,0 +1,33 @@
+import json
+
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.io.serializer import dump_many, list_adapter
+
+
+class TestSerializer:
+    def test_dump_many_matches_model_dump_json(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(5)]
+
+        dumped = json.loads(dump_many(findings, cls=DetectionFinding))
+
+        assert dumped == [
+            json.loads(finding.model_dump_json(exclude_unset=True))
+            for finding in findings
+        ]
+
+    def test_dump_many_include_unset(self, detection_finding_factory):
+        findings = (detection_finding_factory(index) for index in range(2))
+
+        dumped = json.loads(
+            dump_many(findings, cls=DetectionFinding, exclude_unset=False)
+        )
+
+        assert len(dumped) == 2
+        assert dumped[0]["category_name"] == "Findings"
+        assert dumped[0]["vulnerabilities"] is None
+
+    def test_dump_many_empty_batch(self):
+        assert dump_many([], cls=DetectionFinding) == b"[]"
+
+    def test_list_adapter_is_cached(self):
+        assert list_adapter(DetectionFinding) is list_adapter(DetectionFinding)
@@ -0,0 +1,89 @@
+import warnings
+
+import pytest
+
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.events.findings.severity_id import SeverityID
+from py_ocsf_models.objects.account import TypeID
+from py_ocsf_models.objects.cloud import Cloud
+from py_ocsf_models.objects.finding_info import FindingInformation
+from py_ocsf_models.trusted import construct_trusted, set_validation_sample_rate
+
+FINDING_DATA = {
+    "metadata": {
+        "product": {"name": "Prowler", "vendor_name": "Prowler"},
+        "profiles": ["cloud"],
+    },
+    "finding_info": {"title": "Title", "uid": "123"},
+    "severity_id": 4,
+    "activity_id": 1,
+    "type_uid": 200401,
+    "time": 1700000000,
+    "cloud": {
+        "provider": "aws",
+        "region": "eu-west-1",
+        "account": {"name": "Account", "type_id": 10, "uid": "123456789012"},
+    },
+    "resources": [{"uid": "arn:aws:s3:::bucket", "labels": ["a"]}],
+}
+
+
+class TestConstructTrusted:
+    def teardown_method(self):
+        set_validation_sample_rate(0)
+
+    def test_nested_models_are_built(self):
+        finding = construct_trusted(DetectionFinding, FINDING_DATA)
+
+        assert isinstance(finding.finding_info, FindingInformation)
+        assert isinstance(finding.cloud, Cloud)
+        assert finding.cloud.account.type_id is TypeID.AWS_Account
+        assert finding.severity_id is SeverityID.High
+        assert finding.resources[0].uid == "arn:aws:s3:::bucket"
+        assert finding.class_uid == 2004
+
+    def test_serializes_like_validated_model(self):
+        validated = DetectionFinding.model_validate(FINDING_DATA)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            trusted = construct_trusted(DetectionFinding, FINDING_DATA)
+            assert trusted.model_dump_json(
+                exclude_unset=True
+            ) == validated.model_dump_json(exclude_unset=True)
+            assert trusted.model_dump_json() == validated.model_dump_json()
+
+    def test_round_trip_of_model_dump(self, detection_finding_factory):
+        finding = detection_finding_factory(1)
+
+        trusted = construct_trusted(
+            DetectionFinding, finding.model_dump(exclude_unset=True)
+        )
+
+        assert trusted.model_dump_json(exclude_unset=True) == finding.model_dump_json(
+            exclude_unset=True
+        )
+
+    def test_model_instances_are_kept(self, detection_finding_factory):
+        finding = detection_finding_factory(1)
+
+        trusted = construct_trusted(
+            DetectionFinding, {**FINDING_DATA, "cloud": finding.cloud}
+        )
+
+        assert trusted.cloud is finding.cloud
+
+    def test_sampled_validation_accepts_valid_data(self):
+        set_validation_sample_rate(1)
+
+        assert construct_trusted(DetectionFinding, FINDING_DATA).time == 1700000000
+
+    def test_sampled_validation_detects_mismatch(self):
+        set_validation_sample_rate(1)
+
+        with pytest.raises(ValueError):
+            construct_trusted(DetectionFinding, {**FINDING_DATA, "time": "1700000000"})
+
+    def test_invalid_sample_rate(self):
+        with pytest.raises(ValueError):
+            set_validation_sample_rate(2)
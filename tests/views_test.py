@@ -0,0 +1,64 @@
+import pickle
+
+import pytest
+
+from py_ocsf_models import views
+from py_ocsf_models.events.findings.detection_finding import DetectionFinding
+from py_ocsf_models.objects.cloud import Cloud
+from py_ocsf_models.views import DetectionFindingView, ModelView, view_class
+
+
+class TestModelView:
+    def test_generated_from_models(self):
+        assert DetectionFindingView is view_class(DetectionFinding)
+        assert DetectionFindingView._fields == tuple(DetectionFinding.model_fields)
+        assert issubclass(views.CloudView, ModelView)
+        assert views.CloudView._model is Cloud
+        with pytest.raises(AttributeError, match="SeverityIDView"):
+            _ = views.SeverityIDView
+
+    def test_from_json(self, detection_finding_factory):
+        finding = detection_finding_factory(1)
+
+        view = DetectionFindingView.from_json(finding.model_dump_json())
+
+        assert view.finding_info.uid == "prowler-aws-check-1"
+        assert view.cloud.account.uid == "000000000001"
+        assert view.cloud.region == "us-east-1"
+        assert view.resources[0].uid == "arn:aws:s3:::bucket-1"
+        assert view.metadata.profiles == ("cloud",)
+        assert view.severity_id == finding.severity_id
+        assert view.time == 1700000001
+        assert view.count is None
+        assert not hasattr(view, "__dict__")
+        with pytest.raises(AttributeError):
+            view.time = 0
+
+    def test_from_json_array(self, detection_finding_factory):
+        findings = [detection_finding_factory(index) for index in range(3)]
+        data = "[" + ",".join(finding.model_dump_json() for finding in findings) + "]"
+
+        loaded = DetectionFindingView.from_json(data)
+
+        assert [view.finding_info.uid for view in loaded] == [
+            finding.finding_info.uid for finding in findings
+        ]
+
+    def test_to_model(self, detection_finding_factory):
+        finding = detection_finding_factory(2)
+
+        view = DetectionFindingView.from_json(finding.model_dump_json())
+
+        assert view.to_model() == finding
+        assert view.to_model().model_dump_json(exclude_none=True) == (
+            finding.model_dump_json(exclude_none=True)
+        )
+        assert view.to_dict()["metadata"]["profiles"] == ["cloud"]
+        assert "count" not in view.to_dict()
+
+    def test_pickle(self, detection_finding_factory):
+        view = DetectionFindingView.from_json(
+            detection_finding_factory(0).model_dump_json()
+        )
+
+        assert pickle.loads(pickle.dumps(view)) == view